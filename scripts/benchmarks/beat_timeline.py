@@ -0,0 +1,60 @@
+"""
+Measures the cost of building and editing a beat timeline one beat at a
+time, as happens when tapping or pasting beats, of converting between
+times and measures afterwards and of filling the timeline with beats.
+
+Run with `python -m scripts.benchmarks.beat_timeline [beat count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+EDIT_COUNT = 100
+
+
+def main(beat_count: int = 2000):
+    app = setup_app(media_duration=beat_count)
+    beat_tl = app.timelines.create_timeline(TimelineKind.BEAT_TIMELINE)
+
+    print(f"{beat_count} beats")
+
+    with timed("add beats at the end, one at a time (per beat)", beat_count):
+        for i in range(beat_count):
+            beat_tl.create_component(ComponentKind.BEAT, time=i)
+
+    with timed(f"add beats in the middle ({EDIT_COUNT}, per beat)", EDIT_COUNT):
+        for i in range(EDIT_COUNT):
+            beat_tl.create_component(
+                ComponentKind.BEAT, time=beat_count / 2 + (i + 1) / (EDIT_COUNT + 1)
+            )
+
+    with timed(f"drag beat ({EDIT_COUNT} steps, per step)", EDIT_COUNT):
+        beat = beat_tl.components[beat_count // 4]
+        for _ in range(EDIT_COUNT):
+            beat_tl.set_component_data(beat.id, "time", beat.time + 0.5 / EDIT_COUNT)
+
+    with timed(f"delete beats ({EDIT_COUNT}, per beat)", EDIT_COUNT):
+        for _ in range(EDIT_COUNT):
+            beat_tl.delete_components([beat_tl.components[beat_count // 2]])
+
+    with timed("build metric lookup tables"):
+        beat_tl.update_metric_fraction_arrays()
+
+    measures = [beat_tl.measure_numbers[i] for i in range(beat_tl.measure_count)]
+    with timed(f"get time by measure ({len(measures)} measures)"):
+        for measure in measures:
+            beat_tl.get_time_by_measure(measure, 0.5)
+
+    with timed(f"get times by measures ({len(measures)} measures)"):
+        beat_tl.get_times_by_measures(measures)
+
+    beat_tl.clear()
+    with timed(f"fill with {beat_count * 10} beats"):
+        beat_tl.fill_with_beats(beat_tl.FillMethod.BY_AMOUNT, beat_count * 10)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,33 @@
+"""
+Helpers for the benchmark scripts in this folder.
+
+Benchmarks run the logic layer only (no timeline UIs are created),
+so they measure the cost of the timelines themselves.
+"""
+
+import time
+from contextlib import contextmanager
+
+from PySide6.QtWidgets import QApplication
+
+from tilia.boot import setup_logic
+
+_q_application = None
+
+
+def setup_app(media_duration: float = 1000):
+    global _q_application
+    if _q_application is None:
+        _q_application = QApplication.instance() or QApplication([])
+
+    app = setup_logic(autosaver=False)
+    app.set_file_media_duration(media_duration)
+    return app
+
+
+@contextmanager
+def timed(label: str, repeat: int = 1):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    print(f"{label:<50} {elapsed / repeat * 1000:10.3f} ms")
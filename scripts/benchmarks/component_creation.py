@@ -0,0 +1,42 @@
+"""
+Measures the cost of creating components one at a time, as happens when
+adding them by hand or importing them from a file.
+
+Run with `python -m scripts.benchmarks.component_creation [component count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(component_count: int = 5000):
+    app = setup_app(media_duration=component_count)
+    marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+    hierarchy_tl = app.timelines.create_timeline(TimelineKind.HIERARCHY_TIMELINE)
+    hierarchy_tl.clear()  # removes the hierarchy created by default
+    harmony_tl = app.timelines.create_timeline(TimelineKind.HARMONY_TIMELINE)
+
+    print(f"{component_count} components per timeline")
+
+    with timed("create markers (per marker)", component_count):
+        for i in range(component_count):
+            marker_tl.create_component(ComponentKind.MARKER, time=i)
+
+    with timed("create hierarchies (per hierarchy)", component_count):
+        for i in range(component_count):
+            hierarchy_tl.create_component(
+                ComponentKind.HIERARCHY, start=i, end=i + 1, level=1
+            )
+
+    with timed("create harmonies (per harmony)", component_count):
+        for i in range(component_count):
+            harmony_tl.create_component(
+                ComponentKind.HARMONY, time=i, step=0, accidental=0, quality="major"
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
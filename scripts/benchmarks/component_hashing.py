@@ -0,0 +1,52 @@
+"""
+Measures the cost of setting component data in bulk, as happens when
+dragging components or scaling timelines, and of reading the
+components hash afterwards.
+
+Run with `python -m scripts.benchmarks.component_hashing [component count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+DRAG_STEPS = 1000
+
+
+def main(component_count: int = 2000):
+    app = setup_app(media_duration=component_count)
+    marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+    hierarchy_tl = app.timelines.create_timeline(TimelineKind.HIERARCHY_TIMELINE)
+    hierarchy_tl.clear()  # removes the hierarchy created by default
+
+    for i in range(component_count):
+        marker_tl.create_component(ComponentKind.MARKER, time=i)
+        hierarchy_tl.create_component(
+            ComponentKind.HIERARCHY, start=i, end=i + 1, level=1
+        )
+
+    print(f"{component_count} markers and hierarchies")
+
+    marker = marker_tl.components[0]
+    with timed(f"drag marker ({DRAG_STEPS} steps, per step)", DRAG_STEPS):
+        for step in range(DRAG_STEPS):
+            marker_tl.set_component_data(marker.id, "time", step / DRAG_STEPS)
+
+    with timed("scale marker timeline"):
+        marker_tl.scale(0.5)
+
+    with timed("scale hierarchy timeline"):
+        hierarchy_tl.scale(0.5)
+
+    with timed("hash components (after changes)"):
+        marker_tl.component_manager.hash_components()
+        hierarchy_tl.component_manager.hash_components()
+
+    with timed("get timelines state (no changes)"):
+        app.timelines.serialize_timelines()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,38 @@
+"""
+Compares checking if the file was modified from the hashes kept by the
+timelines with checking it from the full app state, on a file with
+several large timelines, after editing a component.
+
+Run with `python -m scripts.benchmarks.file_modified [timeline count]
+[marker count] [repeat]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(timeline_count: int = 10, marker_count: int = 5000, repeat: int = 100):
+    app = setup_app(media_duration=marker_count)
+    for _ in range(timeline_count):
+        marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+        marker_tl.create_components(
+            ComponentKind.MARKER, [{"time": t} for t in range(marker_count)]
+        )
+    app.file_manager.set_timelines(*app.get_timelines_state())
+
+    with timed(f"edit and check from app state {repeat} times", repeat):
+        for i in range(repeat):
+            marker_tl[i].set_data("label", f"edit {i}")
+            assert app.file_manager.is_file_modified(app.get_app_state())
+
+    with timed(f"edit and check from hashes {repeat} times", repeat):
+        for i in range(repeat):
+            marker_tl[i].set_data("label", f"other edit {i}")
+            assert app.is_file_modified()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,56 @@
+"""
+Times importing chord labels from a csv file into a harmony timeline.
+Labels are letter symbols and roman numerals drawn from a common
+vocabulary, with a key change every 100 rows.
+
+Run with `python -m scripts.benchmarks.harmony_import [label count]`.
+"""
+
+import csv
+import itertools
+import sys
+import tempfile
+from pathlib import Path
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.parsers.csv.harmony import import_by_time
+from tilia.timelines.timeline_kinds import TimelineKind
+
+ROOTS = ["C", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B"]
+SUFFIXES = ["", "m", "7", "maj7", "m7", "dim", "m7b5", "/E"]
+ROMAN_NUMERALS = ["I", "ii", "iii", "IV", "V", "V7", "vi", "viio7", "V7/V", "bVI"]
+KEYS = ["C", "a", "G", "e", "F", "d", "Bb", "g"]
+KEY_CHANGE_EVERY = 100
+
+
+def write_labels(path: Path, label_count: int) -> None:
+    vocabulary = itertools.cycle(
+        [root + suffix for root in ROOTS for suffix in SUFFIXES] + ROMAN_NUMERALS
+    )
+    keys = itertools.cycle(KEYS)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["harmony_or_key", "time", "symbol"])
+        for time in range(label_count):
+            if time % KEY_CHANGE_EVERY == 0:
+                writer.writerow(["key", time, next(keys)])
+            writer.writerow(["harmony", time, next(vocabulary)])
+
+
+def main(label_count: int = 10000):
+    app = setup_app(media_duration=label_count)
+    harmony_tl = app.timelines.create_timeline(TimelineKind.HARMONY_TIMELINE)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "labels.csv")
+        write_labels(path, label_count)
+
+        with timed(f"import {label_count} labels"):
+            success, errors = import_by_time(harmony_tl, path)
+
+    assert success and not errors, errors
+    print(f"{len(harmony_tl)} components created")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,51 @@
+"""
+Times creating and deleting modes on a harmony timeline with many harmonies,
+and looking up the key of every harmony, as done when updating harmony labels.
+
+Run with `python -m scripts.benchmarks.harmony_modes [harmony count] [mode count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(harmony_count: int = 5000, mode_count: int = 200):
+    app = setup_app(media_duration=harmony_count)
+    harmony_tl = app.timelines.create_timeline(TimelineKind.HARMONY_TIMELINE)
+    harmony_tl.create_components(
+        ComponentKind.HARMONY,
+        [
+            {"time": t, "step": t % 7, "accidental": 0, "quality": "major"}
+            for t in range(harmony_count)
+        ],
+    )
+    # modes are created from last to first, so each mode's harmonic
+    # region ends at the previously created one
+    mode_times = [
+        t * harmony_count / mode_count + 0.5 for t in reversed(range(mode_count))
+    ]
+
+    with timed(f"create {mode_count} modes", mode_count):
+        modes = [
+            harmony_tl.create_component(
+                ComponentKind.MODE, time, step=i % 7, accidental=0, type="major"
+            )[0]
+            for i, time in enumerate(mode_times)
+        ]
+
+    with timed(f"get key of {harmony_count} harmonies", harmony_count):
+        for harmony in harmony_tl.component_manager.get_components_by_condition(
+            lambda _: True, ComponentKind.HARMONY
+        ):
+            harmony_tl.get_key_by_time(harmony.get_data("time"))
+
+    with timed(f"delete {mode_count} modes", mode_count):
+        for mode in reversed(modes):
+            harmony_tl.delete_components([mode])
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,80 @@
+"""
+Compares the sweep-line implementation of
+`HierarchyTLComponentManager.get_boundary_conflicts` with the pairwise
+implementation it replaced, on a synthetic three-level hierarchy with
+a few conflicting units.
+
+Run with `python -m scripts.benchmarks.hierarchy_conflicts [unit count]`.
+"""
+
+import itertools
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+CONFLICT_EVERY = 100
+
+
+def get_boundary_conflicts_pairwise(cm):
+    """The previous, O(n²), implementation."""
+    conflicts = []
+
+    for hrc1, hrc2 in itertools.combinations(cm._components, 2):
+        if hrc1.start < hrc2.start < hrc1.end or hrc1.start < hrc2.end < hrc1.end:
+            if hrc2.level >= hrc1.level:
+                conflicts.append((hrc1, hrc2))
+            elif not hrc1.start > hrc2.start and hrc1.end < hrc2.end:
+                conflicts.append((hrc1, hrc2))
+
+        if hrc2.start < hrc1.start < hrc2.end or hrc2.start < hrc1.end < hrc2.end:
+            if hrc1.level >= hrc2.level:
+                conflicts.append((hrc2, hrc1))
+            elif not hrc2.start > hrc1.start and hrc2.end < hrc1.end:
+                conflicts.append((hrc2, hrc1))
+
+        if (
+            hrc1.start == hrc2.start
+            and hrc1.end == hrc2.end
+            and hrc1.level == hrc2.level
+        ):
+            conflicts.append((hrc1, hrc2))
+
+    return conflicts
+
+
+def get_rows(unit_count: int) -> list[dict]:
+    # units at level 1, grouped in fours at level 2 and in sixteens at level 3
+    rows = [{"start": i, "end": i + 1, "level": 1} for i in range(unit_count)]
+    rows += [{"start": i, "end": i + 4, "level": 2} for i in range(0, unit_count, 4)]
+    rows += [{"start": i, "end": i + 16, "level": 3} for i in range(0, unit_count, 16)]
+    # units crossing boundaries of their neighbours
+    rows += [
+        {"start": i + 0.5, "end": i + 1.5, "level": 1}
+        for i in range(0, unit_count, CONFLICT_EVERY)
+    ]
+    return rows
+
+
+def main(unit_count: int = 2000):
+    app = setup_app(media_duration=unit_count + 16)
+    hierarchy_tl = app.timelines.create_timeline(TimelineKind.HIERARCHY_TIMELINE)
+    hierarchy_tl.clear()  # removes the hierarchy created by default
+    hierarchy_tl.create_components(ComponentKind.HIERARCHY, get_rows(unit_count))
+    cm = hierarchy_tl.component_manager
+
+    print(f"{len(hierarchy_tl)} hierarchies")
+
+    with timed("get boundary conflicts (pairwise)"):
+        pairwise_conflicts = get_boundary_conflicts_pairwise(cm)
+
+    with timed("get boundary conflicts (sweep)"):
+        sweep_conflicts = cm.get_boundary_conflicts()
+
+    assert sweep_conflicts == pairwise_conflicts
+    print(f"{len(sweep_conflicts)} conflicts found by both")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,44 @@
+"""
+Measures the cost of resolving metric positions of timeline components,
+as happens when exporting a timeline, one time at a time and in bulk.
+
+Run with `python -m scripts.benchmarks.metric_positions
+[component count] [beat count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(component_count: int = 50000, beat_count: int = 2000):
+    app = setup_app(media_duration=beat_count)
+    beat_tl = app.timelines.create_timeline(TimelineKind.BEAT_TIMELINE)
+    beat_tl.create_components(
+        ComponentKind.BEAT, [{"time": i} for i in range(beat_count)]
+    )
+    marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+    marker_tl.create_components(
+        ComponentKind.MARKER,
+        [{"time": i * beat_count / component_count} for i in range(component_count)],
+    )
+    times = [marker.time for marker in marker_tl]
+
+    print(f"{component_count} markers, {beat_count} beats")
+
+    with timed("get metric positions, one at a time"):
+        single = [app.timelines.get_metric_position(t) for t in times]
+
+    with timed("get metric positions, in bulk"):
+        bulk = app.timelines.get_metric_positions(times)
+
+    assert single == bulk
+
+    with timed("export marker timeline"):
+        marker_tl.get_export_data()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
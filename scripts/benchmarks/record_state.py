@@ -0,0 +1,53 @@
+"""
+Times recording app states while editing, on a file with a large timeline:
+repeated edits of an attribute (as when typing in the inspector), which
+replace each other in the undo stack, and separate edits (as after drags).
+
+Run with `python -m scripts.benchmarks.record_state [marker count] [edit count]`.
+"""
+
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.requests import Post, post
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(marker_count: int = 20000, edit_count: int = 100):
+    app = setup_app(media_duration=marker_count)
+    marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+    marker_tl.create_components(
+        ComponentKind.MARKER, [{"time": t} for t in range(marker_count)]
+    )
+    app.reset_undo_manager()
+    marker = marker_tl[0]
+
+    with timed(f"edit and record with same identifier {edit_count} times", edit_count):
+        for i in range(edit_count):
+            marker.set_data("label", "x" * i)
+            post(
+                Post.APP_STATE_RECORD,
+                "attribute edit via inspect",
+                no_repeat=True,
+                repeat_identifier=f"label_{marker.id}",
+            )
+
+    with timed("store pending changes"):
+        QApplication.processEvents()
+
+    with timed(f"edit and record {edit_count} times", edit_count):
+        for i in range(edit_count):
+            marker_tl[i].set_data("label", f"edit {i}")
+            post(Post.APP_STATE_RECORD, "marker drag")
+
+    with timed("store pending changes"):
+        QApplication.processEvents()
+
+    assert len(app.undo_manager.stack) == edit_count + 2
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,51 @@
+"""
+Measures the cost of scaling and cropping timelines, as happens when
+media with a different length is loaded.
+
+Run with `python -m scripts.benchmarks.scale_crop [component count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(component_count: int = 10000):
+    app = setup_app(media_duration=component_count)
+    beat_tl = app.timelines.create_timeline(TimelineKind.BEAT_TIMELINE)
+    beat_tl.create_components(
+        ComponentKind.BEAT, [{"time": i} for i in range(component_count)]
+    )
+    marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+    marker_tl.create_components(
+        ComponentKind.MARKER, [{"time": i} for i in range(component_count)]
+    )
+    score_tl = app.timelines.create_timeline(TimelineKind.SCORE_TIMELINE)
+    score_tl.create_components(
+        ComponentKind.NOTE,
+        [
+            {
+                "start": i,
+                "end": i + 1,
+                "step": 0,
+                "accidental": 0,
+                "octave": 4,
+                "staff_index": 0,
+            }
+            for i in range(component_count - 1)
+        ],
+    )
+
+    print(f"{component_count} beats, markers and notes")
+
+    with timed("scale timelines by 2"):
+        app.timelines.scale_timeline_components(2)
+
+    with timed("crop timelines to half"):
+        app.timelines.crop_timeline_components(component_count)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,39 @@
+"""
+Times getting the app state on a file with several large timelines,
+editing a component of a single timeline between requests.
+
+Run with `python -m scripts.benchmarks.serialize_timelines [timeline count]
+[marker count] [edit count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.requests import Get, get
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(timeline_count: int = 10, marker_count: int = 5000, edit_count: int = 100):
+    app = setup_app(media_duration=marker_count)
+    for _ in range(timeline_count):
+        marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+        marker_tl.create_components(
+            ComponentKind.MARKER, [{"time": t} for t in range(marker_count)]
+        )
+
+    with timed("get app state (first time)"):
+        get(Get.APP_STATE)
+
+    with timed(f"edit one marker and get app state {edit_count} times", edit_count):
+        for i in range(edit_count):
+            marker_tl[i].set_data("label", f"edit {i}")
+            get(Get.APP_STATE)
+
+    with timed(f"get unchanged app state {edit_count} times", edit_count):
+        for _ in range(edit_count):
+            get(Get.APP_STATE)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
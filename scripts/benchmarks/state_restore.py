@@ -0,0 +1,40 @@
+"""
+Measures the cost of restoring timelines to a previous state, as happens
+when undoing. Deleted components are created again with their original
+ids.
+
+Run with `python -m scripts.benchmarks.state_restore [component count]`.
+"""
+
+import sys
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(component_count: int = 5000):
+    app = setup_app(media_duration=component_count)
+    marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+    marker_tl.create_components(
+        ComponentKind.MARKER, [{"time": i} for i in range(component_count)]
+    )
+    hierarchy_tl = app.timelines.create_timeline(TimelineKind.HIERARCHY_TIMELINE)
+    hierarchy_tl.clear()  # removes the hierarchy created by default
+    hierarchy_tl.create_components(
+        ComponentKind.HIERARCHY,
+        [{"start": i, "end": i + 1, "level": 1} for i in range(component_count)],
+    )
+    state, _ = app.timelines.serialize_timelines()
+    hierarchy_tl.clear()
+
+    print(f"{component_count} markers and hierarchies")
+
+    with timed("restore deleted hierarchies"):
+        app.timelines.restore_state(state)
+
+    assert len(hierarchy_tl) == component_count
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,48 @@
+"""
+Times recording app states on a file with many components, editing one
+component at a time, and measures the memory held by the undo stack.
+
+Run with `python -m scripts.benchmarks.undo_stack [marker count] [edit count]`.
+"""
+
+import sys
+import tracemalloc
+
+from scripts.benchmarks.common import setup_app, timed
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def main(marker_count: int = 10000, edit_count: int = 200):
+    app = setup_app(media_duration=marker_count)
+    marker_tl = app.timelines.create_timeline(TimelineKind.MARKER_TIMELINE)
+    markers = [
+        component
+        for component, _ in marker_tl.create_components(
+            ComponentKind.MARKER, [{"time": t} for t in range(marker_count)]
+        )
+    ]
+    app.reset_undo_manager()
+
+    tracemalloc.start()
+    with timed(f"edit and record {edit_count} times", edit_count):
+        for i in range(edit_count):
+            markers[i].set_data("label", f"edit {i}")
+            app.on_record_state("edit")
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"memory held after recording: {memory / 2**20:.1f} MiB")
+    memory_use, disk_use = app.undo_manager.get_memory_use()
+    print(
+        f"undo history: {memory_use / 2**10:.1f} KiB, {disk_use / 2**10:.1f} KiB on disk"
+    )
+
+    with timed(f"undo {edit_count} times", edit_count):
+        for _ in range(edit_count):
+            app.undo_manager.undo()
+
+    assert all(marker.get_data("label") == "" for marker in marker_tl)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
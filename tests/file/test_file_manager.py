@@ -108,6 +108,30 @@ class TestFileManager:
         commands.execute("timeline.marker.add")
         assert tilia.file_manager.is_file_modified(get(Get.APP_STATE))
 
+    def test_is_file_modified_after_setting_component_data(
+        self, tilia, marker_tl, tmp_path
+    ):
+        marker, _ = marker_tl.create_marker(0)
+        with Serve(Get.FROM_USER_SAVE_PATH_TILIA, (True, tmp_path / "temp.tla")):
+            commands.execute("file.save")
+
+        marker_tl.set_component_data(marker.id, "time", 1)
+        assert tilia.is_file_modified()
+
+        marker_tl.set_component_data(marker.id, "time", 0)
+        assert not tilia.is_file_modified()
+
+    def test_is_file_modified_after_setting_timeline_data(
+        self, tilia, marker_tl, tmp_path
+    ):
+        with Serve(Get.FROM_USER_SAVE_PATH_TILIA, (True, tmp_path / "temp.tla")):
+            commands.execute("file.save")
+
+        marker_tl.set_data("name", "new name")
+
+        assert tilia.is_file_modified()
+        assert tilia.file_manager.is_file_modified(get(Get.APP_STATE))
+
     def test_is_file_modified_modified_tile(self, tilia):
         params = get_empty_save_params()
         params["media_metadata"]["title"] = "modified title"
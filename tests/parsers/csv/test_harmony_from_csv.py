@@ -6,6 +6,7 @@ import pytest
 import tilia.parsers.csv.harmony
 from tests.parsers.csv.common import assert_in_errors
 from tilia.timelines.beat.timeline import BeatTimeline
+from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.harmony.components import Harmony, Mode
 from tilia.timelines.harmony.timeline import HarmonyTimeline
 
@@ -96,6 +97,18 @@ class TestByTime:
         assert len(harmony_tl) == 2
         assert_in_errors("nonsense", errors)
 
+    @pytest.mark.parametrize(
+        "rows", [["0,key,d", "10,harmony,ii"], ["10,harmony,ii", "0,key,d"]]
+    )
+    def test_harmonies_use_keys_from_any_row(self, rows, harmony_tl):
+        data = "\n".join(["time,harmony_or_key,symbol"] + rows)
+
+        success, errors = call_patched_import_by_time_func(harmony_tl, data)
+
+        assert not errors
+        harmony = harmony_tl.get_component_by_attr("KIND", ComponentKind.HARMONY)
+        assert harmony.get_data("step") == 2
+
     def test_returns_reason_for_invalid_component(self, harmony_tl):
         data = "\n".join(["time,harmony_or_key,symbol", "0,harmony,C", "0,harmony,D"])
         success, errors = call_patched_import_by_time_func(harmony_tl, data)
@@ -2,11 +2,13 @@ import os
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
+from tests.mock import PatchPost
 from tests.parsers.csv.common import assert_in_errors
 from tilia.parsers.csv.hierarchy import (
     import_by_measure,
     import_by_time,
 )
+from tilia.requests import Post
 
 
 def test_hierarchies_by_time_from_csv(hierarchy_tlui):
@@ -38,6 +40,22 @@ def test_hierarchies_by_time_from_csv(hierarchy_tlui):
     assert hierarchies[2].label == "third"
 
 
+def test_hierarchies_by_time_from_csv_are_created_at_once(hierarchy_tlui):
+    data = "start,end,level\n0,1,1\n1,2,1\n2,3,1"
+
+    with (
+        patch("builtins.open", mock_open(read_data=data)),
+        PatchPost(
+            "tilia.timelines.base.timeline", Post.TIMELINE_COMPONENT_CREATED
+        ) as post_mock,
+    ):
+        import_by_time(hierarchy_tlui.timeline, Path())
+
+    post_mock.assert_not_called()
+    assert len(hierarchy_tlui.timeline) == 3
+    assert len(hierarchy_tlui.elements) == len(hierarchy_tlui.timeline)
+
+
 def test_hierarchies_by_measure_from_csv(beat_tlui, hierarchy_tlui):
     beat_tl = beat_tlui.timeline
     hierarchy_tl = hierarchy_tlui.timeline
@@ -6,6 +6,7 @@ from unittest.mock import mock_open, patch
 from PySide6.QtWidgets import QFileDialog
 
 from tests.utils import undoable
+from tilia.parsers.csv.marker import import_by_time
 from tilia.requests import Post, post
 from tilia.ui import commands
 from tilia.ui.format import format_media_time
@@ -174,3 +175,20 @@ def test_component_creation_fail_reason_gets_into_errors(
     patch_import("time", marker_tl, data)
 
     tilia_errors.assert_in_error_message(format_media_time(101))
+
+
+def test_markers_by_time_from_csv_errors_are_in_row_order(
+    marker_tl, tilia_state, tmp_path
+):
+    tilia_state.duration = 100
+    path = tmp_path / "markers.csv"
+    path.write_text("time\n101\nnonsense\n102\n1")
+
+    success, errors = import_by_time(marker_tl, path)
+
+    assert success
+    assert len(errors) == 3
+    assert format_media_time(101) in errors[0]
+    assert "nonsense" in errors[1]
+    assert format_media_time(102) in errors[2]
+    assert len(marker_tl) == 1
@@ -62,6 +62,7 @@ class TestSaveFileOnClose:
         tmp_file = tmp_path / "test_file_modified_and_user_chooses_to_save_changes.tla"
         with (
             Serve(Get.APP_STATE, self._get_modified_file_state()),
+            Serve(Get.IS_FILE_MODIFIED, True),
             Serve(Get.FROM_USER_SHOULD_SAVE_CHANGES, (True, True)),
             Serve(Get.FROM_USER_SAVE_PATH_TILIA, (True, tmp_file)),
             PatchPost("tilia.app", Post.UI_EXIT) as exit_mock,
@@ -95,6 +96,7 @@ class TestSaveFileOnClose:
     ):
         with (
             Serve(Get.APP_STATE, self._get_modified_file_state()),
+            Serve(Get.IS_FILE_MODIFIED, True),
             Serve(Get.FROM_USER_SHOULD_SAVE_CHANGES, (False, True)),
             patch("tilia.file.file_manager.FileManager.save") as save_mock,
             PatchPost("tilia.app", Post.UI_EXIT) as exit_mock,
@@ -107,6 +109,7 @@ class TestSaveFileOnClose:
     def test_file_is_modified_and_user_cancels_file_save_dialog(self):
         with (
             Serve(Get.APP_STATE, self._get_modified_file_state()),
+            Serve(Get.IS_FILE_MODIFIED, True),
             Serve(Get.FROM_USER_SHOULD_SAVE_CHANGES, (True, True)),
             Serve(Get.FROM_USER_SAVE_PATH_TILIA, (False, "")),
             patch("tilia.file.file_manager.FileManager.save") as save_mock,
@@ -416,6 +419,18 @@ class TestOpen:
         commands.execute("file.open", file_path)
         assert not tilia.file_manager.is_file_modified(tilia.file_manager.file.__dict__)
 
+    def test_file_not_modified_after_open_with_outdated_hashes(self, tilia, tmp_path):
+        file_data = tests.utils.get_blank_file_data()
+        tl_data = tests.utils.get_dummy_timeline_data()
+        tl_data["1"]["components_hash"] = "outdated"
+        file_data["timelines"] = tl_data
+        file_path = tmp_path / "test.tla"
+        file_path.write_text(json.dumps(file_data))
+
+        tilia.on_clear()
+        commands.execute("file.open", file_path)
+        assert not tilia.is_file_modified()
+
     def test_open_file_with_custom_metadata_fields(self, tilia, tmp_path):
         file_data = """{
   "file_path": "C:/Programa\u00e7\u00e3o/TiLiA/tests/test_metadata_custom_fields.tla",
@@ -746,3 +761,26 @@ class TestIDs:
             marker_tl.create_component(ComponentKind.MARKER, time=1, id=id)
         error.assert_called()
         assert marker_tl.components[0].id == "1"
+
+    def test_create_components_with_and_without_ids(self, marker_tl):
+        marker_tl.create_component(ComponentKind.MARKER, time=0)  # id=1
+        marker_tl.create_components(
+            ComponentKind.MARKER,
+            [{"time": 1}, {"time": 2, "id": 1}, {"time": 3, "id": 5}, {"time": 4}],
+        )
+
+        assert [c.id for c in marker_tl.components] == ["1", "6", "2", "5", "7"]
+
+    def test_id_is_reused_after_component_is_deleted(self, marker_tl):
+        marker, _ = marker_tl.create_component(ComponentKind.MARKER, time=0, id=3)
+        marker_tl.delete_components([marker])
+
+        marker, _ = marker_tl.create_component(ComponentKind.MARKER, time=0, id=3)
+
+        assert marker.id == "3"
+
+    def test_id_block(self, marker_tl):
+        marker_tl.create_component(ComponentKind.MARKER, time=0, id=10)
+
+        assert get(Get.ID_BLOCK, 3) == ["11", "12", "13"]
+        assert get(Get.ID) == "14"
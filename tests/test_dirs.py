@@ -55,3 +55,9 @@ def test_create_autosaves_dir(test_dir):
     dirs.create_autosaves_dir(test_dir)
 
     assert os.path.exists(Path(test_dir, "autosaves"))
+
+
+def test_create_undo_dir(test_dir):
+    dirs.create_undo_dir(test_dir)
+
+    assert os.path.exists(Path(test_dir, "undo"))
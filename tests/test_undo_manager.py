@@ -0,0 +1,313 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from tests.mock import PatchPost
+from tilia.requests import Get, Post, get
+from tilia.settings import settings
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.undo_manager import UndoManager, get_state_delta
+
+
+def get_timeline_state(components: dict[str, str], name="tl") -> dict:
+    """Returns a timeline state with `components` (by id and hash)."""
+    return {
+        "name": name,
+        "components": {
+            id: {"time": hash, "kind": "MARKER", "hash": hash}
+            for id, hash in components.items()
+        },
+        "components_hash": "".join(sorted(components.values())),
+        "hash": name,
+    }
+
+
+def get_state(components: dict[str, str], name="tl", **timelines) -> dict:
+    """Returns an app state with timeline "0" and the given other timelines."""
+    timelines["0"] = get_timeline_state(components, name)
+    return {"timelines": timelines, "media_path": ""}
+
+
+@pytest.fixture
+def undo_manager():
+    undo_manager = UndoManager()
+    yield undo_manager
+    undo_manager.clear()
+
+
+@pytest.fixture
+def restore_mock():
+    with PatchPost("tilia.undo_manager", Post.APP_STATE_RESTORE) as mock:
+        yield mock
+
+
+def get_restored_state(restore_mock):
+    return restore_mock.call_args[0][1]
+
+
+class TestUndoManager:
+    STATES = [
+        get_state({"1": "a", "2": "b"}),
+        get_state({"1": "a", "2": "c", "3": "d"}),
+        get_state({"2": "c", "3": "d"}, name="renamed"),
+        get_state(
+            {"2": "c", "3": "d"}, name="renamed", **{"4": get_timeline_state({})}
+        ),
+    ]
+
+    def test_undo_and_redo(self, undo_manager, restore_mock):
+        for state in self.STATES:
+            undo_manager.record(state, "action")
+
+        for state in reversed(self.STATES[:-1]):
+            undo_manager.undo()
+            assert get_restored_state(restore_mock) == state
+
+        for state in self.STATES[1:]:
+            undo_manager.redo()
+            assert get_restored_state(restore_mock) == state
+
+    def test_record_after_undo(self, undo_manager, restore_mock):
+        for state in self.STATES:
+            undo_manager.record(state, "action")
+        undo_manager.undo()
+        undo_manager.undo()
+        undo_manager.record(self.STATES[0], "action")
+
+        undo_manager.undo()
+
+        assert get_restored_state(restore_mock) == self.STATES[1]
+        assert len(undo_manager.stack) == 3
+
+    def test_only_changes_are_stored(self, undo_manager):
+        for state in self.STATES[:2]:
+            undo_manager.record(state, "action")
+
+        delta = undo_manager.get_delta(undo_manager.stack[-1])
+        assert delta["attrs"] is None
+        assert set(delta["timelines"]["0"]["components"]) == {"2", "3"}
+
+    def test_created_timeline_is_stored(self, undo_manager):
+        for state in self.STATES:
+            undo_manager.record(state, "action")
+
+        delta = undo_manager.get_delta(undo_manager.stack[-1])
+        assert list(delta["timelines"]) == ["4"]
+        assert delta["timelines"]["4"]["attrs"][0] is None
+
+    def test_unchanged_timelines_are_not_stored(self, undo_manager):
+        undo_manager.record(self.STATES[0], "action")
+        undo_manager.record(self.STATES[0] | {"media_path": "other"}, "action")
+
+        assert undo_manager.get_delta(undo_manager.stack[-1])["timelines"] == {}
+
+    def test_unchanged_timeline_attributes_are_not_stored(
+        self, undo_manager, restore_mock, score_tl
+    ):
+        score_tl.svg_data = "<svg></svg>" * 1000
+        score_tl.create_component(ComponentKind.STAFF, 0, 5)
+        states = [get(Get.APP_STATE)]
+        score_tl.create_component(ComponentKind.STAFF, 1, 5)
+        states.append(get(Get.APP_STATE))
+        for state in states:
+            undo_manager.record(state, "action")
+
+        timeline_delta = undo_manager.get_delta(undo_manager.stack[-1])["timelines"][
+            str(score_tl.id)
+        ]
+        assert "svg_data" not in json.dumps(timeline_delta)
+
+        undo_manager.undo()
+        assert get_restored_state(restore_mock) == states[0]
+
+    def test_component_recreated_with_other_id(self, undo_manager, restore_mock):
+        undo_manager.record(get_state({"1": "a"}), "action")
+        undo_manager.record(get_state({"2": "a"}), "action")
+
+        undo_manager.undo()
+
+        assert get_restored_state(restore_mock) == get_state({"1": "a"})
+
+    def test_record_with_no_repeat(self, undo_manager, restore_mock):
+        undo_manager.record(self.STATES[0], "action")
+        undo_manager.record(self.STATES[1], "action", True, "id")
+        undo_manager.record(self.STATES[2], "action", True, "id")
+
+        undo_manager.undo()
+
+        assert len(undo_manager.stack) == 2
+        assert get_restored_state(restore_mock) == self.STATES[0]
+
+    def test_malformed_state_is_restored_as_recorded(self, undo_manager, restore_mock):
+        undo_manager.record(self.STATES[0], "action")
+        undo_manager.record({}, "action")
+        undo_manager.record(self.STATES[1], "action")
+
+        undo_manager.undo()
+        assert get_restored_state(restore_mock) == {}
+
+        undo_manager.undo()
+        assert get_restored_state(restore_mock) == self.STATES[0]
+
+    def test_recorded_states_are_not_modified(self, undo_manager, restore_mock):
+        states = [get_state({"1": "a"}), get_state({"1": "b"})]
+        for state in states:
+            undo_manager.record(state, "action")
+
+        undo_manager.undo()
+        undo_manager.redo()
+
+        assert states == [get_state({"1": "a"}), get_state({"1": "b"})]
+
+
+class TestDeferredRecord:
+    @pytest.fixture
+    def get_state_delta_mock(self):
+        with patch("tilia.undo_manager.get_state_delta", wraps=get_state_delta) as mock:
+            yield mock
+
+    def test_changes_are_stored_when_event_loop_is_idle(
+        self, undo_manager, get_state_delta_mock
+    ):
+        states = [get_state({"1": "a"}), get_state({"1": "b"})]
+        for state in states:
+            undo_manager.record(state, "action")
+        get_state_delta_mock.assert_not_called()
+
+        QApplication.processEvents()
+
+        get_state_delta_mock.assert_any_call(*states)
+
+    def test_changes_are_stored_when_stack_is_needed(
+        self, undo_manager, get_state_delta_mock
+    ):
+        undo_manager.record(get_state({"1": "a"}), "action")
+        undo_manager.record(get_state({"1": "b"}), "action")
+
+        assert len(undo_manager.stack) == 2
+        get_state_delta_mock.assert_called_once()
+
+    def test_records_with_same_repeat_identifier_are_merged(
+        self, undo_manager, restore_mock, get_state_delta_mock
+    ):
+        undo_manager.record(get_state({"1": "a"}), "action")
+        for hash in ["b", "c", "d"]:
+            undo_manager.record(get_state({"1": hash}), "action", True, "id")
+
+        undo_manager.undo()
+
+        get_state_delta_mock.assert_called_once()
+        assert len(undo_manager.stack) == 2
+        assert get_restored_state(restore_mock) == get_state({"1": "a"})
+
+        undo_manager.redo()
+        assert get_restored_state(restore_mock) == get_state({"1": "d"})
+
+    def test_records_with_other_repeat_identifier_are_not_merged(
+        self, undo_manager, restore_mock
+    ):
+        undo_manager.record(get_state({"1": "a"}), "action")
+        undo_manager.record(get_state({"1": "b"}), "action", True, "id")
+        undo_manager.record(get_state({"1": "c"}), "action", True, "other id")
+
+        undo_manager.undo()
+
+        assert get_restored_state(restore_mock) == get_state({"1": "b"})
+
+    def test_pending_record_is_discarded_on_clear(self, undo_manager):
+        undo_manager.record(get_state({"1": "a"}), "action")
+        undo_manager.record(get_state({"1": "b"}), "action")
+
+        undo_manager.clear()
+        QApplication.processEvents()
+
+        assert undo_manager.stack == []
+
+
+class TestMemoryBudget:
+    @pytest.fixture
+    def memory_budget(self, use_test_settings):
+        def set_budget(value: int):
+            settings.set("undo", "memory_budget_(MB)", value)
+
+        yield set_budget
+        set_budget(settings.DEFAULT_SETTINGS["undo"]["memory_budget_(MB)"])
+
+    @staticmethod
+    def get_states(count: int) -> list[dict]:
+        return [
+            get_state({str(j): f"{i}-{j}" for j in range(i % 5, 20)})
+            for i in range(count)
+        ]
+
+    def test_changes_are_kept_compressed_in_memory(self, undo_manager):
+        for state in self.get_states(5):
+            undo_manager.record(state, "action")
+
+        entries = undo_manager.stack[1:]
+        assert all("data" in entry for entry in entries)
+        assert undo_manager.get_memory_use() == (
+            sum(len(entry["data"]) for entry in entries),
+            0,
+        )
+
+    def test_oldest_changes_are_moved_to_disk(self, undo_manager, memory_budget):
+        memory_budget(0)
+        for state in self.get_states(5):
+            undo_manager.record(state, "action")
+
+        # the most recent changes are always kept in memory
+        assert [("data" in entry) for entry in undo_manager.stack[1:]] == [
+            False,
+            False,
+            False,
+            True,
+        ]
+        memory_use, disk_use = undo_manager.get_memory_use()
+        assert memory_use == len(undo_manager.stack[-1]["data"])
+        assert disk_use > 0
+
+    def test_undo_and_redo_with_changes_on_disk(
+        self, undo_manager, restore_mock, memory_budget
+    ):
+        memory_budget(0)
+        states = self.get_states(10)
+        for state in states:
+            undo_manager.record(state, "action")
+
+        for state in reversed(states[:-1]):
+            undo_manager.undo()
+            assert get_restored_state(restore_mock) == state
+
+        for state in states[1:]:
+            undo_manager.redo()
+            assert get_restored_state(restore_mock) == state
+
+    def test_discarding_undone_changes_frees_memory(
+        self, undo_manager, restore_mock, memory_budget
+    ):
+        memory_budget(0)
+        states = self.get_states(5)
+        for state in states:
+            undo_manager.record(state, "action")
+        undo_manager.undo()
+        undo_manager.undo()
+
+        undo_manager.record(states[0], "action")
+
+        memory_use, disk_use = undo_manager.get_memory_use()
+        assert memory_use == len(undo_manager.stack[-1]["data"])
+        assert disk_use == sum(
+            entry["location"][1] for entry in undo_manager.stack[1:-1]
+        )
+
+    def test_clear(self, undo_manager, memory_budget):
+        memory_budget(0)
+        for state in self.get_states(5):
+            undo_manager.record(state, "action")
+
+        undo_manager.clear()
+
+        assert undo_manager.get_memory_use() == (0, 0)
@@ -1,5 +1,7 @@
 import pytest
 
+from tilia.timelines.beat.timeline import BeatTimeline
+from tilia.timelines.component_kinds import ComponentKind
 from tilia.ui import commands
 
 
@@ -414,3 +416,166 @@ class TestBeatTimeline:
         assert not beat_tl[1].get_data("is_first_in_measure")
         assert beat_tl[2].get_data("is_first_in_measure")
         assert not beat_tl[3].get_data("is_first_in_measure")
+
+    def test_create_beat_at_middle_updates_metric_position_of_subsequent_beats(
+        self, beat_tl
+    ):
+        beat_tl.beat_pattern = [2]
+        for time in [0, 2, 3, 4]:
+            beat_tl.create_beat(time)
+        assert beat_tl[3].metric_position.measure == 2
+
+        beat_tl.create_beat(1)
+
+        positions = [
+            (b.metric_position.measure, b.metric_position.beat) for b in beat_tl
+        ]
+        assert positions == [(1, 1), (1, 2), (2, 1), (2, 2), (3, 1)]
+
+    def test_delete_beat_updates_metric_position_of_subsequent_beats(self, beat_tl):
+        beat_tl.beat_pattern = [2]
+        for time in range(5):
+            beat_tl.create_beat(time)
+        assert beat_tl[3].metric_position.measure == 2
+
+        beat_tl.delete_components([beat_tl[1]])
+
+        positions = [
+            (b.metric_position.measure, b.metric_position.beat) for b in beat_tl
+        ]
+        assert positions == [(1, 1), (1, 2), (2, 1), (2, 2)]
+
+    def test_moving_beat_past_another_updates_metric_positions(self, beat_tl):
+        beat_tl.beat_pattern = [2]
+        for time in range(4):
+            beat_tl.create_beat(time)
+        assert beat_tl[0].metric_position.beat == 1
+
+        beat_tl.set_component_data(beat_tl[0].id, "time", 2.5)
+
+        assert [b.time for b in beat_tl] == [1, 2, 2.5, 3]
+        positions = [
+            (b.metric_position.measure, b.metric_position.beat) for b in beat_tl
+        ]
+        assert positions == [(1, 1), (1, 2), (2, 1), (2, 2)]
+        assert [b.is_first_in_measure for b in beat_tl] == [True, False, True, False]
+
+    def test_metric_positions_in_last_measure(self, beat_tl):
+        beat_tl.beat_pattern = [4]
+        for time in range(8):
+            beat_tl.create_beat(time)
+
+        positions = [
+            (b.metric_position.measure, b.metric_position.beat) for b in beat_tl
+        ]
+        assert positions[4:] == [(2, 1), (2, 2), (2, 3), (2, 4)]
+
+    def test_update_cached_metric_positions(self, beat_tl):
+        beat_tl.beat_pattern = [3, 2]
+        for time in range(12):
+            beat_tl.create_beat(time)
+        beat_tl.set_measure_number(2, 10)
+        expected = []
+        for beat in beat_tl:
+            beat.clear_cached_metric_position()
+            expected.append(beat.metric_position)
+
+        beat_tl.clear_cached_metric_positions()
+        beat_tl.update_cached_metric_positions()
+
+        assert [b.metric_position for b in beat_tl] == expected
+        assert [b.metric_position.measure_beat_count for b in beat_tl] == [
+            e.measure_beat_count for e in expected
+        ]
+
+    def test_get_time_by_measure_after_adding_beats(self, beat_tl):
+        beat_tl.beat_pattern = [2]
+        for time in range(4):
+            beat_tl.create_beat(time)
+        assert beat_tl.get_time_by_measure(2) == [2]
+
+        beat_tl.create_beat(0.5)
+
+        assert beat_tl.get_time_by_measure(2) == [1]
+        assert beat_tl.get_time_by_measure(3) == [3]
+
+    def test_fill_with_beats_by_amount(self, beat_tl, tilia_state):
+        tilia_state.duration = 100
+        beat_tl.beat_pattern = [2]
+
+        beat_tl.fill_with_beats(BeatTimeline.FillMethod.BY_AMOUNT, 10)
+
+        assert [b.time for b in beat_tl] == [i * 100 / 10 for i in range(10)]
+        assert [b.is_first_in_measure for b in beat_tl] == [True, False] * 5
+        assert beat_tl.beats_in_measure == [2] * 5
+
+    def test_fill_with_beats_by_interval(self, beat_tl, tilia_state):
+        tilia_state.duration = 100
+
+        beat_tl.fill_with_beats(BeatTimeline.FillMethod.BY_INTERVAL, 30)
+
+        assert [b.time for b in beat_tl] == [0, 30, 60]
+
+    def test_create_beats_in_bulk_rejects_invalid_times(self, beat_tl, tilia_state):
+        tilia_state.duration = 100
+        beat_tl.create_beat(10)
+
+        results = beat_tl.create_components(
+            ComponentKind.BEAT,
+            [{"time": t} for t in [20, 10, 20, -1, 101, 30]],
+        )
+
+        assert [beat is not None for beat, _ in results] == [
+            True,
+            False,
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert all(reason for beat, reason in results if beat is None)
+        assert [b.time for b in beat_tl] == [10, 20, 30]
+
+    def test_get_times_by_measures(self, beat_tl):
+        beat_tl.set_data("beat_pattern", [2])
+        for t in range(1, 13):
+            beat_tl.create_beat(time=t)
+        beat_tl.measure_numbers = [1, 2, 3, 1, 2, 1]
+        beat_tl.recalculate_measures()
+
+        numbers = [1, 2, 2, 3, 3, 4]
+        fractions = [0, 0.5, 0.75, 0.5, 1.0, 0]
+
+        assert beat_tl.get_times_by_measures(numbers, fractions) == [
+            [1, 7, 11],
+            [4, 10],
+            [4.5, 10.5],
+            [6],
+            [],
+            [],
+        ]
+
+    def test_get_times_by_measures_matches_get_time_by_measure(self, beat_tl):
+        beat_tl.set_data("beat_pattern", [3])
+        for t in range(1, 11):
+            beat_tl.create_beat(time=t)
+
+        numbers = [0, 1, 1, 2, 3, 4, 5]
+        fractions = [0, 0, 1 / 3, 0.5, 2 / 3, 1.0, 0]
+        for is_segment_end in [False, True]:
+            assert beat_tl.get_times_by_measures(
+                numbers, fractions, is_segment_end
+            ) == [
+                beat_tl.get_time_by_measure(n, f, is_segment_end)
+                for n, f in zip(numbers, fractions, strict=True)
+            ]
+
+    def test_get_metric_fraction_by_time(self, beat_tl):
+        beat_tl.set_data("beat_pattern", [2])
+        for t in range(1, 6):
+            beat_tl.create_beat(time=t)
+
+        assert beat_tl.get_metric_fraction_by_time(0) == 1
+        assert beat_tl.get_metric_fraction_by_time(2) == 1.5
+        assert beat_tl.get_metric_fraction_by_time(2.5) == 1.75
+        assert beat_tl.get_metric_fraction_by_time(6) == 3
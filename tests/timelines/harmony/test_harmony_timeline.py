@@ -1,3 +1,16 @@
+import music21
+
+from tilia.timelines.harmony.components.harmony import (
+    _get_params_from_text as _get_harmony_params_from_text,
+)
+from tilia.timelines.harmony.components.harmony import (
+    get_params_from_text as harmony_params_from_text,
+)
+from tilia.timelines.harmony.components.mode import (
+    get_params_from_text as mode_params_from_text,
+)
+
+
 class TestValidateComponentCreation:
     def test_allows_harmony_at_same_time_as_mode(self, harmony_tl):
         harmony_tl.create_harmony()
@@ -22,3 +35,90 @@ class TestValidateComponentCreation:
         harmony_tl.create_mode()
 
         assert len(harmony_tl) == 1
+
+
+class TestModeRegions:
+    def test_get_key_by_time(self, harmony_tl):
+        harmony_tl.create_mode(time=10, step=1)
+        harmony_tl.create_mode(time=20, step=4)
+
+        assert harmony_tl.get_key_by_time(0).tonic.name == "C"
+        assert harmony_tl.get_key_by_time(10).tonic.name == "D"
+        assert harmony_tl.get_key_by_time(15).tonic.name == "D"
+        assert harmony_tl.get_key_by_time(25).tonic.name == "G"
+
+    def test_get_key_by_time_with_modes_in_different_levels(self, harmony_tl):
+        harmony_tl.create_mode(time=10, step=1, level=3)
+        harmony_tl.create_mode(time=20, step=4, level=1)
+
+        assert harmony_tl.get_key_by_time(15).tonic.name == "D"
+        assert harmony_tl.get_key_by_time(25).tonic.name == "G"
+
+    def test_get_key_by_time_after_mode_time_changes(self, harmony_tl):
+        mode, _ = harmony_tl.create_mode(time=10, step=1)
+        harmony_tl.create_mode(time=20, step=4)
+
+        mode.set_data("time", 30)
+
+        assert harmony_tl.get_key_by_time(15).tonic.name == "C"
+        assert harmony_tl.get_key_by_time(25).tonic.name == "G"
+        assert harmony_tl.get_key_by_time(35).tonic.name == "D"
+
+    def test_get_harmonies_in_harmonic_region(self, harmony_tl):
+        harmonies = [harmony_tl.create_harmony(time=t)[0] for t in range(0, 50, 5)]
+        mode, _ = harmony_tl.create_mode(time=10)
+        harmony_tl.create_mode(time=30)
+
+        cm = harmony_tl.component_manager
+        assert cm.get_harmonies_in_harmonic_region(mode) == harmonies[2:7]
+
+    def test_applied_to_is_updated_only_in_harmonic_region(self, harmony_tl):
+        before, _ = harmony_tl.create_harmony(time=5, step=1, applied_to=4)
+        inside, _ = harmony_tl.create_harmony(time=15, step=1, applied_to=4)
+        after, _ = harmony_tl.create_harmony(time=25, step=1, applied_to=4)
+        harmony_tl.create_mode(time=20)
+
+        harmony_tl.create_mode(time=10, step=1)
+
+        assert before.get_data("applied_to") == 4
+        assert inside.get_data("applied_to") == 3
+        assert after.get_data("applied_to") == 4
+
+
+class TestParamsFromText:
+    def test_roman_numeral_depends_on_key(self):
+        _, params_in_c = harmony_params_from_text("V7", music21.key.Key("C"))
+        _, params_in_d = harmony_params_from_text("V7", music21.key.Key("D"))
+        _, params_in_d_minor = harmony_params_from_text("V7", music21.key.Key("d"))
+
+        assert params_in_c["step"] == 4
+        assert params_in_d["step"] == 5
+        assert params_in_d_minor == params_in_d
+
+    def test_roman_numeral_with_key_as_string(self):
+        assert harmony_params_from_text("ii", "E-") == harmony_params_from_text(
+            "ii", music21.key.Key("E-")
+        )
+
+    def test_letter_symbol_is_parsed_once_for_all_keys(self):
+        harmony_params_from_text("F#m7", music21.key.Key("C"))
+        misses = _get_harmony_params_from_text.cache_info().misses
+
+        success, params = harmony_params_from_text("F#m7", music21.key.Key("B-"))
+
+        assert success
+        assert params["quality"] == "minor-seventh"
+        assert _get_harmony_params_from_text.cache_info().misses == misses
+
+    def test_invalid_text(self):
+        assert harmony_params_from_text("X", music21.key.Key("C")) == (False, None)
+        assert mode_params_from_text("X#") == (False, None)
+
+    def test_cached_params_are_not_modified_by_callers(self):
+        _, params = harmony_params_from_text("C", None)
+        params["step"] = 3
+        _, mode_params = mode_params_from_text("a")
+        mode_params["step"] = 3
+
+        assert harmony_params_from_text("C", None)[1]["step"] == 0
+        assert mode_params_from_text("a")[1]["step"] == 5
@@ -382,6 +382,78 @@ class TestHierarchyTimelineComponentManager:
         assert child2.parent == parent2
         assert child2.children == []
 
+    def test_genealogy_after_changing_times(self, hierarchy_tl):
+        parent, _ = hierarchy_tl.create_hierarchy(0, 2, 2)
+        child, _ = hierarchy_tl.create_hierarchy(0, 1, 1)
+        other, _ = hierarchy_tl.create_hierarchy(3, 4, 1)
+        assert child.parent == parent
+
+        hierarchy_tl.set_component_data(parent.id, "end", 4)
+        hierarchy_tl.set_component_data(parent.id, "start", 0.5)
+
+        assert child.parent is None
+        assert other.parent == parent
+        assert parent.children == [other]
+
+    def test_genealogy_after_changing_level(self, hierarchy_tl):
+        parent, _ = hierarchy_tl.create_hierarchy(0, 2, 2)
+        child, _ = hierarchy_tl.create_hierarchy(0, 1, 1)
+
+        hierarchy_tl.set_component_data(parent.id, "level", 3)
+        hierarchy_tl.set_component_data(child.id, "level", 2)
+
+        assert child.parent == parent
+        assert parent.children == [child]
+
+    def test_genealogy_after_deleting_parent(self, hierarchy_tl):
+        grandparent, _ = hierarchy_tl.create_hierarchy(0, 2, 3)
+        parent, _ = hierarchy_tl.create_hierarchy(0, 2, 2)
+        child, _ = hierarchy_tl.create_hierarchy(0, 1, 1)
+
+        hierarchy_tl.delete_components([parent])
+
+        assert child.parent == grandparent
+        assert grandparent.children == [child]
+
+    def test_genealogy_after_split_and_merge(self, hierarchy_tl):
+        parent, _ = hierarchy_tl.create_hierarchy(0, 2, 2)
+        child, _ = hierarchy_tl.create_hierarchy(0, 2, 1)
+
+        hierarchy_tl.split(1)
+        left, right = parent.children
+        assert (left.start, left.end) == (0, 1)
+        assert (right.start, right.end) == (1, 2)
+        assert left.parent == parent
+        assert right.parent == parent
+
+        hierarchy_tl.merge([left, right])
+        (merged,) = parent.children
+        assert (merged.start, merged.end) == (0, 2)
+        assert merged.parent == parent
+
+    def test_genealogy_with_crossing_boundaries(self, hierarchy_tl):
+        parent, _ = hierarchy_tl.create_hierarchy(0, 2, 2)
+        crossing, _ = hierarchy_tl.create_hierarchy(1, 3, 2)
+        child, _ = hierarchy_tl.create_hierarchy(1, 2, 1)
+
+        assert child.parent in (parent, crossing)
+        assert parent.children == [child]
+        assert crossing.children == [child]
+
+    def test_genealogy_matches_scanning(self, hierarchy_tl, cm):
+        for level, step in [(3, 8), (2, 4), (1, 1)]:
+            for start in range(0, 16, step):
+                hierarchy_tl.create_hierarchy(start, start + step, level)
+        hierarchy_tl.delete_components(
+            [h for h in hierarchy_tl if (h.start, h.level) in [(4, 2), (9, 1)]]
+        )
+
+        for h in hierarchy_tl:
+            assert h.parent == cm._get_parent_by_scanning(h)
+            assert h.children == cm._get_children_by_scanning(h)
+        for time in [t / 2 for t in range(33)]:
+            assert cm.get_unit_to_split(time) == cm._get_unit_to_split_by_scanning(time)
+
     def test_get_boundary_conflicts_empty_timeline(self, hierarchy_tl):
         assert not hierarchy_tl.get_boundary_conflicts()
 
@@ -474,6 +546,32 @@ class TestHierarchyTimelineComponentManager:
         assert {h1, h3} in conflicts
         assert {h2, h3} in conflicts
 
+    def test_get_boundary_conflicts_crossing_reported_in_both_orders(
+        self, hierarchy_tl
+    ):
+        h1, _ = hierarchy_tl.create_hierarchy(0, 2, 1)
+        h2, _ = hierarchy_tl.create_hierarchy(1, 3, 1)
+        assert hierarchy_tl.get_boundary_conflicts() == [(h1, h2), (h2, h1)]
+
+    def test_get_boundary_conflicts_among_valid_hierarchies(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 8, 3)
+        for start in range(0, 8, 2):
+            hierarchy_tl.create_hierarchy(start, start + 2, 2)
+        for start in range(8):
+            hierarchy_tl.create_hierarchy(start, start + 1, 1)
+        crossing, _ = hierarchy_tl.create_hierarchy(3.5, 4.5, 2)
+
+        conflicts = hierarchy_tl.get_boundary_conflicts()
+
+        assert all(crossing in c for c in conflicts)
+        assert {(h.start, h.level) for c in conflicts for h in c} == {
+            (3.5, 2),  # crossing
+            (2, 2),
+            (4, 2),
+            (3, 1),
+            (4, 1),
+        }
+
 
 class TestSplit:
     # TEST SPLIT
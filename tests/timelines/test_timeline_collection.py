@@ -2,6 +2,7 @@ import pytest
 
 from tests.mock import PatchPost, Serve, ServeSequence, patch_yes_or_no_dialog
 from tilia.requests import Get, Post
+from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.timeline_kinds import TimelineKind
 
 
@@ -160,6 +161,32 @@ class TestTimelines:
         assert serialized[tl4.id]["ordinal"] == 4
         assert serialized[tl4.id]["kind"] == "BEAT_TIMELINE"
 
+    def test_serialize_timelines_reuses_state_of_unchanged_timelines(self, tls):
+        tl1 = tls.create_timeline(TimelineKind.MARKER_TIMELINE)
+        tl2 = tls.create_timeline(TimelineKind.MARKER_TIMELINE)
+        tl1.create_component(ComponentKind.MARKER, 0)
+        marker, _ = tl2.create_component(ComponentKind.MARKER, 0)
+        prev_state, _ = tls.serialize_timelines()
+
+        tl2.set_component_data(marker.id, "time", 1)
+        state, _ = tls.serialize_timelines()
+
+        assert state[tl1.id] is prev_state[tl1.id]
+        assert state[tl2.id]["components"][marker.id]["time"] == 1
+
+    def test_serialize_timelines_after_setting_timeline_data(self, tls):
+        tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE, beat_pattern=[2])
+        prev_state, prev_hash = tls.serialize_timelines()
+
+        tl.set_data("name", "new name")
+        tl.beat_pattern.append(3)
+        state, hash = tls.serialize_timelines()
+
+        assert state[tl.id]["name"] == "new name"
+        assert state[tl.id]["beat_pattern"] == [2, 3]
+        assert prev_state[tl.id]["beat_pattern"] == [2]
+        assert hash != prev_hash
+
     def test_delete_timeline_updates_ordinals_correctly(self, tls):
         tl1 = tls.create_timeline(TimelineKind.SLIDER_TIMELINE)
         tl2 = tls.create_timeline(TimelineKind.SLIDER_TIMELINE)
@@ -184,3 +211,95 @@ class TestTimelines:
 
         assert tl3.ordinal == 1
         assert tl4.ordinal == 2
+
+    def test_scale_beat_timeline_keeps_metric_positions(self, tls, tilia_state):
+        beat_tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE, beat_pattern=[3])
+        for time in range(0, 50, 5):
+            beat_tl.create_component(ComponentKind.BEAT, time)
+        positions = [b.metric_position for b in beat_tl]
+        is_first_in_measure = [b.is_first_in_measure for b in beat_tl]
+
+        tls.scale_timeline_components(2)
+
+        assert [b.time for b in beat_tl] == list(range(0, 100, 10))
+        assert [b.metric_position for b in beat_tl] == positions
+        assert [b.is_first_in_measure for b in beat_tl] == is_first_in_measure
+        assert beat_tl.get_time_by_measure(2) == [30]
+        assert tls.get_metric_position(29).measure == 2
+
+    def test_scale_notifies_once(self, tls, tilia_state):
+        beat_tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE)
+        for time in range(10):
+            beat_tl.create_component(ComponentKind.BEAT, time)
+
+        module = "tilia.timelines.collection.collection"
+        with PatchPost(module, Post.TIMELINES_SCALE_DONE) as scale_done:
+            with PatchPost(
+                "tilia.timelines.base.timeline", Post.TIMELINE_COMPONENT_SET_DATA_DONE
+            ) as set_data_done:
+                tls.scale_timeline_components(2)
+
+        scale_done.assert_called_once()
+        set_data_done.assert_not_called()
+
+    def test_crop_beat_timeline(self, tls, tilia_state):
+        beat_tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE, beat_pattern=[2])
+        for time in range(0, 50, 10):
+            beat_tl.create_component(ComponentKind.BEAT, time)
+
+        tls.crop_timeline_components(25)
+
+        assert [b.time for b in beat_tl] == [0, 10, 20]
+        assert [b.is_first_in_measure for b in beat_tl] == [True, False, True]
+        assert tls.get_metric_position(40).measure == 2
+
+
+class TestGetMetricPositions:
+    def test_without_beat_timeline(self, tls):
+        assert tls.get_metric_positions([0, 10]) == [None, None]
+
+    def test_gets_position_of_closest_beat(self, tls):
+        beat_tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE, beat_pattern=[2])
+        for time in [10, 20, 30, 40]:
+            beat_tl.create_component(ComponentKind.BEAT, time)
+
+        positions = tls.get_metric_positions([0, 14, 15, 16, 35, 100])
+
+        assert [(p.measure, p.beat) for p in positions] == [
+            (1, 1),
+            (1, 1),
+            (1, 1),  # ties go to the previous beat
+            (1, 2),
+            (2, 1),
+            (2, 2),
+        ]
+
+    def test_matches_single_lookup(self, tls):
+        beat_tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE, beat_pattern=[3])
+        for time in range(0, 50, 5):
+            beat_tl.create_component(ComponentKind.BEAT, time)
+        times = [t / 2 for t in range(-2, 110)]
+
+        assert tls.get_metric_positions(times) == [
+            tls.get_metric_position(t) for t in times
+        ]
+
+    def test_after_beats_change(self, tls):
+        beat_tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE, beat_pattern=[2])
+        for time in [10, 20, 30]:
+            beat_tl.create_component(ComponentKind.BEAT, time)
+        assert tls.get_metric_position(31).beat == 1
+
+        beat_tl.create_component(ComponentKind.BEAT, 29)
+        assert tls.get_metric_position(31).beat == 2
+
+        beat_tl.set_component_data(beat_tl[3].id, "time", 40)
+        assert tls.get_metric_position(31).beat == 1
+        assert tls.get_metric_position(39).beat == 2
+
+        beat_tl.delete_components([beat_tl[2]])
+        assert tls.get_metric_position(31).beat == 1
+        assert tls.get_metric_position(29).beat == 2
+
+        beat_tl.clear()
+        assert tls.get_metric_position(31) is None
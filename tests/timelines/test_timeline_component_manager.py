@@ -1,6 +1,8 @@
 import itertools
 import random
 
+from tilia.timelines.component_kinds import ComponentKind
+
 
 class TestComponentOrder:
     def test_components_stay_sorted_after_setting_ordering_attr(
@@ -14,3 +16,353 @@ class TestComponentOrder:
 
         for c1, c2 in itertools.pairwise(marker_tl):
             assert c1 < c2 or c1.time == c2.time
+
+    def test_components_stay_sorted_after_deleting_components_with_shared_ordinal(
+        self, hierarchy_tl
+    ):
+        hierarchy_tl.create_hierarchy(0, 5, 1)
+        to_delete, _ = hierarchy_tl.create_hierarchy(0, 10, 1)
+        hierarchy_tl.create_hierarchy(5, 10, 1)
+
+        hierarchy_tl.delete_components([to_delete])
+
+        assert to_delete not in hierarchy_tl.components
+        assert [(c.start, c.end) for c in hierarchy_tl] == [(0, 5), (5, 10)]
+
+
+class TestGetComponentByTime:
+    def test_get_previous_component_by_time(self, marker_tl):
+        for i in range(0, 100, 10):
+            marker_tl.create_marker(i)
+
+        assert marker_tl.get_previous_component_by_time(-1) is None
+        assert marker_tl.get_previous_component_by_time(0).get_data("time") == 0
+        assert marker_tl.get_previous_component_by_time(15).get_data("time") == 10
+        assert marker_tl.get_previous_component_by_time(100).get_data("time") == 90
+
+    def test_get_next_component_by_time(self, marker_tl):
+        for i in range(0, 100, 10):
+            marker_tl.create_marker(i)
+
+        assert marker_tl.get_next_component_by_time(-1).get_data("time") == 0
+        assert marker_tl.get_next_component_by_time(0).get_data("time") == 10
+        assert marker_tl.get_next_component_by_time(15).get_data("time") == 20
+        assert marker_tl.get_next_component_by_time(90) is None
+
+    def test_get_component_by_time_after_changing_time(self, marker_tl):
+        for i in range(0, 100, 10):
+            marker_tl.create_marker(i)
+
+        marker_tl[0].set_data("time", 95)
+
+        assert marker_tl.get_previous_component_by_time(5) is None
+        assert marker_tl.get_previous_component_by_time(99).get_data("time") == 95
+
+
+class TestGetNeighbourComponent:
+    def test_get_next_and_previous_component(self, marker_tl):
+        for i in range(0, 40, 10):
+            marker_tl.create_marker(i)
+
+        assert marker_tl.get_previous_component(marker_tl[0].id) is None
+        assert marker_tl.get_next_component(marker_tl[0].id) == marker_tl[1]
+        assert marker_tl.get_previous_component(marker_tl[3].id) == marker_tl[2]
+        assert marker_tl.get_next_component(marker_tl[3].id) is None
+
+    def test_neighbours_are_updated_after_deleting_component(self, marker_tl):
+        for i in range(0, 40, 10):
+            marker_tl.create_marker(i)
+
+        marker_tl.delete_components([marker_tl[1]])
+
+        assert marker_tl.get_next_component(marker_tl[0].id) == marker_tl[1]
+        assert marker_tl.get_previous_component(marker_tl[1].id) == marker_tl[0]
+
+    def test_neighbours_are_updated_after_setting_ordering_attr(self, marker_tl):
+        for i in range(0, 40, 10):
+            marker_tl.create_marker(i)
+
+        marker_tl[0].set_data("time", 25)
+
+        for prev_cmp, next_cmp in itertools.pairwise(marker_tl):
+            assert marker_tl.get_next_component(prev_cmp.id) == next_cmp
+            assert marker_tl.get_previous_component(next_cmp.id) == prev_cmp
+        assert marker_tl.get_previous_component(marker_tl[0].id) is None
+        assert marker_tl.get_next_component(marker_tl[-1].id) is None
+
+
+class TestGetComponentsByKind:
+    def test_get_components_by_condition_only_returns_given_kind(self, harmony_tl):
+        harmony_tl.create_harmony(10)
+        harmony_tl.create_mode(5)
+        harmony_tl.create_harmony(0)
+
+        harmonies = harmony_tl.component_manager.get_components_by_condition(
+            lambda _: True, ComponentKind.HARMONY
+        )
+
+        assert [h.get_data("time") for h in harmonies] == [0, 10]
+
+    def test_components_by_kind_are_updated_after_deleting_component(self, harmony_tl):
+        harmony, _ = harmony_tl.create_harmony(0)
+        mode, _ = harmony_tl.create_mode(0)
+
+        harmony_tl.delete_components([harmony])
+
+        assert harmony_tl.harmonies() == []
+        assert harmony_tl.modes() == [mode]
+
+
+class TestGetComponentsByIndexedAttr:
+    def test_get_components_by_indexed_attr(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 1, 1)
+        hierarchy_tl.create_hierarchy(1, 2, 2)
+        hierarchy_tl.create_hierarchy(2, 3, 1)
+
+        hierarchies = hierarchy_tl.get_components_by_attr("level", 1)
+
+        assert [h.get_data("start") for h in hierarchies] == [0, 2]
+
+    def test_index_is_updated_after_setting_indexed_attr(self, hierarchy_tl):
+        hrc, _ = hierarchy_tl.create_hierarchy(0, 1, 1)
+
+        hierarchy_tl.set_component_data(hrc.id, "level", 2)
+
+        assert hierarchy_tl.get_components_by_attr("level", 1) == []
+        assert hierarchy_tl.get_components_by_attr("level", 2) == [hrc]
+
+    def test_index_is_updated_after_deleting_component(self, hierarchy_tl):
+        hrc, _ = hierarchy_tl.create_hierarchy(0, 1, 1)
+
+        hierarchy_tl.delete_components([hrc])
+
+        assert hierarchy_tl.get_component_by_attr("level", 1) is None
+
+
+class TestHashComponents:
+    def test_hash_changes_after_setting_data(self, marker_tl):
+        marker, _ = marker_tl.create_marker(0)
+        prev_hash = marker_tl.component_manager.hash_components()
+
+        marker_tl.set_component_data(marker.id, "time", 1)
+
+        assert marker_tl.component_manager.hash_components() != prev_hash
+
+    def test_hash_is_restored_after_reverting_data(self, marker_tl):
+        marker, _ = marker_tl.create_marker(0)
+        prev_hash = marker_tl.component_manager.hash_components()
+
+        marker_tl.set_component_data(marker.id, "time", 1)
+        marker_tl.set_component_data(marker.id, "time", 0)
+
+        assert marker_tl.component_manager.hash_components() == prev_hash
+
+    def test_hash_is_restored_after_deleting_component(self, marker_tl):
+        marker_tl.create_marker(0)
+        prev_hash = marker_tl.component_manager.hash_components()
+
+        marker, _ = marker_tl.create_marker(1)
+        marker_tl.delete_components([marker])
+
+        assert marker_tl.component_manager.hash_components() == prev_hash
+
+    def test_hash_changes_after_scaling(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 1, 1)
+        prev_hash = hierarchy_tl.component_manager.hash_components()
+
+        hierarchy_tl.scale(2)
+
+        assert hierarchy_tl.component_manager.hash_components() != prev_hash
+        assert hierarchy_tl[0].hash == hierarchy_tl[0].to_hash()
+
+
+class TestSerializeComponents:
+    def test_unchanged_components_are_reused(self, marker_tl):
+        marker1, _ = marker_tl.create_marker(0)
+        marker2, _ = marker_tl.create_marker(1)
+        prev_data = marker_tl.component_manager.serialize_components()
+        assert marker_tl.component_manager.serialize_components() is prev_data
+
+        marker_tl.set_component_data(marker2.id, "time", 2)
+        data = marker_tl.component_manager.serialize_components()
+
+        assert data is not prev_data
+        assert data[marker1.id] is prev_data[marker1.id]
+        assert data[marker2.id]["time"] == 2
+        assert prev_data[marker2.id]["time"] == 1
+
+    def test_serialize_after_creating_and_deleting(self, marker_tl):
+        marker1, _ = marker_tl.create_marker(0)
+        marker_tl.component_manager.serialize_components()
+
+        marker2, _ = marker_tl.create_marker(1)
+        assert set(marker_tl.component_manager.serialize_components()) == {
+            marker1.id,
+            marker2.id,
+        }
+
+        marker_tl.delete_components([marker1])
+        assert set(marker_tl.component_manager.serialize_components()) == {marker2.id}
+
+    def test_serialize_after_setting_data_and_deleting(self, marker_tl):
+        marker1, _ = marker_tl.create_marker(0)
+        marker2, _ = marker_tl.create_marker(1)
+        marker_tl.component_manager.serialize_components()
+
+        marker_tl.set_component_data(marker1.id, "time", 2)
+        marker_tl.delete_components([marker1])
+
+        assert list(marker_tl.component_manager.serialize_components()) == [marker2.id]
+
+    def test_serialize_after_scaling(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 1, 1)
+        hierarchy_tl.component_manager.serialize_components()
+
+        hierarchy_tl.scale(2)
+
+        data = hierarchy_tl.component_manager.serialize_components()
+        assert data[hierarchy_tl[0].id]["end"] == 2
+        assert data[hierarchy_tl[0].id]["hash"] == hierarchy_tl[0].to_hash()
+
+
+class TestExistingPositions:
+    def test_creating_at_existing_position_fails(self, marker_tl):
+        marker_tl.create_marker(10)
+
+        marker, _ = marker_tl.create_marker(10)
+
+        assert marker is None
+        assert len(marker_tl) == 1
+
+    def test_position_is_freed_after_deleting_component(self, marker_tl):
+        marker, _ = marker_tl.create_marker(10)
+        marker_tl.delete_components([marker])
+
+        marker, _ = marker_tl.create_marker(10)
+
+        assert marker is not None
+
+    def test_position_is_updated_after_setting_data(self, marker_tl):
+        marker, _ = marker_tl.create_marker(10)
+        marker_tl.set_component_data(marker.id, "time", 20)
+
+        assert marker_tl.create_marker(10)[0] is not None
+        assert marker_tl.create_marker(20)[0] is None
+
+    def test_position_is_updated_after_scaling(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 1, 1)
+        hierarchy_tl.scale(2)
+
+        assert hierarchy_tl.create_hierarchy(0, 1, 1)[0] is not None
+        assert hierarchy_tl.create_hierarchy(0, 2, 1)[0] is None
+
+    def test_shared_position_is_kept_until_all_components_are_deleted(self, marker_tl):
+        marker1, _ = marker_tl.create_marker(10)
+        marker2, _ = marker_tl.create_marker(20)
+        # positions are not validated when setting data
+        marker_tl.set_component_data(marker2.id, "time", 10)
+        marker_tl.delete_components([marker1])
+
+        assert marker_tl.create_marker(10)[0] is None
+
+    def test_positions_are_kept_by_kind(self, harmony_tl):
+        harmony_tl.create_harmony(10)
+
+        assert harmony_tl.create_mode(10)[0] is not None
+        assert harmony_tl.create_harmony(10)[0] is None
+
+
+class TestCreateComponents:
+    def test_create_components(self, marker_tl):
+        marker_tl.create_marker(15)
+
+        results = marker_tl.create_components(
+            ComponentKind.MARKER, [{"time": t} for t in [30, 10, 20]]
+        )
+
+        assert all(component for component, _ in results)
+        assert [m.get_data("time") for m in marker_tl] == [10, 15, 20, 30]
+        assert marker_tl.get_next_component(marker_tl[1].id) == marker_tl[2]
+
+    def test_rows_are_validated_against_each_other(self, marker_tl):
+        results = marker_tl.create_components(
+            ComponentKind.MARKER, [{"time": 10}, {"time": 10}]
+        )
+
+        assert results[0][0] is not None
+        assert results[1][0] is None
+        assert len(marker_tl) == 1
+
+    def test_repeated_ids_are_replaced(self, marker_tl):
+        results = marker_tl.create_components(
+            ComponentKind.MARKER, [{"time": 0, "id": 100}, {"time": 1, "id": 100}]
+        )
+
+        ids = [component.id for component, _ in results]
+        assert ids[0] == "100"
+        assert ids[1] != "100"
+        assert marker_tl.get_component(ids[1]).get_data("time") == 1
+
+    def test_pdf_marker_rows_are_validated_against_each_other(self, pdf_tl):
+        results = pdf_tl.create_components(
+            ComponentKind.PDF_MARKER,
+            [{"time": 1, "page_number": 1}, {"time": 1, "page_number": 2}],
+        )
+
+        assert results[0][0] is not None
+        assert results[1][0] is None
+        assert len(pdf_tl) == 1
+
+    def test_hierarchy_rows_are_validated_against_each_other(self, hierarchy_tl):
+        hierarchy_tl.clear()
+
+        results = hierarchy_tl.create_components(
+            ComponentKind.HIERARCHY,
+            [
+                {"start": 0, "end": 1, "level": 1},
+                {"start": 0, "end": 1, "level": 1},
+                {"start": 0, "end": 1, "level": 2},
+            ],
+        )
+
+        assert [component is not None for component, _ in results] == [
+            True,
+            False,
+            True,
+        ]
+
+    def test_components_can_be_found_by_indexed_attr(self, hierarchy_tl):
+        hierarchy_tl.clear()
+
+        hierarchy_tl.create_components(
+            ComponentKind.HIERARCHY,
+            [
+                {"start": 0, "end": 1, "level": 1},
+                {"start": 1, "end": 2, "level": 1},
+                {"start": 0, "end": 2, "level": 2},
+            ],
+        )
+
+        assert len(hierarchy_tl.get_components_by_attr("level", 1)) == 2
+
+
+class TestDeleteComponents:
+    def test_delete_components(self, marker_tl):
+        for i in range(0, 50, 10):
+            marker_tl.create_marker(i)
+
+        marker_tl.delete_components([marker_tl[1], marker_tl[3]])
+
+        assert [m.get_data("time") for m in marker_tl] == [0, 20, 40]
+        assert marker_tl.get_next_component(marker_tl[0].id) == marker_tl[1]
+        assert marker_tl.get_previous_component(marker_tl[2].id) == marker_tl[1]
+        assert marker_tl.get_next_component_by_time(25) == marker_tl[2]
+
+    def test_indexes_are_updated_after_deleting_components(self, hierarchy_tl):
+        hierarchy_tl.clear()
+        hrc1, _ = hierarchy_tl.create_hierarchy(0, 1, 1)
+        hrc2, _ = hierarchy_tl.create_hierarchy(1, 2, 1)
+
+        hierarchy_tl.delete_components([hrc1])
+
+        assert hierarchy_tl.get_components_by_attr("level", 1) == [hrc2]
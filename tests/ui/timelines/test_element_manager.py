@@ -1,5 +1,8 @@
+import itertools
 import random
 
+from tilia.timelines.component_kinds import ComponentKind
+
 
 class TestElementOrder:
     def test_elements_stay_sorted_after_setting_ordering_attr(
@@ -20,3 +23,80 @@ class TestElementOrder:
                 for i in range(len(elms) - 1)
             ]
         )
+
+    def test_neighbours_are_updated_after_setting_ordering_attr(self, marker_tlui):
+        for i in range(0, 40, 10):
+            marker_tlui.create_marker(i)
+
+        marker_tlui[0].set_data("time", 25)
+
+        elms = marker_tlui.elements
+        element_manager = marker_tlui.element_manager
+        for prev_elm, next_elm in itertools.pairwise(elms):
+            assert element_manager.get_next_element(prev_elm) == next_elm
+            assert element_manager.get_previous_element(next_elm) == prev_elm
+        assert element_manager.get_previous_element(elms[0]) is None
+        assert element_manager.get_next_element(elms[-1]) is None
+
+    def test_elements_are_sorted_after_creating_components_in_bulk(self, marker_tlui):
+        marker_tlui.create_marker(15)
+        marker_tlui.timeline.create_components(
+            ComponentKind.MARKER, [{"time": t} for t in [30, 10, 20, 0]]
+        )
+
+        elms = marker_tlui.elements
+        element_manager = marker_tlui.element_manager
+        assert [e.get_data("time") for e in elms] == [0, 10, 15, 20, 30]
+        for prev_elm, next_elm in itertools.pairwise(elms):
+            assert element_manager.get_next_element(prev_elm) == next_elm
+            assert element_manager.get_previous_element(next_elm) == prev_elm
+
+    def test_elements_are_deleted_with_components_in_bulk(self, marker_tlui):
+        for i in range(0, 50, 10):
+            marker_tlui.create_marker(i)
+
+        marker_tlui.timeline.clear()
+
+        assert marker_tlui.elements == []
+        assert (
+            marker_tlui.element_manager.get_elements_by_attribute(
+                "kind", ComponentKind.MARKER
+            )
+            == []
+        )
+
+    def test_neighbours_are_updated_after_deleting_components_in_bulk(
+        self, marker_tlui
+    ):
+        for i in range(0, 50, 10):
+            marker_tlui.create_marker(i)
+
+        marker_tlui.timeline.delete_components(
+            [marker_tlui.timeline[1], marker_tlui.timeline[3]]
+        )
+
+        elms = marker_tlui.elements
+        element_manager = marker_tlui.element_manager
+        assert [e.get_data("time") for e in elms] == [0, 20, 40]
+        for prev_elm, next_elm in itertools.pairwise(elms):
+            assert element_manager.get_next_element(prev_elm) == next_elm
+            assert element_manager.get_previous_element(next_elm) == prev_elm
+
+    def test_element_is_removed_after_setting_ordering_attr(self, marker_tlui):
+        for i in range(0, 40, 10):
+            marker_tlui.create_marker(i)
+        marker_tlui[0].set_data("time", 25)
+        moved = marker_tlui[2]
+
+        marker_tlui.timeline.component_manager.delete_component(moved.tl_component)
+
+        elms = marker_tlui.elements
+        element_manager = marker_tlui.element_manager
+        assert [e.get_data("time") for e in elms] == [10, 20, 30]
+        assert (
+            element_manager.get_elements_by_attribute("kind", ComponentKind.MARKER)
+            == elms
+        )
+        for prev_elm, next_elm in itertools.pairwise(elms):
+            assert element_manager.get_next_element(prev_elm) == next_elm
+            assert element_manager.get_previous_element(next_elm) == prev_elm
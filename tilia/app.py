@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import functools
-import itertools
 import json
 import os
 import re
@@ -70,10 +69,12 @@ class App:
 
         SERVES = {
             (Get.ID, self.get_id),
+            (Get.ID_BLOCK, self.get_id_block),
             (Get.APP_STATE, self.get_app_state),
             (Get.MEDIA_DURATION, lambda: self.duration),
             (Get.VERIFIED_PATH, self._verify_path_exists),
             (Get.IS_FILE_MODIFIED, self.is_file_modified),
+            (Get.UNDO_MEMORY_USE, self.undo_manager.get_memory_use),
         }
 
         for post_, callback in LISTENS:
@@ -128,7 +129,7 @@ class App:
         post(Post.FILE_MEDIA_DURATION_CHANGED, duration)
 
     def is_file_modified(self) -> bool:
-        return self.file_manager.is_file_modified(self.get_app_state())
+        return self.file_manager.is_file_modified(self.get_app_state_hashes())
 
     def on_open(self, path: Path | str | None = None) -> None:
         if isinstance(path, str):
@@ -164,6 +165,8 @@ class App:
         post(Post.APP_FILE_LOADED, file)
 
         self.file_manager.file = file
+        # hashes stored in the file may have been computed by another version
+        self.file_manager.set_timelines(*self.get_timelines_state())
         self.update_recent_files()
 
     def update_recent_files(self):
@@ -284,10 +287,10 @@ class App:
 
         def handle_invalid_id(id):
             tilia.errors.display(tilia.errors.INVALID_ID, id)
-            return str(next(self._id_counter))
+            return self._get_new_id()
 
         if id is None:
-            return str(next(self._id_counter))
+            return self._get_new_id()
 
         if type(id) not in [int, str]:
             return handle_invalid_id(id)
@@ -297,25 +300,30 @@ class App:
         except ValueError:
             return handle_invalid_id(id)
 
-        timeline_ids = {int(c.id) for c in self.timelines}
-        component_lists = [
-            tl.components for tl in self.timelines if tl.components is not None
-        ]
-        component_ids = {
-            int(c.id) for component_list in component_lists for c in component_list
-        }
-        existing_ids = timeline_ids.union(component_ids)
-
-        if int_id in existing_ids:
-            return str(next(self._id_counter))
+        if self.timelines.has_id(str(int_id)):
+            return self._get_new_id()
 
-        if not existing_ids or int_id > max(existing_ids):
-            self._id_counter = itertools.count(int_id + 1)
+        # new ids are always bigger than the ones given
+        self._next_id = max(self._next_id, int_id + 1)
 
         return str(int_id)
 
+    def get_id_block(self, count: int) -> list[str]:
+        """
+        Returns `count` new ID strings at once. Faster than
+        requesting each of them with get_id().
+        """
+        ids = [str(id) for id in range(self._next_id, self._next_id + count)]
+        self._next_id += count
+        return ids
+
+    def _get_new_id(self) -> str:
+        id = self._next_id
+        self._next_id += 1
+        return str(id)
+
     def reset_id_generator(self):
-        self._id_counter = itertools.count()
+        self._next_id = 0
 
     def on_media_duration_changed(self, duration: float):
         if not self.timelines.is_blank and duration != self.duration:
@@ -477,6 +485,20 @@ class App:
         }
         return params
 
+    def get_app_state_hashes(self) -> dict:
+        """
+        Returns the parts of the app state that tell if the file was modified
+        (see are_tilia_data_equal()). Timeline components are represented by
+        their hashes, which are kept up to date as they change, so this
+        doesn't depend on the number of components.
+        """
+        return {
+            "media_metadata": dict(self.file_manager.file.media_metadata),
+            "timelines": self.timelines.get_hashes(),
+            "timelines_hash": self.timelines.get_hash(),
+            "media_path": get(Get.MEDIA_PATH),
+        }
+
     def get_export_data(self):
         return {
             "timelines": self.timelines.get_export_data(),
@@ -8,6 +8,7 @@ from tilia.utils import open_with_os
 
 autosaves_path = Path()
 logs_path = Path()
+undo_path = Path()
 _SITE_DATA_DIR = Path(platformdirs.site_data_dir(tilia.constants.APP_NAME))
 _USER_DATA_DIR = Path(
     platformdirs.user_data_dir(tilia.constants.APP_NAME, roaming=True)
@@ -35,6 +36,11 @@ def setup_logs_path(data_dir):
         create_logs_dir(data_dir)
 
 
+def setup_undo_path(data_dir):
+    if not os.path.exists(undo_path):
+        create_undo_dir(data_dir)
+
+
 def setup_dirs() -> None:
     # if not in prod, set directory to root of tilia
     if os.environ.get("ENVIRONMENT") != "prod":
@@ -42,7 +48,7 @@ def setup_dirs() -> None:
 
     data_dir = setup_data_dir()
 
-    global autosaves_path, logs_path
+    global autosaves_path, logs_path, undo_path
 
     autosaves_path = Path(data_dir, "autosaves")
     setup_autosaves_path(data_dir)
@@ -50,6 +56,9 @@ def setup_dirs() -> None:
     logs_path = Path(data_dir, "logs")
     setup_logs_path(data_dir)
 
+    undo_path = Path(data_dir, "undo")
+    setup_undo_path(data_dir)
+
 
 def create_data_dir() -> Path:
     try:
@@ -70,5 +79,9 @@ def create_logs_dir(data_dir: Path):
     os.mkdir(Path(data_dir, "logs"))
 
 
+def create_undo_dir(data_dir: Path):
+    os.mkdir(Path(data_dir, "undo"))
+
+
 def open_autosaves_dir():
     open_with_os(autosaves_path)
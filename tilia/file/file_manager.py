@@ -259,7 +259,7 @@ class FileManager:
         return self.file.file_path
 
     def ask_save_changes_if_modified(self):
-        if not self.is_file_modified(get(Get.APP_STATE)):
+        if not get(Get.IS_FILE_MODIFIED):
             return True, False
 
         return get(Get.FROM_USER_SHOULD_SAVE_CHANGES)
@@ -126,19 +126,19 @@ def beats_from_csv(
 
     with TiliaCSVReader(path, file_kwargs, reader_kwargs) as reader:
         next(reader)
+        rows = []
         for row in reader:
             if not row:
                 continue
 
-            constructor_kwargs = {}
             index = params_to_indices["time"]
-            constructor_kwargs["time"] = float(row[index])
+            rows.append({"time": float(row[index])})
 
-            component, fail_reason = timeline.create_component(
-                ComponentKind.BEAT, **constructor_kwargs
-            )
+        for component, fail_reason in timeline.create_components(
+            ComponentKind.BEAT, rows
+        ):
             if not component:
                 errors.append(fail_reason)
 
-            timeline.recalculate_measures()
+        timeline.recalculate_measures()
         return True, errors
@@ -1,6 +1,8 @@
 from typing import Any, Callable
 
 from tilia.parsers.csv.base import AttributeData
+from tilia.timelines.base.timeline import Timeline
+from tilia.timelines.component_kinds import ComponentKind
 
 
 def _get_attrs_indices(params: list[str], headers: list[str]) -> list[int]:
@@ -80,3 +82,27 @@ def _parse_measure_fraction(value: str):
         raise ValueError("APPEND:Must be a number between 0 and 1.")
 
     return value
+
+
+def _create_components(
+    timeline: Timeline, kind: ComponentKind, rows: list[tuple[int, dict[str, Any]]]
+) -> list[tuple[int, str]]:
+    """
+    Creates components in bulk from (row index, kwargs) tuples.
+    Returns a (row index, fail reason) tuple for each component not created.
+    """
+    results = timeline.create_components(kind, [kwargs for _, kwargs in rows])
+    return [
+        (row_index, fail_reason)
+        for (row_index, _), (component, fail_reason) in zip(rows, results, strict=True)
+        if not component
+    ]
+
+
+def _get_errors_in_row_order(row_errors: list[tuple[int, str]]) -> list[str]:
+    """
+    Returns error messages from (row index, error) tuples, sorted by row.
+    Errors of components created in bulk are collected after the parsing
+    errors, so they have to be put back in order.
+    """
+    return [error for _, error in sorted(row_errors, key=lambda e: e[0])]
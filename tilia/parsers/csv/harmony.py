@@ -6,8 +6,10 @@ import music21
 import tilia.timelines.harmony.constants
 from tilia.parsers.csv.base import TiliaCSVReader
 from tilia.parsers.csv.common import (
+    _create_components,
     _get_attr_data,
     _get_attrs_indices,
+    _get_errors_in_row_order,
     _parse_attr_data,
     _parse_measure_fraction,
     _validate_required_attrs,
@@ -69,23 +71,40 @@ def _get_invalid_symbol_error(component_kind: Literal["harmony", "key"], symbol:
     )
 
 
-def _create_component(component_kind, symbol, harmony_tl, time):
+def _create_keys_and_harmonies(
+    harmony_tl: HarmonyTimeline, to_create: list[tuple[int, str, str, float]]
+) -> list[tuple[int, str]]:
+    """
+    Creates components from (row index, "harmony" or "key", symbol, time) tuples.
+    Keys are created first, as the parameters of harmonies depend on the key
+    at their time. Returns a (row index, error) tuple for each component not
+    created.
+    """
     errors = []
-    success, params = _get_component_params_from_text(
-        component_kind, symbol, harmony_tl.get_key_by_time(time)
-    )
+    for component_kind in ["key", "harmony"]:
+        rows = []
+        for row_index, kind, symbol, time in to_create:
+            if kind != component_kind:
+                continue
 
-    if not success:
-        errors.append(_get_invalid_symbol_error(component_kind, symbol))
-        return errors
+            success, params = _get_component_params_from_text(
+                kind, symbol, harmony_tl.get_key_by_time(time)
+            )
+            if not success:
+                errors.append((row_index, _get_invalid_symbol_error(kind, symbol)))
+                continue
 
-    component, fail_reason = harmony_tl.create_component(
-        (ComponentKind.HARMONY if component_kind == "harmony" else ComponentKind.MODE),
-        time,
-        **params,
-    )
-    if not component:
-        errors.append(fail_reason)
+            rows.append((row_index, {"time": time} | params))
+
+        errors += _create_components(
+            harmony_tl,
+            (
+                ComponentKind.HARMONY
+                if component_kind == "harmony"
+                else ComponentKind.MODE
+            ),
+            rows,
+        )
 
     return errors
 
@@ -134,25 +153,31 @@ def import_by_time(
 
         attr_data = _get_attr_data(attrs_with_parsers, indices)
 
-        for row_data in reader:
+        row_errors = []
+        to_create = []
+        for row_index, row_data in enumerate(reader):
             if not row_data:
                 continue
 
-            success, row_errors, attr_to_value = _parse_attr_data(
+            success, parse_errors, attr_to_value = _parse_attr_data(
                 row_data, attr_data, required_attrs
             )
-            errors += row_errors
+            row_errors += [(row_index, error) for error in parse_errors]
             if not success:
                 continue
 
-            errors += _create_component(
-                attr_to_value["harmony_or_key"],
-                attr_to_value["symbol"],
-                timeline,
-                attr_to_value["time"],
+            to_create.append(
+                (
+                    row_index,
+                    attr_to_value["harmony_or_key"],
+                    attr_to_value["symbol"],
+                    attr_to_value["time"],
+                )
             )
 
-        return True, errors
+        row_errors += _create_keys_and_harmonies(timeline, to_create)
+
+        return True, _get_errors_in_row_order(row_errors)
 
 
 def import_by_measure(
@@ -201,14 +226,16 @@ def import_by_measure(
 
         attr_data = _get_attr_data(attrs_with_parsers, indices)
 
-        for row_data in reader:
+        row_errors = []
+        to_create = []
+        for row_index, row_data in enumerate(reader):
             if not row_data:
                 continue
 
-            success, row_errors, attr_to_value = _parse_attr_data(
+            success, parse_errors, attr_to_value = _parse_attr_data(
                 row_data, attr_data, required_attrs
             )
-            errors += row_errors
+            row_errors += [(row_index, error) for error in parse_errors]
             if not success:
                 continue
 
@@ -218,15 +245,19 @@ def import_by_measure(
             )
 
             if not times:
-                errors.append(f"No measure with number {measure_n}")
+                row_errors.append((row_index, f"No measure with number {measure_n}"))
                 continue
 
             for time in times:
-                errors += _create_component(
-                    attr_to_value["harmony_or_key"],
-                    attr_to_value["symbol"],
-                    harmony_tl,
-                    time,
+                to_create.append(
+                    (
+                        row_index,
+                        attr_to_value["harmony_or_key"],
+                        attr_to_value["symbol"],
+                        time,
+                    )
                 )
 
-        return True, errors
+        row_errors += _create_keys_and_harmonies(harmony_tl, to_create)
+
+        return True, _get_errors_in_row_order(row_errors)
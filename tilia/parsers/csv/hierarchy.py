@@ -6,6 +6,7 @@ from tilia.parsers.csv.base import (
     get_column_not_found_error_message,
     get_params_indices,
 )
+from tilia.parsers.csv.common import _create_components, _get_errors_in_row_order
 from tilia.timelines.beat.timeline import BeatTimeline
 from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.hierarchy.timeline import HierarchyTimeline
@@ -26,7 +27,7 @@ def import_by_time(
     an array with descriptions of any errors during the process.
     """
 
-    errors = []
+    row_errors = []
 
     with TiliaCSVReader(path, file_kwargs, reader_kwargs) as reader:
         params = [
@@ -47,7 +48,8 @@ def import_by_time(
         for attr in ["start", "end", "level"]:
             if attr not in params_to_indices:
                 return False, [get_column_not_found_error_message(attr)]
-        for row in reader:
+        rows = []
+        for row_index, row in enumerate(reader):
             if not row:
                 continue
             constructor_args = {}
@@ -58,7 +60,12 @@ def import_by_time(
                 try:
                     constructor_args[attr] = parsers[i](value)
                 except ValueError:
-                    errors.append(f"'{value}' is not a valid {attr.replace('_', ' ')}")
+                    row_errors.append(
+                        (
+                            row_index,
+                            f"'{value}' is not a valid {attr.replace('_', ' ')}",
+                        )
+                    )
                     continue
 
             for param, parser in zip(params, parsers, strict=True):
@@ -66,13 +73,11 @@ def import_by_time(
                     index = params_to_indices[param]
                     constructor_args[param] = parser(row[index])
 
-            component, fail_reason = timeline.create_component(
-                ComponentKind.HIERARCHY, **constructor_args
-            )
-            if not component:
-                errors.append(fail_reason)
+            rows.append((row_index, constructor_args))
 
-        return True, errors
+        row_errors += _create_components(timeline, ComponentKind.HIERARCHY, rows)
+
+        return True, _get_errors_in_row_order(row_errors)
 
 
 def import_by_measure(
@@ -94,7 +99,7 @@ def import_by_measure(
     That means that repeated measure numbers should not be taken into account.
     """
 
-    errors = []
+    row_errors = []
 
     with TiliaCSVReader(path, file_kwargs, reader_kwargs) as reader:
         header = next(reader)
@@ -127,7 +132,8 @@ def import_by_measure(
         for attr, _ in required_params:
             if attr not in params_to_indices:
                 return False, [get_column_not_found_error_message(attr)]
-        for row in reader:
+        rows = []
+        for row_index, row in enumerate(reader):
             if not row:
                 continue
             required_values = {}
@@ -137,7 +143,9 @@ def import_by_measure(
                     value = row[index]
                     required_values[attr] = parser(value)
             except ValueError:
-                errors.append(f"'{value}' is not a valid {attr.replace('_', ' ')}")
+                row_errors.append(
+                    (row_index, f"'{value}' is not a valid {attr.replace('_', ' ')}")
+                )
                 continue
 
             # get and validate fraction
@@ -150,11 +158,14 @@ def import_by_measure(
                     try:
                         fractions[ext] = float(fraction_value)
                     except ValueError:
-                        errors.append(
-                            f"start={required_values['start']}, "
-                            f"end={required_values['end']} | "
-                            f"{fraction_value} is not a fraction value. "
-                            "Defaulting to 0."
+                        row_errors.append(
+                            (
+                                row_index,
+                                f"start={required_values['start']}, "
+                                f"end={required_values['end']} | "
+                                f"{fraction_value} is not a fraction value. "
+                                "Defaulting to 0.",
+                            )
                         )
                         fractions[ext] = 0
 
@@ -167,7 +178,9 @@ def import_by_measure(
                 )
                 if not times[ext]:
                     value = required_values[ext]
-                    errors.append(f"'{ext}={value} | No measure with number {value}")
+                    row_errors.append(
+                        (row_index, f"'{ext}={value} | No measure with number {value}")
+                    )
                     continue
 
             # get remaining params
@@ -183,10 +196,13 @@ def import_by_measure(
                     try:
                         kwargs[param] = parser(row[index])
                     except ValueError:
-                        errors.append(
-                            f"'start'={required_values['start']}, "
-                            f"end={required_values['end']} | '{row[index]}' "
-                            f"is not a valid {param} value."
+                        row_errors.append(
+                            (
+                                row_index,
+                                f"'start'={required_values['start']}, "
+                                f"end={required_values['end']} | '{row[index]}' "
+                                f"is not a valid {param} value.",
+                            )
                         )
 
             # create hierarchies
@@ -195,21 +211,25 @@ def import_by_measure(
             # start_times and end_times are always sorted. If start_times[n] is greater than end_time[n], all start_times[n+] will also be greater than end_times[n], which would create a segment-like component with start > end. Therefore, pop off head of end_times until a suitable end_time is found.
             while len(start_times) and len(end_times):
                 if (start := start_times[0]) < (end := end_times[0]):
-                    component, fail_reason = hierarchy_tl.create_component(
-                        ComponentKind.HIERARCHY,
-                        start,
-                        end,
-                        required_values["level"],
-                        start_fraction=fractions["start"],
-                        end_fraction=fractions["end"],
-                        **kwargs,
+                    rows.append(
+                        (
+                            row_index,
+                            {
+                                "start": start,
+                                "end": end,
+                                "level": required_values["level"],
+                                "start_fraction": fractions["start"],
+                                "end_fraction": fractions["end"],
+                            }
+                            | kwargs,
+                        )
                     )
-                    if not component:
-                        errors.append(fail_reason)
                     start_times.pop(0)
                     end_times.pop(0)
                     continue
                 while len(end_times) and start_times[0] > end_times[0]:
                     end_times.pop(0)
 
-        return True, errors
+        row_errors += _create_components(hierarchy_tl, ComponentKind.HIERARCHY, rows)
+
+        return True, _get_errors_in_row_order(row_errors)
@@ -6,6 +6,7 @@ from tilia.parsers.csv.base import (
     get_column_not_found_error_message,
     get_params_indices,
 )
+from tilia.parsers.csv.common import _create_components, _get_errors_in_row_order
 from tilia.timelines.beat.timeline import BeatTimeline
 from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.marker.timeline import MarkerTimeline
@@ -25,8 +26,6 @@ def import_by_time(
     Returns an array with descriptions of any issues during creation.
     """
 
-    errors = []
-
     with TiliaCSVReader(path, file_kwargs, reader_kwargs) as reader:
         params_to_indices = get_params_indices(
             ["time", "label", "comments"], next(reader)
@@ -34,7 +33,9 @@ def import_by_time(
 
         if "time" not in params_to_indices:
             return False, [get_column_not_found_error_message("time")]
-        for row in reader:
+        row_errors = []
+        rows = []
+        for row_index, row in enumerate(reader):
             if not row:
                 continue
             # validate time
@@ -43,7 +44,9 @@ def import_by_time(
             try:
                 float(time_value)
             except ValueError:
-                errors.append(f"{time_value=} | {time_value} is not a valid time")
+                row_errors.append(
+                    (row_index, f"{time_value=} | {time_value} is not a valid time")
+                )
                 continue
 
             params = ["time", "label", "comments"]
@@ -55,14 +58,11 @@ def import_by_time(
                     index = params_to_indices[param]
                     constructor_kwargs[param] = parser(row[index])
 
-            component, reason = timeline.create_component(
-                ComponentKind.MARKER, **constructor_kwargs
-            )
+            rows.append((row_index, constructor_kwargs))
 
-            if not component:
-                errors.append(reason)
+        row_errors += _create_components(timeline, ComponentKind.MARKER, rows)
 
-        return True, errors
+        return True, _get_errors_in_row_order(row_errors)
 
 
 def import_by_measure(
@@ -80,7 +80,6 @@ def import_by_measure(
     Returns an array with any errors during the process.
     """
 
-    errors = []
     with TiliaCSVReader(path, file_kwargs, reader_kwargs) as reader:
         params_to_indices = get_params_indices(
             ["measure", "fraction", "label", "comments"], next(reader)
@@ -88,7 +87,10 @@ def import_by_measure(
 
         if "measure" not in params_to_indices:
             return False, [get_column_not_found_error_message("measure")]
-        for row in reader:
+        row_errors = []
+        rows = []
+        row_index_to_measure = {}
+        for row_index, row in enumerate(reader):
             if not row:
                 continue
             # get and validate measure
@@ -96,8 +98,11 @@ def import_by_measure(
             try:
                 measure = int(measure_value)
             except ValueError:
-                errors.append(
-                    f"{measure_value=} | {measure_value} is not a valid measure number"
+                row_errors.append(
+                    (
+                        row_index,
+                        f"{measure_value=} | {measure_value} is not a valid measure number",
+                    )
                 )
                 continue
             fraction = 0
@@ -108,16 +113,21 @@ def import_by_measure(
                 try:
                     fraction = float(fraction_value)
                 except ValueError:
-                    errors.append(
-                        f"{measure_value=} | {fraction_value} "
-                        f"is not a fraction value. Using 0 as a backup."
+                    row_errors.append(
+                        (
+                            row_index,
+                            f"{measure_value=} | {fraction_value} "
+                            f"is not a fraction value. Using 0 as a backup.",
+                        )
                     )
                     fraction = 0
 
             times = beat_tl.get_time_by_measure(measure, fraction)
 
             if not times:
-                errors.append(f"{measure=} | No measure with number {measure}")
+                row_errors.append(
+                    (row_index, f"{measure=} | No measure with number {measure}")
+                )
                 continue
 
             params = ["label", "comments"]
@@ -129,11 +139,14 @@ def import_by_measure(
                     index = params_to_indices[param]
                     constructor_kwargs[param] = parser(row[index])
 
+            row_index_to_measure[row_index] = measure
             for time in times:
-                marker, fail_reason = timeline.create_component(
-                    ComponentKind.MARKER, time=time, **constructor_kwargs
-                )
-                if not marker:
-                    errors.append(f"{measure=} | {fail_reason}")
+                rows.append((row_index, {"time": time} | constructor_kwargs))
+
+        for row_index, fail_reason in _create_components(
+            timeline, ComponentKind.MARKER, rows
+        ):
+            measure = row_index_to_measure[row_index]
+            row_errors.append((row_index, f"{measure=} | {fail_reason}"))
 
-        return True, errors
+        return True, _get_errors_in_row_order(row_errors)
@@ -4,8 +4,10 @@ from typing import Any
 
 from tilia.parsers.csv.base import TiliaCSVReader
 from tilia.parsers.csv.common import (
+    _create_components,
     _get_attr_data,
     _get_attrs_indices,
+    _get_errors_in_row_order,
     _parse_attr_data,
     _parse_measure_fraction,
     _validate_required_attrs,
@@ -15,17 +17,6 @@ from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.pdf.timeline import PdfTimeline
 
 
-def _create_component(timeline, time, page_number):
-    errors = []
-    component, fail_reason = timeline.create_component(
-        ComponentKind.PDF_MARKER, time, page_number
-    )
-    if not component:
-        errors.append(fail_reason)
-
-    return errors
-
-
 def _validate_page_number(timeline: PdfTimeline, value: int):
     return 1 <= value <= timeline.page_total
 
@@ -77,22 +68,32 @@ def import_by_time(
 
         attr_data = _get_attr_data(attrs_with_parsers, indices)
 
-        for row_data in reader:
+        row_errors = []
+        rows = []
+        for row_index, row_data in enumerate(reader):
             if not row_data:
                 continue
 
-            success, row_errors, attr_to_value = _parse_attr_data(
+            success, parse_errors, attr_to_value = _parse_attr_data(
                 row_data, attr_data, required_attrs
             )
-            errors += row_errors
+            row_errors += [(row_index, error) for error in parse_errors]
             if not success:
                 continue
 
-            errors += _create_component(
-                timeline, attr_to_value["time"], attr_to_value["page_number"]
+            rows.append(
+                (
+                    row_index,
+                    {
+                        "time": attr_to_value["time"],
+                        "page_number": attr_to_value["page_number"],
+                    },
+                )
             )
 
-        return True, errors
+        row_errors += _create_components(timeline, ComponentKind.PDF_MARKER, rows)
+
+        return True, _get_errors_in_row_order(row_errors)
 
 
 def import_by_measure(
@@ -135,14 +136,16 @@ def import_by_measure(
 
         attr_data = _get_attr_data(attrs_with_parsers, indices)
 
-        for row_data in reader:
+        row_errors = []
+        rows = []
+        for row_index, row_data in enumerate(reader):
             if not row_data:
                 continue
 
-            success, row_errors, attr_to_value = _parse_attr_data(
+            success, parse_errors, attr_to_value = _parse_attr_data(
                 row_data, attr_data, required_attrs
             )
-            errors += row_errors
+            row_errors += [(row_index, error) for error in parse_errors]
             if not success:
                 continue
 
@@ -152,10 +155,17 @@ def import_by_measure(
             )
 
             if not times:
-                errors.append(f"No measure with number {measure_n}")
+                row_errors.append((row_index, f"No measure with number {measure_n}"))
                 continue
 
             for time in times:
-                errors += _create_component(pdf_tl, time, attr_to_value["page_number"])
+                rows.append(
+                    (
+                        row_index,
+                        {"time": time, "page_number": attr_to_value["page_number"]},
+                    )
+                )
+
+        row_errors += _create_components(pdf_tl, ComponentKind.PDF_MARKER, rows)
 
-        return True, errors
+        return True, _get_errors_in_row_order(row_errors)
@@ -59,6 +59,19 @@ class TiliaMXLReader:
         self.file.close()
 
 
+# Elements of some kinds are drawn according to components of other kinds
+# (e.g. notes according to the clef and staff they are in), so those are
+# created first.
+CREATION_ORDER = [
+    ComponentKind.STAFF,
+    ComponentKind.CLEF,
+    ComponentKind.KEY_SIGNATURE,
+    ComponentKind.TIME_SIGNATURE,
+    ComponentKind.NOTE,
+    ComponentKind.BAR_LINE,
+]
+
+
 def notes_from_musicXML(
     score_tl: ScoreTimeline,
     beat_tl: BeatTimeline,
@@ -77,12 +90,32 @@ def notes_from_musicXML(
     sign_to_octave = {"C": 4, "F": 3, "G": 4}
     sign_to_line = {"C": 3, "F": 4, "G": 2}
 
-    def _create_component(component_kind: ComponentKind, kwargs: dict) -> int | None:
-        component, fail_reason = score_tl.create_component(component_kind, **kwargs)
-        if not component:
-            errors.append(fail_reason)
-            return None
-        return component.id
+    # Components are queued while parsing and created in bulk at the end,
+    # with the position in errors their fail reasons should go to.
+    components_to_create = []
+
+    def _create_component(component_kind: ComponentKind, kwargs: dict) -> None:
+        components_to_create.append((component_kind, kwargs, len(errors)))
+
+    def _create_queued_components() -> None:
+        kind_to_rows = {kind: [] for kind in CREATION_ORDER}
+        for i, (kind, kwargs, error_index) in enumerate(components_to_create):
+            kind_to_rows[kind].append((kwargs, (error_index, i)))
+
+        fail_reasons = []
+        for kind, rows in kind_to_rows.items():
+            if not rows:
+                continue
+            results = score_tl.create_components(kind, [kwargs for kwargs, _ in rows])
+            for (_, position), (component, fail_reason) in zip(
+                rows, results, strict=True
+            ):
+                if not component:
+                    fail_reasons.append((position, fail_reason))
+
+        # inserting from the end keeps the positions of the others valid
+        for (error_index, _), fail_reason in sorted(fail_reasons, reverse=True):
+            errors.insert(error_index, fail_reason)
 
     def _create_elements(elements: dict) -> None:
         for elem in elements:
@@ -517,6 +550,7 @@ def notes_from_musicXML(
     part_id_to_staves = _parse_staves(tree)
     for part in tree.findall("part"):
         _parse_part(part, part.get("id"))
+    _create_queued_components()
     post(Post.SCORE_TIMELINE_COMPONENTS_DESERIALIZED, score_tl.id)
     svg_converter.to_svg(str(etree.tostring(tree, xml_declaration=True), "utf-8"))
 
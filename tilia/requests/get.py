@@ -31,6 +31,7 @@ class Get(Enum):
     FROM_USER_TILIA_FILE_PATH = auto()
     FROM_USER_YES_OR_NO = auto()
     ID = auto()
+    ID_BLOCK = auto()
     IS_FILE_MODIFIED = auto()
     LEFT_MARGIN_X = auto()
     LOOP_TIME = auto()
@@ -43,6 +44,7 @@ class Get(Enum):
     MEDIA_TITLE = auto()
     MEDIA_TYPE = auto()
     METRIC_POSITION = auto()
+    METRIC_POSITIONS = auto()
     PLAYBACK_AREA_WIDTH = auto()
     PLAYER_CLASS = auto()
     RIGHT_MARGIN_X = auto()
@@ -59,6 +61,7 @@ class Get(Enum):
     TIMELINE_UI_BY_ATTR = auto()
     TIMELINE_UI_ELEMENT = auto()
     TIMELINE_WIDTH = auto()
+    UNDO_MEMORY_USE = auto()
     VERIFIED_PATH = auto()
     WINDOW_GEOMETRY = auto()
     WINDOW_STATE = auto()
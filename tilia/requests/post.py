@@ -65,8 +65,11 @@ class Post(Enum):
     SLIDER_DRAG_START = auto()
     TIMELINES_AUTO_SCROLL_UPDATE = auto()
     TIMELINES_CROP_DONE = auto()
+    TIMELINES_SCALE_DONE = auto()
     TIMELINE_COMPONENT_CREATED = auto()
+    TIMELINE_COMPONENTS_CREATED = auto()
     TIMELINE_COMPONENT_DELETED = auto()
+    TIMELINE_COMPONENTS_DELETED = auto()
     TIMELINE_COMPONENT_DESELECTED = auto()
     TIMELINE_COMPONENT_SELECTED = auto()
     TIMELINE_COMPONENT_SET_DATA_DONE = auto()
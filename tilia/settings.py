@@ -19,6 +19,7 @@ class SettingsManager(QObject):
             "prioritise_performance": "true",
         },
         "auto-save": {"max_stored_files": 100, "interval_(seconds)": 300},
+        "undo": {"memory_budget_(MB)": 200},
         "media_metadata": {
             "default_fields": [
                 "composer",
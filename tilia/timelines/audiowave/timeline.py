@@ -61,13 +61,13 @@ class AudioWaveTimeline(Timeline):
         return dt, [amp / max(amplitude) for amp in amplitude]
 
     def _create_components(self, duration: float, amplitudes: list[float]):
-        for i, amplitude in enumerate(amplitudes):
-            self.create_component(
-                kind=ComponentKind.AUDIOWAVE,
-                start=i * duration,
-                end=(i + 1) * duration,
-                amplitude=amplitude,
-            )
+        self.create_components(
+            ComponentKind.AUDIOWAVE,
+            [
+                {"start": i * duration, "end": (i + 1) * duration, "amplitude": amp}
+                for i, amp in enumerate(amplitudes)
+            ],
+        )
 
     def refresh(self):
         self.clear()
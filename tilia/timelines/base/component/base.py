@@ -12,6 +12,9 @@ from tilia.utils import get_tilia_class_string
 class TimelineComponent:
     SERIALIZABLE = []
     ORDERING_ATTRS = tuple()
+    # Attributes for which the component manager keeps a lookup table.
+    # Values must be hashable.
+    INDEXED_ATTRS = tuple()
 
     validators = {
         "timeline": validate_read_only,
@@ -21,7 +24,7 @@ class TimelineComponent:
     def __init__(self, timeline: Timeline, id: int, *args, **kwargs):
         self.timeline = timeline
         self.id = id
-        self.update_hash()
+        self._hash = None
 
     def __str__(self):
         return get_tilia_class_string(self)
@@ -43,8 +46,18 @@ class TimelineComponent:
             string_to_hash += "|" + str(getattr(self, attr))
         return hash_function(string_to_hash)
 
+    @property
+    def hash(self):
+        # Computed on read, as attributes may be set many times
+        # (e.g. while dragging) between reads.
+        if self._hash is None:
+            self._hash = self.to_hash()
+        return self._hash
+
     def update_hash(self):
-        self.hash = self.to_hash()
+        """Marks hash as outdated. Must be called after setting serializable attributes."""
+        self._hash = None
+        self.timeline.update_component_hash(self)
 
     def validate_set_data(self, attr, value):
         if not hasattr(self, attr):
@@ -63,7 +76,10 @@ class TimelineComponent:
             return None, False
         setattr(self, attr, value)
         if attr in self.ORDERING_ATTRS:
+            # this also updates indexes
             self.timeline.update_component_order(self)
+        elif attr in self.INDEXED_ATTRS:
+            self.timeline.update_component_index(self, attr)
         self.update_hash()
         return value, True
 
@@ -6,23 +6,31 @@ from tilia.timelines.base.timeline import TimelineComponentManager
 
 
 def scale_mixed(cm: TimelineComponentManager, factor: float) -> None:
-    for component in list(cm).copy():
+    for component in cm:
+        # attributes are set directly, as scaling keeps the order
+        # and components are re-sorted only once below
         if isinstance(component, PointLikeTimelineComponent):
-            component.set_data("time", component.get_data("time") * factor)
+            component.time = component.get_data("time") * factor
         elif isinstance(component, SegmentLikeTimelineComponent):
-            component.set_data("start", component.get_data("start") * factor)
-            component.set_data("end", component.get_data("end") * factor)
+            component.start = component.get_data("start") * factor
+            component.end = component.get_data("end") * factor
+        else:
+            continue
+        component.update_hash()
+    cm.refresh_component_order()
 
 
 def crop_mixed(cm: TimelineComponentManager, length: float) -> None:
+    components_to_delete = []
     for component in list(cm).copy():
         if isinstance(component, PointLikeTimelineComponent):
             if component.get_data("time") > length:
-                cm.delete_component(component)
+                components_to_delete.append(component)
         elif isinstance(component, SegmentLikeTimelineComponent):
             start = component.get_data("start")
             end = component.get_data("end")
             if start >= length:
-                cm.delete_component(component)
+                components_to_delete.append(component)
             elif end > length:
                 component.set_data("end", length)
+    cm.delete_components(components_to_delete)
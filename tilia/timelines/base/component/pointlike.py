@@ -30,13 +30,15 @@ class PointLikeTimelineComponent(TimelineComponent):
 
     @classmethod
     def validate_creation(
-        cls, time: float, existing_times: Iterable[float]
+        cls, time: float, existing_positions: Iterable[float], **_
     ) -> tuple[bool, str]:
         """Requires unique times by default. Overwrite this or pass a filtered iterable to allow duplicate times."""
         return cls.compose_validators(
             [
                 functools.partial(cls.validate_time_is_inbounds, time),
-                functools.partial(cls.validate_unique_position, time, existing_times),
+                functools.partial(
+                    cls.validate_unique_position, time, existing_positions
+                ),
             ]
         )
 
@@ -67,12 +69,13 @@ class PointLikeTimelineComponent(TimelineComponent):
 
 
 def scale_pointlike(cm: TimelineComponentManager, factor: float) -> None:
-    # Order might change when setting time, so we need a copy
-    for component in list(cm).copy():
-        component.set_data("time", component.get_data("time") * factor)
+    for component in cm:
+        # attributes are set directly, as scaling keeps the order
+        # and components are re-sorted only once below
+        component.time = component.get_data("time") * factor
+        component.update_hash()
+    cm.refresh_component_order()
 
 
 def crop_pointlike(cm: TimelineComponentManager, length: float) -> None:
-    for component in list(cm).copy():
-        if component.get_data("time") > length:
-            cm.delete_component(component)
+    cm.delete_components([c for c in cm if c.get_data("time") > length])
@@ -78,7 +78,12 @@ class SegmentLikeTimelineComponent(TimelineComponent):
 
     @classmethod
     def validate_creation(
-        cls, start: float, end: float, position: T, existing_positions: Iterable[T]
+        cls,
+        start: float,
+        end: float,
+        position: T,
+        existing_positions: Iterable[T],
+        **_,
     ) -> tuple[bool, str]:
         return cls.compose_validators(
             [
@@ -130,13 +135,17 @@ def scale_segmentlike(cm: TimelineComponentManager, factor: float) -> None:
         # to override validation
         component.start = component.get_data("start") * factor
         component.end = component.get_data("end") * factor
+        component.update_hash()
+    cm.refresh_component_order()
 
 
 def crop_segmentlike(cm: TimelineComponentManager, length: float) -> None:
+    components_to_delete = []
     for component in list(cm).copy():
         start = component.get_data("start")
         end = component.get_data("end")
         if start >= length:
-            cm.delete_component(component)
+            components_to_delete.append(component)
         elif end > length:
             component.set_data("end", length)
+    cm.delete_components(components_to_delete)
@@ -3,9 +3,11 @@ from __future__ import annotations
 import bisect
 import functools
 import importlib
+import operator
 from abc import ABC
+from collections import Counter
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Callable, Generic, Set, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, KeysView, TypeVar
 
 from tilia.exceptions import (
     GetTimelineDataError,
@@ -17,7 +19,7 @@ from tilia.timelines.component_kinds import ComponentKind, get_component_class_b
 from tilia.utils import get_sibling_packages
 
 from ...requests import Get, Post, get, post, stop_listening_to_all
-from ..hash_timelines import hash_function
+from ..hash_timelines import HASH_MODULUS, hash_function
 from .validators import (
     validate_boolean,
     validate_bounded_integer,
@@ -72,6 +74,8 @@ class Timeline(ABC, Generic[TC]):
         **kwargs,  # ignores components_hash
     ):
         self.id = get(Get.ID, id)
+        # Last state returned by get_state()
+        self._state: dict[str, Any] | None = None
 
         self.name = name
         self.is_visible = is_visible
@@ -203,13 +207,70 @@ class Timeline(ABC, Generic[TC]):
         else:
             return None, reason
 
+    def create_components(
+        self, kind: ComponentKind, rows: list[dict[str, Any]]
+    ) -> list[tuple[TC | None, str | None]]:
+        """
+        Creates a component of `kind` for each row of keyword arguments.
+        Rows are validated in a single pass and components are added to the
+        timeline at once, so this is much faster than calling
+        `create_component` for each row. Returns a (component, fail reason)
+        tuple for each row, in the same order.
+        """
+        rows = [row.copy() for row in rows]
+        # Given ids are requested first, so new ids are bigger than them.
+        ids = []
+        given_ids = set()
+        for row in rows:
+            id = row.pop("id", None)
+            if id is not None:
+                id = get(Get.ID, id)
+                # ids given to previous rows are not in use yet,
+                # so repeated ones are replaced here
+                if id in given_ids:
+                    id = None
+                else:
+                    given_ids.add(id)
+            ids.append(id)
+        new_ids = iter(get(Get.ID_BLOCK, ids.count(None)))
+        ids = [next(new_ids) if id is None else id for id in ids]
+        results = self.component_manager.create_components(kind, self, ids, rows)
+
+        components = [component for success, component, _ in results if success]
+        if components:
+            post(
+                Post.TIMELINE_COMPONENTS_CREATED,
+                self.KIND,
+                self.id,
+                kind,
+                [
+                    (
+                        component.id,
+                        component.get_data,
+                        functools.partial(self.set_component_data, component.id),
+                    )
+                    for component in components
+                ],
+            )
+
+        return [
+            (component, None) if success else (None, reason)
+            for success, component, reason in results
+        ]
+
     def get_component(self, id: int) -> TC:
         return self.component_manager.get_component(id)
 
     def get_component_by_attr(self, attr: str, value: Any) -> TC:
+        indexed = self.component_manager.get_indexed_components(attr, value, "all")
+        if indexed is not None:
+            return indexed[0] if indexed else None
         return next((c for c in self if c.get_data(attr) == value), None)
 
     def get_components_by_attr(self, attr: str, value: Any) -> list[TC]:
+        indexed = self.component_manager.get_indexed_components(attr, value, "all")
+        if indexed is not None:
+            return indexed
         return [c for c in self if c.get_data(attr) == value]
 
     def get_next_component(self, component: TC) -> TC | None:
@@ -233,8 +294,7 @@ class Timeline(ABC, Generic[TC]):
     def delete_components(self, components: list[TC]) -> None:
         self._validate_delete_components(components)
 
-        for component in components:
-            self.component_manager.delete_component(component)
+        self.component_manager.delete_components(components)
 
     def _validate_delete_components(self, components: list[TC]) -> None:
         pass
@@ -271,13 +331,46 @@ class Timeline(ABC, Generic[TC]):
 
         return state
 
-    def get_state(self) -> dict:
-        """Creates a dict with timeline components and attributes."""
-        state = self._get_base_state()
-        state["components"] = self.component_manager.serialize_components()
-        state["components_hash"] = self.component_manager.hash_components()
+    def _is_base_state_outdated(self) -> bool:
+        if self._state is None:
+            return True
+        # Attributes are compared instead of tracked, as some are set directly
+        # and some lists (e.g. in the beat timeline) are modified in place.
+        for attr in self.SERIALIZABLE:
+            value = getattr(self, attr)
+            prev_value = self._state[attr]
+            if type(value) is not type(prev_value) or value != prev_value:
+                return True
+        return False
 
-        return state
+    def get_state(self) -> dict:
+        """
+        Creates a dict with timeline components and attributes.
+        If the timeline did not change since the last call, the same dict
+        is returned, so it must not be modified.
+        """
+        components = self.component_manager.serialize_components()
+        if (
+            self._is_base_state_outdated()
+            or self._state["components"] is not components
+        ):
+            self._state = self._get_base_state()
+            self._state["components"] = components
+            self._state["components_hash"] = self.component_manager.hash_components()
+
+        return self._state
+
+    def get_hash(self) -> str:
+        """
+        Returns the hash of the timeline attributes, as in get_state(),
+        without serializing components.
+        """
+        if self._is_base_state_outdated():
+            return self._get_base_state()["hash"]
+        return self._state["hash"]
+
+    def get_components_hash(self) -> str:
+        return self.component_manager.hash_components()
 
     def get_export_data(self) -> dict[str, Any]:
         result = self._get_base_state()
@@ -299,6 +392,12 @@ class Timeline(ABC, Generic[TC]):
     def update_component_order(self, component: TC):
         self.component_manager.update_component_order(component)
 
+    def update_component_index(self, component: TC, attr: str):
+        self.component_manager.update_component_index(component, attr)
+
+    def update_component_hash(self, component: TC):
+        self.component_manager.update_component_hash(component)
+
 
 class TimelineComponentManager(Generic[T, TC]):
     def __init__(
@@ -311,6 +410,43 @@ class TimelineComponentManager(Generic[T, TC]):
 
         self._components: list[TC] = []
         self.id_to_component: dict[int, TC] = {}
+        # Sort keys of self._components, in the same order.
+        # Keys are stored as they were when the component was last sorted,
+        # so components can be found even after their ordinal has changed.
+        self._ordinals: list[tuple] = []
+        self._id_to_ordinal: dict[int, tuple] = {}
+        # Neighbours of each component in self._components
+        self._id_to_next: dict[int, TC | None] = {}
+        self._id_to_previous: dict[int, TC | None] = {}
+        # Components of each kind, in the same order as self._components
+        self._kind_to_components: dict[ComponentKind, list[TC]] = {
+            kind: [] for kind in component_kinds
+        }
+        # Components by value of the attributes in their INDEXED_ATTRS.
+        # Lists are in the same order as self._components.
+        self._attr_indexes: dict[tuple[ComponentKind, str], dict[Any, list[TC]]] = {
+            (kind, attr): {}
+            for kind in component_kinds
+            for attr in get_component_class_by_kind(kind).INDEXED_ATTRS
+        }
+        self._id_to_indexed_values: dict[int, dict[str, Any]] = {}
+        # Sum of the hashes of all components, see hash_components()
+        self._components_hash = 0
+        self._id_to_hash_value: dict[int, int] = {}
+        # Components whose hash changed since the sum was last computed
+        self._id_to_outdated_hash: dict[int, TC] = {}
+        # Number of components of each kind at each position, for managers
+        # that require positions to be unique. See _get_position().
+        self._kind_to_position_counts: dict[ComponentKind, Counter] = {
+            kind: Counter() for kind in component_kinds
+        }
+        self._id_to_position: dict[int, Hashable] = {}
+        # Serialized data of each component, and of all of them, reused
+        # by serialize_components() until components change
+        self._id_to_serialized: dict[int, dict[str, Any]] = {}
+        self._serialized_components: dict[int, dict[str, Any]] | None = None
+        # Components whose data changed since they were last serialized
+        self._id_to_outdated_serialization: dict[int, TC] = {}
 
     def __iter__(self):
         return iter(self._components)
@@ -336,6 +472,31 @@ class TimelineComponentManager(Generic[T, TC]):
     def _validate_component_creation(self, *args, **kwargs):
         return True, ""
 
+    def _validate_components_creation(
+        self, kind: ComponentKind, rows: list[dict[str, Any]]
+    ) -> list[tuple[bool, str]]:
+        """
+        Validates rows as if they were created one after the other.
+        Rows with a position (see _get_row_position()) are validated
+        against existing positions and those of the valid rows before them.
+        """
+        component_class = self._get_component_class_by_kind(kind)
+        positions = set(self.get_existing_positions(kind))
+        results = []
+        for row in rows:
+            position = self._get_row_position(kind, row)
+            if position is None:
+                results.append(self._validate_component_creation(kind, **row))
+                continue
+            results.append(
+                component_class.validate_creation(
+                    **row, position=position, existing_positions=positions
+                )
+            )
+            if results[-1][0]:
+                positions.add(position)
+        return results
+
     def create_component(
         self, kind: ComponentKind, timeline, id, *args, **kwargs
     ) -> tuple[bool, TC | None, str]:
@@ -351,6 +512,28 @@ class TimelineComponentManager(Generic[T, TC]):
 
         return True, component, ""
 
+    def create_components(
+        self, kind: ComponentKind, timeline, ids: list[int], rows: list[dict[str, Any]]
+    ) -> list[tuple[bool, TC | None, str]]:
+        self._validate_component_kind(kind)
+        component_class = self._get_component_class_by_kind(kind)
+
+        results = []
+        components = []
+        for id, row, (valid, reason) in zip(
+            ids, rows, self._validate_components_creation(kind, rows), strict=True
+        ):
+            if not valid:
+                results.append((False, None, reason))
+                continue
+            component = component_class(timeline, id, **row)
+            components.append(component)
+            results.append((True, component, ""))
+
+        self._add_many_to_components(components)
+
+        return results
+
     def set_component_data(self, id: int, attr: str, value: Any):
         value, success = self.get_component(id).set_data(attr, value)
         if success:
@@ -373,15 +556,42 @@ class TimelineComponentManager(Generic[T, TC]):
     def get_component_by_attribute(
         self, attr_name: str, value: Any, kind: ComponentKind
     ):
+        indexed = self.get_indexed_components(attr_name, value, kind)
+        if indexed is not None:
+            return indexed[0] if indexed else None
         cmp_set = self._get_component_set_by_kind(kind)
         return self._get_component_from_set_by_attribute(cmp_set, attr_name, value)
 
     def get_components_by_attribute(
         self, attr_name: str, value: Any, kind: ComponentKind
     ) -> list:
+        indexed = self.get_indexed_components(attr_name, value, kind)
+        if indexed is not None:
+            return indexed
         cmp_set = self._get_component_set_by_kind(kind)
         return self._get_components_from_set_by_attribute(cmp_set, attr_name, value)
 
+    def get_indexed_components(
+        self, attr_name: str, value: Any, kind: ComponentKind | str
+    ) -> list[TC] | None:
+        """
+        Returns components of the given kind whose `attr_name` equals `value`,
+        in order. Returns None if `attr_name` is not indexed for that kind,
+        in which case callers should do a linear search.
+        """
+        kinds = self.component_kinds if kind == "all" else [kind]
+        if not all((k, attr_name) in self._attr_indexes for k in kinds):
+            return None
+
+        result = []
+        for k in kinds:
+            result += self._attr_indexes[(k, attr_name)].get(value, [])
+
+        if len(kinds) > 1:
+            result.sort(key=self._get_stored_ordinal)
+
+        return result
+
     def get_components_by_condition(
         self, condition: Callable[[TC], bool], kind: ComponentKind
     ) -> list:
@@ -395,30 +605,26 @@ class TimelineComponentManager(Generic[T, TC]):
         return self.id_to_component[id]
 
     def get_next_component(self, id: int) -> TC | None:
-        component_idx = self._components.index(self.get_component(id))
-        if component_idx == len(self._components) - 1:
-            return None
-        else:
-            return self._components[component_idx + 1]
+        return self._id_to_next[id]
 
     def get_previous_component(self, id: int) -> TC | None:
-        component_idx = self._components.index(self.get_component(id))
-        if component_idx == 0:
-            return None
-        else:
-            return self._components[component_idx - 1]
+        return self._id_to_previous[id]
 
     def get_previous_component_by_time(self, time: float) -> TC | None:
-        times = [cmp.get_data("time") for cmp in self]
-        component_idx = bisect.bisect_right(times, time)
+        # Expects components to be ordered by time
+        component_idx = bisect.bisect_right(
+            self._ordinals, time, key=operator.itemgetter(0)
+        )
         if component_idx == 0:
             return None
         else:
             return self._components[component_idx - 1]
 
     def get_next_component_by_time(self, time: float) -> TC | None:
-        times = [cmp.get_data("time") for cmp in self]
-        component_idx = bisect.bisect_right(times, time)
+        # Expects components to be ordered by time
+        component_idx = bisect.bisect_right(
+            self._ordinals, time, key=operator.itemgetter(0)
+        )
         if component_idx == len(self._components):
             return None
         else:
@@ -428,12 +634,12 @@ class TimelineComponentManager(Generic[T, TC]):
         cmp_set = self._get_component_set_by_kind(kind)
         return set([getattr(cmp, attr_name) for cmp in cmp_set])
 
-    def _get_component_set_by_kind(self, kind: ComponentKind) -> Set[TC]:
+    def _get_component_set_by_kind(self, kind: ComponentKind) -> list[TC]:
         if kind == "all":
-            return set(self._components)
-        cmp_class = self._get_component_class_by_kind(kind)
+            return self._components
+        self._validate_component_kind(kind)
 
-        return {cmp for cmp in self._components if isinstance(cmp, cmp_class)}
+        return self._kind_to_components[kind]
 
     def _get_component_class_by_kind(
         self, kind: ComponentKind
@@ -447,33 +653,208 @@ class TimelineComponentManager(Generic[T, TC]):
 
     @staticmethod
     def _get_component_from_set_by_attribute(
-        cmp_list: set, attr_name: str, value: Any
+        cmp_list: list, attr_name: str, value: Any
     ) -> Any | None:
         return next((c for c in cmp_list if getattr(c, attr_name) == value), None)
 
     @staticmethod
     def _get_components_from_set_by_attribute(
-        cmp_list: set, attr_name: str, value: Any
+        cmp_list: list, attr_name: str, value: Any
     ) -> list:
         return [c for c in cmp_list if getattr(c, attr_name) == value]
 
+    def _get_component_index(self, component: TC) -> int:
+        ordinal = self._id_to_ordinal[component.id]
+        index = bisect.bisect_left(self._ordinals, ordinal)
+        # Components may share ordinals, so we have to look for the
+        # right one among the ones with the same ordinal.
+        while self._components[index] is not component:
+            index += 1
+        return index
+
+    def _get_stored_ordinal(self, component: TC) -> tuple:
+        return self._id_to_ordinal[component.id]
+
+    def _insert_sorted(self, components: list[TC], component: TC) -> None:
+        """Inserts component in a subset of self._components, keeping its order."""
+        index = bisect.bisect_left(
+            components,
+            self._id_to_ordinal[component.id],
+            key=self._get_stored_ordinal,
+        )
+        components.insert(index, component)
+
+    def _remove_sorted(self, components: list[TC], component: TC) -> None:
+        """Removes component from a subset of self._components."""
+        index = bisect.bisect_left(
+            components,
+            self._id_to_ordinal[component.id],
+            key=self._get_stored_ordinal,
+        )
+        while components[index] is not component:
+            index += 1
+        components.pop(index)
+
+    def _add_to_attr_indexes(self, component: TC) -> None:
+        indexed_values = {}
+        for attr in component.INDEXED_ATTRS:
+            value = getattr(component, attr)
+            indexed_values[attr] = value
+            self._insert_sorted(
+                self._attr_indexes[(component.KIND, attr)].setdefault(value, []),
+                component,
+            )
+        self._id_to_indexed_values[component.id] = indexed_values
+
+    def _remove_from_attr_index(self, component: TC, attr: str) -> None:
+        index = self._attr_indexes[(component.KIND, attr)]
+        value = self._id_to_indexed_values[component.id][attr]
+        self._remove_sorted(index[value], component)
+        if not index[value]:
+            del index[value]
+
+    def _remove_from_attr_indexes(self, component: TC) -> None:
+        for attr in component.INDEXED_ATTRS:
+            self._remove_from_attr_index(component, attr)
+        del self._id_to_indexed_values[component.id]
+
+    def update_component_index(self, component: TC, attr: str) -> None:
+        self._remove_from_attr_index(component, attr)
+        value = getattr(component, attr)
+        self._id_to_indexed_values[component.id][attr] = value
+        self._insert_sorted(
+            self._attr_indexes[(component.KIND, attr)].setdefault(value, []),
+            component,
+        )
+
+    def _insert_in_order(self, component: TC) -> None:
+        ordinal = component.ordinal
+        index = bisect.bisect_left(self._ordinals, ordinal)
+        self._components.insert(index, component)
+        self._ordinals.insert(index, ordinal)
+        self._id_to_ordinal[component.id] = ordinal
+        self._link_neighbours(index)
+        self._insert_sorted(self._kind_to_components[component.KIND], component)
+        self._add_to_attr_indexes(component)
+
+    def _pop_from_order(self, component: TC) -> None:
+        self._remove_from_attr_indexes(component)
+        self._remove_sorted(self._kind_to_components[component.KIND], component)
+
+        index = self._get_component_index(component)
+        self._components.pop(index)
+        self._ordinals.pop(index)
+        self._id_to_ordinal.pop(component.id)
+        self._unlink_neighbours(component)
+
+    def _link_neighbours(self, index: int) -> None:
+        component = self._components[index]
+        previous = self._components[index - 1] if index > 0 else None
+        next_ = (
+            self._components[index + 1] if index < len(self._components) - 1 else None
+        )
+
+        self._id_to_previous[component.id] = previous
+        self._id_to_next[component.id] = next_
+        if previous is not None:
+            self._id_to_next[previous.id] = component
+        if next_ is not None:
+            self._id_to_previous[next_.id] = component
+
+    def _unlink_neighbours(self, component: TC) -> None:
+        previous = self._id_to_previous.pop(component.id)
+        next_ = self._id_to_next.pop(component.id)
+        if previous is not None:
+            self._id_to_next[previous.id] = next_
+        if next_ is not None:
+            self._id_to_previous[next_.id] = previous
+
     def _add_to_components(self, component: TC) -> None:
-        bisect.insort_left(self._components, component)
+        self._insert_in_order(component)
         self.id_to_component[component.id] = component
+        self._add_to_components_hash(component)
+        self._add_to_positions(component)
+        self._outdate_serialization(component)
+
+    def _add_many_to_components(self, components: list[TC]) -> None:
+        if not components:
+            return
+        for component in components:
+            self._components.append(component)
+            self.id_to_component[component.id] = component
+            self._id_to_indexed_values[component.id] = {
+                attr: getattr(component, attr) for attr in component.INDEXED_ATTRS
+            }
+            self._add_to_components_hash(component)
+            self._add_to_positions(component)
+            self._outdate_serialization(component)
+        # sorting once is faster than inserting each component in order
+        self.refresh_component_order()
 
     def _remove_from_components_set(self, component: TC) -> None:
         try:
-            self._components.remove(component)
+            self._pop_from_order(component)
             self.id_to_component.pop(component.id)
+            self._remove_from_components_hash(component)
+            self._remove_from_positions(component)
+            self._outdate_serialization(component)
         except KeyError as e:
             raise KeyError(
                 f"Can't remove component '{component}' from {self}: not in"
                 " self.components."
             ) from e
 
+    def _remove_many_from_components(self, components: list[TC]) -> None:
+        try:
+            for component in components:
+                self.id_to_component.pop(component.id)
+                self._remove_from_components_hash(component)
+                self._remove_from_positions(component)
+                self._outdate_serialization(component)
+                del self._id_to_indexed_values[component.id]
+        except KeyError as e:
+            raise KeyError(
+                f"Can't remove component '{component}' from {self}: not in"
+                " self.components."
+            ) from e
+        # rebuilding the list once is faster than removing each component
+        self._components = [c for c in self._components if c.id in self.id_to_component]
+        self.refresh_component_order()
+
     def update_component_order(self, component: TC):
-        self._components.remove(component)
-        bisect.insort_left(self._components, component)
+        self._pop_from_order(component)
+        self._insert_in_order(component)
+
+    def refresh_component_order(self) -> None:
+        """
+        Re-sorts all components. Must be called after setting ordering
+        attributes directly (i.e. not through `set_data`).
+        """
+        self._components.sort()
+        self._ordinals = [c.ordinal for c in self._components]
+        self._id_to_ordinal = {
+            c.id: ordinal
+            for c, ordinal in zip(self._components, self._ordinals, strict=True)
+        }
+        self._id_to_previous = {}
+        self._id_to_next = {}
+        previous = None
+        for component in self._components:
+            self._id_to_previous[component.id] = previous
+            if previous is not None:
+                self._id_to_next[previous.id] = component
+            previous = component
+        if previous is not None:
+            self._id_to_next[previous.id] = None
+        self._kind_to_components = {kind: [] for kind in self.component_kinds}
+        for index in self._attr_indexes.values():
+            index.clear()
+        for component in self._components:
+            self._kind_to_components[component.KIND].append(component)
+            for attr, value in self._id_to_indexed_values[component.id].items():
+                self._attr_indexes[(component.KIND, attr)].setdefault(value, []).append(
+                    component
+                )
 
     def delete_component(self, component: TC) -> None:
         stop_listening_to_all(component)
@@ -485,19 +866,134 @@ class TimelineComponentManager(Generic[T, TC]):
             component.id,
         )
 
+    def delete_components(self, components: list[TC]) -> None:
+        """
+        Deletes components at once. Much faster than calling
+        `delete_component` for each component.
+        """
+        if not components:
+            return
+        for component in components:
+            stop_listening_to_all(component)
+        self._remove_many_from_components(components)
+        post(
+            Post.TIMELINE_COMPONENTS_DELETED,
+            self.timeline.KIND,
+            self.timeline.id,
+            [component.id for component in components],
+        )
+
     def clear(self):
-        for component in self._components.copy():
-            self.delete_component(component)
+        self.delete_components(self._components.copy())
+
+    def _add_to_components_hash(self, component: TC) -> None:
+        # Component hashes are computed lazily, so the value
+        # is only added when hash_components() is called.
+        self._id_to_hash_value[component.id] = 0
+        self._id_to_outdated_hash[component.id] = component
+
+    def _remove_from_components_hash(self, component: TC) -> None:
+        value = self._id_to_hash_value.pop(component.id)
+        self._id_to_outdated_hash.pop(component.id, None)
+        self._components_hash = (self._components_hash - value) % HASH_MODULUS
+
+    def update_component_hash(self, component: TC) -> None:
+        if component.id not in self._id_to_hash_value:
+            # component is still being created
+            return
+        self._id_to_outdated_hash[component.id] = component
+        # positions are serializable, so they may have changed as well
+        self._update_position(component)
+        self._id_to_serialized.pop(component.id, None)
+        self._id_to_outdated_serialization[component.id] = component
+
+    def _get_position(self, component: TC) -> Hashable | None:
+        """
+        Returns what must be unique among components of the same kind
+        (e.g. their time), or None if they may share positions.
+        """
+        return None
 
-    def hash_components(self):
-        str_to_hash = ""
-        for component in self._components:
-            str_to_hash += component.hash + "|"
+    def _get_row_position(
+        self, kind: ComponentKind, row: dict[str, Any]
+    ) -> Hashable | None:
+        """
+        Returns the position (see _get_position()) of a component of `kind`
+        created with `row` as keyword arguments.
+        """
+        return None
 
-        return hash_function(str_to_hash)
+    def get_existing_positions(self, kind: ComponentKind) -> KeysView:
+        """Returns the positions of components of `kind`. See _get_position()."""
+        return self._kind_to_position_counts[kind].keys()
+
+    def _add_to_positions(self, component: TC) -> None:
+        position = self._get_position(component)
+        if position is None:
+            return
+        self._kind_to_position_counts[component.KIND][position] += 1
+        self._id_to_position[component.id] = position
+
+    def _remove_from_positions(self, component: TC) -> None:
+        if component.id not in self._id_to_position:
+            return
+        position = self._id_to_position.pop(component.id)
+        counts = self._kind_to_position_counts[component.KIND]
+        counts[position] -= 1
+        if not counts[position]:
+            del counts[position]
+
+    def _update_position(self, component: TC) -> None:
+        if self._id_to_position.get(component.id) != self._get_position(component):
+            self._remove_from_positions(component)
+            self._add_to_positions(component)
+
+    def hash_components(self):
+        # The hash of each component is added to (or subtracted from) the
+        # aggregate as components are created, deleted or modified, so
+        # this only depends on the number of components changed since
+        # the last call.
+        for id, component in self._id_to_outdated_hash.items():
+            value = int(component.hash, 16)
+            self._components_hash = (
+                self._components_hash - self._id_to_hash_value[id] + value
+            ) % HASH_MODULUS
+            self._id_to_hash_value[id] = value
+        self._id_to_outdated_hash.clear()
+
+        return f"{self._components_hash:032x}"
+
+    def _outdate_serialization(self, component: TC) -> None:
+        # components were created or deleted, so the dict is rebuilt
+        self._id_to_serialized.pop(component.id, None)
+        self._id_to_outdated_serialization.pop(component.id, None)
+        self._serialized_components = None
 
     def serialize_components(self):
-        return serialize.serialize_components(self._components)
+        """
+        Returns the serialized data of all components. Data of components
+        that did not change since the last call is reused, and if none
+        changed, the same dict is returned, so it must not be modified.
+        """
+        if self._serialized_components is None:
+            self._serialized_components = {}
+            for component in self._components:
+                data = self._id_to_serialized.get(component.id)
+                if data is None:
+                    data = serialize.serialize_component(component)
+                    self._id_to_serialized[component.id] = data
+                self._serialized_components[component.id] = data
+        elif self._id_to_outdated_serialization:
+            # Only data of existing components changed, so the previous
+            # dict is copied, which is much faster than rebuilding it.
+            self._serialized_components = self._serialized_components.copy()
+            for id, component in self._id_to_outdated_serialization.items():
+                data = serialize.serialize_component(component)
+                self._id_to_serialized[id] = data
+                self._serialized_components[id] = data
+        self._id_to_outdated_serialization.clear()
+
+        return self._serialized_components
 
     def deserialize_components(
         self, serialized_components: dict[int | str, dict[str, Any]]
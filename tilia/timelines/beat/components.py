@@ -43,6 +43,9 @@ class Beat(PointLikeTimelineComponent):
     def clear_cached_metric_position(self):
         self._cached_metric_position = None
 
+    def set_cached_metric_position(self, metric_position: MetricPosition):
+        self._cached_metric_position = metric_position
+
     @property
     def metric_position(self) -> MetricPosition:
         if self._cached_metric_position is None:
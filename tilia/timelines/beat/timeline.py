@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import functools
 import itertools
 import math
 from bisect import bisect
 from enum import Enum
 from math import isclose
-from typing import Any, cast
+from typing import Any, Sequence, cast
+
+import numpy as np
 
 import tilia.errors
 from tilia.requests import Get, Post, get, post
 from tilia.settings import settings
-from tilia.timelines.base.component.pointlike import crop_pointlike, scale_pointlike
+from tilia.timelines.base.component.pointlike import scale_pointlike
+from tilia.timelines.base.metric_position import MetricPosition
 from tilia.timelines.base.timeline import (
     TC,
     Timeline,
@@ -28,19 +30,19 @@ class BeatTLComponentManager(TimelineComponentManager):
     def __init__(self, timeline: BeatTimeline):
         super().__init__(timeline, [ComponentKind.BEAT])
         self.timeline = cast(BeatTimeline, self.timeline)
-        self.scale = functools.partial(scale_pointlike, self)
-        self.crop = functools.partial(crop_pointlike, self)
         self.compute_is_first_in_measure = True
-        self.compute_metric_fraction_dict = True
 
     @property
     def beat_times(self):
-        return {b.time for b in self._components}
+        return self.get_existing_positions(ComponentKind.BEAT)
+
+    def _get_position(self, component: Beat) -> float:
+        return component.time
 
     def update_is_first_in_measure_of_subsequent_beats(self, start_index):
-        self.compute_metric_fraction_dict = False
-        beats_that_start_measure = set(self.timeline.beats_that_start_measures)
-        for i, beat in enumerate(self.timeline[start_index:]):
+        start_index = max(start_index, 0)
+        beats_that_start_measure = self.timeline.beats_that_start_measures_set
+        for i, beat in enumerate(self._components[start_index:]):
             is_first_in_measure = start_index + i in beats_that_start_measure
             if is_first_in_measure != beat.is_first_in_measure:
                 self.timeline.set_component_data(
@@ -49,8 +51,7 @@ class BeatTLComponentManager(TimelineComponentManager):
                     is_first_in_measure,
                 )
 
-        self.compute_metric_fraction_dict = True
-        self.timeline.update_metric_fraction_dicts()
+        self.timeline.invalidate_metric_fraction_arrays()
 
     def create_component(
         self, kind: ComponentKind, timeline, id, *args, **kwargs
@@ -60,12 +61,18 @@ class BeatTLComponentManager(TimelineComponentManager):
         )
 
         if success:
-            self.timeline.recalculate_measures()
+            beat_index = self._get_component_index(beat)
+            first_changed_index = self.timeline.update_measures_after_insertion(
+                beat_index
+            )
             if self.compute_is_first_in_measure:
-                beat.is_first_in_measure = self.timeline.is_first_in_measure(beat)
-                beat_index = self.get_components().index(beat) + 1
-                self.update_is_first_in_measure_of_subsequent_beats(beat_index)
-                measure_index = self.timeline.get_measure_index(beat_index)[0]
+                beat.is_first_in_measure = (
+                    beat_index in self.timeline.beats_that_start_measures_set
+                )
+                self.update_is_first_in_measure_of_subsequent_beats(
+                    min(first_changed_index, beat_index + 1)
+                )
+                measure_index = self.timeline.get_measure_index(beat_index + 1)[0]
                 post(
                     Post.BEAT_TIMELINE_MEASURE_NUMBER_CHANGE_DONE,
                     self.timeline.id,
@@ -74,6 +81,34 @@ class BeatTLComponentManager(TimelineComponentManager):
 
         return success, beat, reason
 
+    def create_components(
+        self, kind: ComponentKind, timeline, ids: list[int], rows: list[dict[str, Any]]
+    ) -> list[tuple[bool, TC | None, str]]:
+        results = super().create_components(kind, timeline, ids, rows)
+        new_beats = {beat for success, beat, _ in results if success}
+        if not new_beats:
+            return results
+
+        first_index = min(self._get_component_index(beat) for beat in new_beats)
+        first_changed_index = self.timeline.update_measures_after_insertion(first_index)
+        if self.compute_is_first_in_measure:
+            for i, beat in enumerate(self._components[first_index:], first_index):
+                if beat in new_beats:
+                    beat.is_first_in_measure = (
+                        i in self.timeline.beats_that_start_measures_set
+                    )
+            self.update_is_first_in_measure_of_subsequent_beats(
+                min(first_changed_index, first_index + 1)
+            )
+            measure_index = self.timeline.get_measure_index(first_index + 1)[0]
+            post(
+                Post.BEAT_TIMELINE_MEASURE_NUMBER_CHANGE_DONE,
+                self.timeline.id,
+                measure_index - 1,
+            )
+
+        return results
+
     def _validate_component_creation(
         self,
         _: ComponentKind,
@@ -83,31 +118,80 @@ class BeatTLComponentManager(TimelineComponentManager):
     ):
         return Beat.validate_creation(time, self.beat_times)
 
+    def _validate_components_creation(self, _, rows):
+        # Validates all times at once. Reasons are only
+        # computed for the (usually few) invalid times.
+        times = np.array([row["time"] for row in rows], dtype=float)
+        is_in_bounds = (times >= 0) & (times <= get(Get.MEDIA_DURATION))
+        is_new = ~np.isin(times, self.timeline.get_beat_times())
+        is_first_occurrence = np.zeros(len(times), dtype=bool)
+        is_first_occurrence[np.unique(times, return_index=True)[1]] = True
+
+        is_valid = is_in_bounds & is_new & is_first_occurrence
+        if is_valid.all():
+            return [(True, "")] * len(rows)
+
+        existing_times = set(self.beat_times)
+        results = []
+        for row, valid in zip(rows, is_valid.tolist(), strict=True):
+            if valid:
+                results.append((True, ""))
+                existing_times.add(row["time"])
+            else:
+                results.append(Beat.validate_creation(row["time"], existing_times))
+        return results
+
     def delete_component(self, component: TC, update_is_first_in_measure=True) -> None:
-        component_idx = self.get_components().index(component)
+        component_idx = self._get_component_index(component)
         super().delete_component(component)
+        # beats after the deleted one have shifted
+        self.timeline.clear_cached_metric_positions(component_idx)
         if update_is_first_in_measure:
-            self.update_is_first_in_measure_of_subsequent_beats(component_idx - 1)
+            self.update_is_first_in_measure_of_subsequent_beats(component_idx)
 
     def set_component_data(self, id: int, attr: str, value: Any):
         value, success = super().set_component_data(id, attr, value)
-        if success and self.compute_metric_fraction_dict:
-            self.timeline.update_metric_fraction_dicts()
+        if success:
+            self.timeline.invalidate_metric_fraction_arrays()
         return value, success
 
+    def _add_to_components(self, component: Beat) -> None:
+        super()._add_to_components(component)
+        self.timeline.invalidate_beat_times()
+
+    def _remove_from_components_set(self, component: Beat) -> None:
+        super()._remove_from_components_set(component)
+        self.timeline.invalidate_beat_times()
+
+    def refresh_component_order(self) -> None:
+        # also called after adding or removing components in bulk
+        super().refresh_component_order()
+        self.timeline.invalidate_beat_times()
+
     def update_component_order(self, component: TC):
+        prev_index = self._get_component_index(component)
         super().update_component_order(component)
-        for component in self:
-            self.update_component_is_first_in_measure(component)
+        # called whenever a beat's time is set
+        self.timeline.invalidate_beat_times()
+        index = self._get_component_index(component)
+
+        # only beats between the previous and the new index have moved
+        start, end = sorted([prev_index, index])
+        for beat in self._components[start : end + 1]:
+            beat.clear_cached_metric_position()
+            self.update_component_is_first_in_measure(beat)
 
     def update_component_is_first_in_measure(self, component):
-        component.is_first_in_measure = self.timeline.is_first_in_measure(component)
+        component.is_first_in_measure = (
+            self._get_component_index(component)
+            in self.timeline.beats_that_start_measures_set
+        )
 
     def get_beats_in_measure(self, measure_index: int) -> list[Beat] | None:
         if self.timeline is None:
             raise ValueError("self.timeline is None.")
 
-        beats = self.get_components().copy()
+        beats = self._components
         measure_start = self.timeline.beats_that_start_measures[measure_index]
         measure_end = self.timeline.beats_that_start_measures[measure_index + 1]
         return beats[measure_start:measure_end]
@@ -133,17 +217,17 @@ class BeatTLComponentManager(TimelineComponentManager):
             )
 
     def scale(self, factor: float) -> None:
-        for beat in self._components:
-            self.timeline.set_component_data(beat.id, "time", beat.time * factor)
+        # scaling keeps the order of beats, so their
+        # metric positions do not change
+        scale_pointlike(self, factor)
 
     def crop(self, length: float) -> None:
-        for beat in self._components.copy():
-            if beat.time > length:
-                self.delete_component(beat)
-
-    def clear(self):
-        for component in self._components.copy():
-            self.delete_component(component, update_is_first_in_measure=False)
+        beats_to_delete = [beat for beat in self._components if beat.time > length]
+        if not beats_to_delete:
+            return
+        first_index = self._get_component_index(beats_to_delete[0])
+        self.delete_components(beats_to_delete)
+        self.update_is_first_in_measure_of_subsequent_beats(first_index - 1)
 
     def deserialize_components(self, serialized_components: dict[int, dict[str]]):
         # Storing these attributes so we can restore them below.
@@ -218,6 +302,34 @@ class BeatTimeline(Timeline):
         self._beats_in_measure = beats_in_measure or []
         self.measure_numbers = measure_numbers or []
         self.measures_to_force_display = measures_to_force_display or []
+        self.beats_that_start_measures = [0]
+        self.beats_that_start_measures_set = {0}
+
+        # Times of beats, in order. Rebuilt lazily after beats change.
+        self._beat_times: np.ndarray | None = None
+
+        # Lookup tables to convert between times and measures. They are
+        # built lazily, as beats may be changed many times in between.
+        # Sorted metric fractions of beats (i.e. measure number plus
+        # position in measure) without repetitions.
+        self._metric_fractions = np.array([])
+        # Beats and their times sorted by metric fraction. The ones with
+        # the i-th metric fraction are in [groups[i]:groups[i + 1]].
+        self._beats_by_metric_fraction: list[Beat] = []
+        self._beat_times_by_metric_fraction = np.array([])
+        self._metric_fraction_groups = np.array([0])
+        # Metric fractions of beats, in the same order as their times.
+        self._beat_metric_fractions = np.array([])
+        self._is_metric_fraction_arrays_outdated = True
+
+        # Times interpolated by get_time_by_measure, memoised by
+        # metric fraction and by time.
+        self._metric_fraction_to_interpolated_times: dict[float, list[float]] = {}
+        self._interpolated_time_to_metric_fraction: dict[float, float] = {}
+        # Beat and interpolated times sorted by time, with their metric
+        # fractions. Merged only when needed.
+        self._known_times: np.ndarray | None = None
+        self._known_metric_fractions: np.ndarray | None = None
 
     @property
     def default_height(self):
@@ -260,7 +372,7 @@ class BeatTimeline(Timeline):
         If fraction is supplied, returns interpolated time between measure's beats.
 
         `is_segment_end` should be set to `True` on the end of any segment-like components.
-        Searches for end points from the previous known beat even if the end point already exists in `metric_fraction_to_time`, since the actual end point might have a non-consecutive measure number to the start point.
+        Searches for end points from the previous known beat even if the end point has already been memoised, since the actual end point might have a non-consecutive measure number to the start point.
         """
 
         if not self.measure_count:
@@ -271,20 +383,24 @@ class BeatTimeline(Timeline):
             return []
 
         metric_fraction = round(number + fraction, 3)
-        keys = list(self.metric_fraction_to_beat_dict.keys())
+        self._update_metric_fraction_arrays_if_outdated()
+        keys = self._metric_fractions
 
         # make sure metric_fraction is within available beats
-        if min(keys) > metric_fraction or max(keys) < (
-            metric_fraction // 1 if not is_segment_end else metric_fraction - 1
+        if (
+            not len(keys)
+            or keys[0] > metric_fraction
+            or keys[-1]
+            < (metric_fraction // 1 if not is_segment_end else metric_fraction - 1)
         ):
             return []
 
-        idx = bisect(keys, metric_fraction)
+        idx = int(np.searchsorted(keys, metric_fraction, side="right"))
         if idx == 0:
             return []
 
         times = []
-        if beats := self.metric_fraction_to_time.get(metric_fraction):
+        if beats := self._get_known_times_by_metric_fraction(metric_fraction, idx):
             # check if the given metric_fraction has already been memoised
             # if found and is segment-like start, or point-like time, return because a second search will produce duplicates that should not be considered.
             # if found and idx == 1, given metric_fraction is equal to min metric_position of beats. return because no other times will be found through iteration.
@@ -297,9 +413,10 @@ class BeatTimeline(Timeline):
 
             times.extend(beats)
 
-        starts = self.metric_fraction_to_beat_dict[keys[idx - 1]]
-        start_measure = keys[idx - 1] // 1
-        start_metric_fraction = keys[idx - 1] % 1
+        start_key = float(keys[idx - 1])
+        starts = self._get_beats_by_metric_fraction_index(idx - 1)
+        start_measure = start_key // 1
+        start_metric_fraction = start_key % 1
         for start in starts:
             if next_comp := self.get_next_component(start.id):
                 end_time = next_comp.time
@@ -330,7 +447,7 @@ class BeatTimeline(Timeline):
             metric_fraction_diff = (end_metric_fraction - start_metric_fraction) % 1
 
             # interpolate between beats to get new time
-            new_time = start.time + (metric_fraction - keys[idx - 1]) / (
+            new_time = start.time + (metric_fraction - start_key) / (
                 metric_fraction_diff
                 if not isclose(metric_fraction_diff, 0, abs_tol=0.001)
                 else 1
@@ -346,37 +463,167 @@ class BeatTimeline(Timeline):
 
         if not is_segment_end:
             # don't memoise if not is_segment_end - interpolated times will contain beat numbers that don't actually exist.
-            self.metric_fraction_to_time[metric_fraction] = times
+            self._metric_fraction_to_interpolated_times[metric_fraction] = times.copy()
             for o in times:
-                self.time_to_metric_fraction[o] = metric_fraction
-            self.__sort_metric_to_time()
-            self.__sort_time_to_metric()
+                self._interpolated_time_to_metric_fraction[o] = metric_fraction
+            self._known_times = None
         return sorted(times)
 
+    def get_times_by_measures(
+        self,
+        numbers: Sequence[int] | np.ndarray,
+        fractions: Sequence[float] | np.ndarray | None = None,
+        is_segment_end: bool = False,
+    ) -> list[list[float]]:
+        """
+        Same as calling `get_time_by_measure` for each measure number and
+        fraction pair, but much faster when many of them fall on beats.
+        """
+        numbers = np.asarray(numbers, dtype=float)
+        if not len(numbers):
+            return []
+        if not self.measure_count:
+            raise ValueError("No beats in timeline. Can't get time.")
+
+        fractions = (
+            np.zeros(len(numbers))
+            if fractions is None
+            else np.asarray(fractions, dtype=float)
+        )
+        # rounded with python's round to match get_time_by_measure
+        metric_fractions = np.array(
+            [
+                round(n + f, 3)
+                for n, f in zip(numbers.tolist(), fractions.tolist(), strict=True)
+            ],
+            dtype=float,
+        )
+
+        self._update_metric_fraction_arrays_if_outdated()
+        keys = self._metric_fractions
+        indices = np.searchsorted(keys, metric_fractions, side="right")
+        is_on_beat = (
+            (indices > 0)
+            & (keys[np.maximum(indices - 1, 0)] == metric_fractions)
+            & (fractions >= 0)
+            & (fractions <= 1)
+            if len(keys)
+            else np.zeros(len(numbers), dtype=bool)
+        )
+        if is_segment_end:
+            # segment ends may also be found between beats
+            is_on_beat &= indices == 1
+
+        result = []
+        for i, on_beat in enumerate(is_on_beat.tolist()):
+            if on_beat:
+                result.append(
+                    self._get_beat_times_by_metric_fraction_index(indices[i] - 1)
+                )
+            else:
+                result.append(
+                    self.get_time_by_measure(
+                        numbers[i].item(), fractions[i].item(), is_segment_end
+                    )
+                )
+        return result
+
+    def _get_beats_by_metric_fraction_index(self, index: int) -> list[Beat]:
+        groups = self._metric_fraction_groups
+        return self._beats_by_metric_fraction[groups[index] : groups[index + 1]]
+
+    def _get_beat_times_by_metric_fraction_index(self, index: int) -> list[float]:
+        groups = self._metric_fraction_groups
+        return self._beat_times_by_metric_fraction[
+            groups[index] : groups[index + 1]
+        ].tolist()
+
+    def _get_known_times_by_metric_fraction(
+        self, metric_fraction: float, idx: int
+    ) -> list[float]:
+        """
+        Returns times of beats at `metric_fraction` or, if there are none,
+        times previously interpolated for it. `idx` is where
+        `metric_fraction` would be inserted in `self._metric_fractions`.
+        """
+        if idx > 0 and self._metric_fractions[idx - 1] == metric_fraction:
+            return self._get_beat_times_by_metric_fraction_index(idx - 1)
+        return self._metric_fraction_to_interpolated_times.get(
+            metric_fraction, []
+        ).copy()
+
     def get_metric_fraction_by_time(self, time: float) -> float:
-        if mf := self.time_to_metric_fraction.get(time):
-            return mf
-        times = list(self.time_to_metric_fraction.keys())
-        metric_fraction = list(self.time_to_metric_fraction.values())
-        idx = bisect(times, time)
+        times, metric_fraction = self._get_known_times_and_metric_fractions()
+        idx = int(np.searchsorted(times, time, side="right"))
         if idx == 0:
             if len(times):
-                return metric_fraction[0]
+                return metric_fraction[0].item()
             return 0
         if idx == len(times) or metric_fraction[idx] < metric_fraction[idx - 1]:
-            return metric_fraction[idx - 1]
-        return (time - times[idx - 1]) / (times[idx] - times[idx - 1]) * (
-            metric_fraction[idx] - metric_fraction[idx - 1]
-        ) + metric_fraction[idx - 1]
+            return metric_fraction[idx - 1].item()
+        return (
+            (time - times[idx - 1])
+            / (times[idx] - times[idx - 1])
+            * (metric_fraction[idx] - metric_fraction[idx - 1])
+            + metric_fraction[idx - 1]
+        ).item()
+
+    def _get_known_times_and_metric_fractions(self) -> tuple[np.ndarray, np.ndarray]:
+        self._update_metric_fraction_arrays_if_outdated()
+        if self._known_times is None:
+            interpolated_times = np.array(
+                list(self._interpolated_time_to_metric_fraction), dtype=float
+            )
+            interpolated_metric_fractions = np.array(
+                list(self._interpolated_time_to_metric_fraction.values()), dtype=float
+            )
+            # interpolated times take precedence over beats at the same time
+            beat_times = self.get_beat_times()
+            is_kept = ~np.isin(beat_times, interpolated_times)
+            times = np.concatenate([beat_times[is_kept], interpolated_times])
+            metric_fractions = np.concatenate(
+                [self._beat_metric_fractions[is_kept], interpolated_metric_fractions]
+            )
+            order = np.argsort(times, kind="stable")
+            self._known_times = times[order]
+            self._known_metric_fractions = metric_fractions[order]
+
+        return self._known_times, self._known_metric_fractions
 
     def is_first_in_measure(self, beat):
-        return self.components.index(beat) in self.beats_that_start_measures_set
+        return self.get_beat_index(beat) in self.beats_that_start_measures_set
 
-    def clear_cached_metric_positions(self):
-        for beat in self:
+    def clear_cached_metric_positions(self, start_index: int = 0):
+        for beat in self.component_manager._components[start_index:]:
             beat.clear_cached_metric_position()
 
     def recalculate_measures(self):
+        self._fit_measures_to_beat_count()
+        self.clear_cached_metric_positions()
+        self.update_beats_that_start_measures()
+
+    def update_measures_after_insertion(self, beat_index: int) -> int:
+        """
+        Updates measures after beats are inserted at or after `beat_index`.
+        Only the last measures get new beats, so only measures from there
+        onwards are recalculated. Returns the index of the first beat
+        whose metric position has changed.
+        """
+        first_changed_measure = self._fit_measures_to_beat_count()
+        self.update_beats_that_start_measures(first_changed_measure)
+        first_changed_index = min(
+            beat_index, self.beats_that_start_measures[first_changed_measure]
+        )
+        self.clear_cached_metric_positions(first_changed_index)
+        return first_changed_index
+
+    def _fit_measures_to_beat_count(self) -> int:
+        """
+        Adds or removes beats from the last measures so that there is a
+        place for every beat. Returns the index of the first measure that
+        may have changed.
+        """
+        prev_measure_count = self.measure_count
         beat_delta = (len(self)) - sum(self.beats_in_measure)
         if beat_delta > 0:
             self.extend_beats_in_measure(beat_delta)
@@ -385,8 +632,7 @@ class BeatTimeline(Timeline):
             self.reduce_beats_in_measure(-beat_delta)
             self.reduce_measure_numbers()
 
-        self.clear_cached_metric_positions()
-        self.update_beats_that_start_measures()
+        return max(min(prev_measure_count, self.measure_count) - 1, 0)
 
     @staticmethod
     def get_extension_from_beat_pattern(
@@ -511,70 +757,148 @@ class BeatTimeline(Timeline):
             ):
                 self.measures_to_force_display.pop(-1)
 
-    def update_beats_that_start_measures(self):
-        # noinspection PyAttributeOutsideInit
-        self.beats_that_start_measures = [0] + list(
-            itertools.accumulate(self.beats_in_measure[:-1])
-        )
-        self.beats_that_start_measures_set = set(self.beats_that_start_measures)
-        self.update_metric_fraction_dicts()
-
-    def update_metric_fraction_dicts(self):
-        self.metric_fraction_to_beat_dict = {}
-        self.metric_fraction_to_time = {}
-        self.time_to_metric_fraction = {}
-        for beat in self.components:
-            metric_fraction = round(
-                (mp := beat.metric_position).measure
-                + (mp.beat - 1) / mp.measure_beat_count,
-                3,
+    def update_beats_that_start_measures(self, start_measure: int = 0):
+        """
+        Updates the indices of beats that start measures from
+        `start_measure` onwards. Earlier indices are kept.
+        """
+        start_measure = min(start_measure, len(self.beats_that_start_measures) - 1)
+        kept = self.beats_that_start_measures[: start_measure + 1]
+        for index in self.beats_that_start_measures[start_measure + 1 :]:
+            self.beats_that_start_measures_set.discard(index)
+
+        extension = list(
+            itertools.accumulate(
+                self.beats_in_measure[start_measure:-1], initial=kept[-1]
             )
-            if mp := self.metric_fraction_to_beat_dict.get(metric_fraction):
-                mp.append(beat)
-                self.metric_fraction_to_time[metric_fraction].append(beat.time)
-                self.time_to_metric_fraction[beat.time] = metric_fraction
-            else:
-                self.metric_fraction_to_beat_dict[metric_fraction] = [beat]
-                self.metric_fraction_to_time[metric_fraction] = [beat.time]
-                self.time_to_metric_fraction[beat.time] = metric_fraction
-        self.__sort_metric_to_beat()
-        self.__sort_metric_to_time()
-        self.__sort_time_to_metric()
-
-    def __sort_metric_to_beat(self) -> None:
-        self.metric_fraction_to_beat_dict = {
-            k: self.metric_fraction_to_beat_dict[k]
-            for k in sorted(self.metric_fraction_to_beat_dict.keys())
-        }
+        )[1:]
+        self.beats_that_start_measures = kept + extension
+        self.beats_that_start_measures_set.update(extension)
+        self.invalidate_metric_fraction_arrays()
+
+    def get_beat_times(self) -> np.ndarray:
+        """Returns the times of all beats, in order. Must not be modified."""
+        if self._beat_times is None:
+            self._beat_times = np.array(
+                [beat.time for beat in self.component_manager._components],
+                dtype=float,
+            )
+            self._beat_times.flags.writeable = False
+        return self._beat_times
 
-    def __sort_metric_to_time(self) -> None:
-        self.metric_fraction_to_time = {
-            k: self.metric_fraction_to_time[k]
-            for k in sorted(self.metric_fraction_to_time.keys())
-        }
+    def invalidate_beat_times(self):
+        self._beat_times = None
+        self.invalidate_metric_fraction_arrays()
 
-    def __sort_time_to_metric(self) -> None:
-        self.time_to_metric_fraction = {
-            k: self.time_to_metric_fraction[k]
-            for k in sorted(self.time_to_metric_fraction.keys())
-        }
+    def get_closest_beat_index(self, time: float) -> int:
+        """
+        Returns the index of the beat closest to `time`. Ties go to the
+        earlier beat. Expects the timeline to have beats.
+        """
+        beat_times = self.get_beat_times()
+        index = int(beat_times.searchsorted(time, side="right"))
+        if index == 0:
+            return 0  # time is before first beat
+        elif index == len(beat_times):
+            return index - 1  # time is after last beat
+        elif abs(time - beat_times[index - 1]) <= abs(time - beat_times[index]):
+            return index - 1
+        else:
+            return index
+
+    def get_closest_beat_indices(self, times: Sequence[float]) -> np.ndarray:
+        """
+        Returns the index of the beat closest to each time. Ties go to the
+        earlier beat. Expects the timeline to have beats.
+        """
+        beat_times = self.get_beat_times()
+        times = np.asarray(times, dtype=float)
+        next_indices = np.searchsorted(beat_times, times, side="right")
+        # times before the first or after the last beat get that beat
+        prev_indices = np.maximum(next_indices - 1, 0)
+        next_indices = np.minimum(next_indices, len(beat_times) - 1)
+        is_prev_closer = np.abs(times - beat_times[prev_indices]) <= np.abs(
+            times - beat_times[next_indices]
+        )
+        return np.where(is_prev_closer, prev_indices, next_indices)
+
+    def get_metric_position(self, time: float) -> MetricPosition:
+        """Returns the metric position of the beat closest to `time`."""
+        beats = self.component_manager._components
+        return beats[self.get_closest_beat_index(time)].metric_position
+
+    def get_metric_positions(self, times: Sequence[float]) -> list[MetricPosition]:
+        """Returns the metric position of the beat closest to each time."""
+        beats = self.component_manager._components
+        return [
+            beats[i].metric_position
+            for i in self.get_closest_beat_indices(times).tolist()
+        ]
+
+    def invalidate_metric_fraction_arrays(self):
+        self._is_metric_fraction_arrays_outdated = True
+
+    def _update_metric_fraction_arrays_if_outdated(self):
+        if self._is_metric_fraction_arrays_outdated:
+            self.update_metric_fraction_arrays()
+
+    def update_metric_fraction_arrays(self):
+        self._is_metric_fraction_arrays_outdated = False
+
+        self.update_cached_metric_positions()
+        beats = self.components
+        metric_fractions = np.array(
+            [
+                round(mp.measure + (mp.beat - 1) / mp.measure_beat_count, 3)
+                for mp in (beat.metric_position for beat in beats)
+            ],
+            dtype=float,
+        )
+        times = self.get_beat_times()
+
+        order = np.argsort(metric_fractions, kind="stable")
+        self._metric_fractions, group_starts = np.unique(
+            metric_fractions[order], return_index=True
+        )
+        self._metric_fraction_groups = np.append(group_starts, len(beats))
+        self._beats_by_metric_fraction = [beats[i] for i in order.tolist()]
+        self._beat_times_by_metric_fraction = times[order]
+        self._beat_metric_fractions = metric_fractions
+
+        self._metric_fraction_to_interpolated_times = {}
+        self._interpolated_time_to_metric_fraction = {}
+        self._known_times = None
+        self._known_metric_fractions = None
 
     def get_measure_index(self, beat_index: int) -> tuple[int, int]:
-        prev_n = 0
-        for measure_index, n in enumerate(self.beats_that_start_measures):
-            if beat_index < n:
-                return measure_index - 1, beat_index - prev_n
-            elif beat_index == n:
-                return measure_index, 0
-            prev_n = n
-
-        if beat_index > n:
-            return measure_index, 1
-        else:
+        """
+        Returns the index of the measure of the beat at `beat_index` and
+        the index of the beat in that measure.
+        """
+        if beat_index < 0:
             raise ValueError(f'No beat with index "{beat_index}" at {self}.')
+        measure_index = bisect(self.beats_that_start_measures, beat_index) - 1
+        return (
+            measure_index,
+            beat_index - self.beats_that_start_measures[measure_index],
+        )
 
     def get_beat_index(self, beat: Beat) -> int:
-        return self.components.index(beat)
+        return self.component_manager._get_component_index(beat)
+
+    def update_cached_metric_positions(self):
+        """Computes the metric position of every beat in a single pass."""
+        beats = self.component_manager._components
+        measure_starts = self.beats_that_start_measures + [len(beats)]
+        for measure_index, (start, end) in enumerate(
+            itertools.pairwise(measure_starts)
+        ):
+            measure_number = self.measure_numbers[measure_index]
+            beat_count = self.beats_in_measure[measure_index]
+            for beat_number, beat in enumerate(beats[start:end], 1):
+                beat.set_cached_metric_position(
+                    MetricPosition(measure_number, beat_number, beat_count)
+                )
 
     def propagate_measure_number_change(self, start_index: int):
         for j in range(len(self.measure_numbers[start_index + 1 :])):
@@ -593,7 +917,7 @@ class BeatTimeline(Timeline):
         if not number == 0:
             self.force_display_measure_number(measure_index)
         post(Post.BEAT_TIMELINE_MEASURE_NUMBER_CHANGE_DONE, self.id, measure_index)
-        self.update_metric_fraction_dicts()
+        self.invalidate_metric_fraction_arrays()
 
     def reset_measure_number(self, measure_index: int) -> None:
         self.clear_cached_metric_positions()
@@ -604,7 +928,7 @@ class BeatTimeline(Timeline):
                 self.measure_numbers[measure_index - 1] + 1
             )
         self.propagate_measure_number_change(measure_index)
-        self.update_metric_fraction_dicts()
+        self.invalidate_metric_fraction_arrays()
 
         try:
             self.unforce_display_measure_number(measure_index)
@@ -633,15 +957,19 @@ class BeatTimeline(Timeline):
     def delete_components(self, components: list[TC]) -> None:
         self._validate_delete_components(components)
 
-        self.clear_cached_metric_positions()
+        first_index = min(
+            (self.component_manager._get_component_index(c) for c in components),
+            default=0,
+        )
 
-        for component in list(reversed(components)):
-            self.component_manager.delete_component(
-                component, update_is_first_in_measure=False
-            )
+        self.component_manager.delete_components(components)
+        # beats after the first deleted one have shifted
+        self.clear_cached_metric_positions(first_index)
 
         if not self.is_empty:
-            self.component_manager.update_is_first_in_measure_of_subsequent_beats(0)
+            self.component_manager.update_is_first_in_measure_of_subsequent_beats(
+                first_index
+            )
             post(Post.BEAT_TIMELINE_MEASURE_NUMBER_CHANGE_DONE, self.id, 0)
 
             # Higher index is possible.
@@ -650,20 +978,27 @@ class BeatTimeline(Timeline):
         BY_AMOUNT = 0
         BY_INTERVAL = 1
 
-    def fill_with_beats(self, method: BeatTimeline.FillMethod, value: int | float):
-        duration = get(Get.MEDIA_DURATION)
-        self.component_manager.compute_is_first_in_measure = False
-        # only compute at end
-
+    @staticmethod
+    def get_fill_times(
+        method: BeatTimeline.FillMethod, value: int | float, duration: float
+    ) -> np.ndarray:
+        """
+        Returns the times of the beats that fill `duration` with `value`
+        beats (if filling by amount) or with beats `value` seconds apart
+        (if filling by interval).
+        """
         if method == BeatTimeline.FillMethod.BY_AMOUNT:
-            for i in range(value):
-                self.create_component(ComponentKind.BEAT, i * duration / value)
+            return np.arange(value) * duration / value
         elif method == BeatTimeline.FillMethod.BY_INTERVAL:
-            for i in range(math.floor(duration / value)):
-                self.create_component(ComponentKind.BEAT, i * value)
+            return np.arange(math.floor(duration / value)) * value
+        else:
+            return np.array([])
 
-        self.component_manager.compute_is_first_in_measure = True
-        self.component_manager.update_is_first_in_measure_of_subsequent_beats(0)
+    def fill_with_beats(self, method: BeatTimeline.FillMethod, value: int | float):
+        times = self.get_fill_times(method, value, get(Get.MEDIA_DURATION))
+        self.create_components(
+            ComponentKind.BEAT, [{"time": t} for t in times.tolist()]
+        )
 
     def add_measure_zero(self, fraction_of_measure_one: float) -> tuple[bool, str]:
         if self.measure_count < 2:
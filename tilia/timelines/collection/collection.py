@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import copy
-from bisect import bisect
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 from tilia.exceptions import TimelineValidationError
 from tilia.requests import Get, Post, get, post, serve
@@ -28,6 +27,7 @@ class Timelines:
     def __init__(self, app: App):
         self._app = app
         self._timelines: list[Timeline] = []
+        self._kind_to_timelines: dict[TimelineKind, list[Timeline]] = {}
         self.cached_media_duration = 0.0
 
         self._setup_requests()
@@ -56,6 +56,7 @@ class Timelines:
             (Get.TIMELINE_BY_ATTR, self.get_timeline_by_attr),
             (Get.TIMELINES_BY_ATTR, self.get_timelines_by_attr),
             (Get.METRIC_POSITION, self.get_metric_position),
+            (Get.METRIC_POSITIONS, self.get_metric_positions),
         }
 
         for request, callback in SERVES:
@@ -63,7 +64,7 @@ class Timelines:
 
     @property
     def timeline_kinds(self):
-        return {tl.KIND for tl in self._timelines}
+        return set(self._kind_to_timelines)
 
     @property
     def is_empty(self):
@@ -144,9 +145,14 @@ class Timelines:
         return sorted(self._timelines)
 
     def get_timeline_by_attr(self, attr: str, value: Any):
+        if attr == "KIND":
+            timelines = self._kind_to_timelines.get(value)
+            return timelines[0] if timelines else None
         return next((tl for tl in self if getattr(tl, attr) == value), None)
 
     def get_timelines_by_attr(self, attr: str, value: Any):
+        if attr == "KIND":
+            return self._kind_to_timelines.get(value, []).copy()
         return [tl for tl in self if getattr(tl, attr) == value]
 
     def set_timeline_data(self, id: int, attr: str, value: Any):
@@ -195,6 +201,7 @@ class Timelines:
 
     def _add_to_timelines(self, timeline: Timeline) -> None:
         self._timelines.append(timeline)
+        self._kind_to_timelines.setdefault(timeline.KIND, []).append(timeline)
         # we don't have to update ordinal of any timeline because
         # we are inserting the new timeline at the end of the list
         # and giving it the next ordinal value
@@ -202,6 +209,9 @@ class Timelines:
     def _remove_from_timelines(self, timeline: Timeline) -> None:
         try:
             self._timelines.remove(timeline)
+            self._kind_to_timelines[timeline.KIND].remove(timeline)
+            if not self._kind_to_timelines[timeline.KIND]:
+                del self._kind_to_timelines[timeline.KIND]
             # update ordinal of all timelines that came after the removed timeline
             for tl in self:
                 if tl.ordinal > timeline.ordinal:
@@ -219,6 +229,20 @@ class Timelines:
             if TimelineFlag.NOT_EXPORTABLE not in tl.FLAGS
         ]
 
+    def get_hash(self) -> str:
+        """Returns the hash of the timelines, as in serialize_timelines()."""
+        return hash_function("|".join([tl.get_hash() for tl in self]))
+
+    def get_hashes(self) -> dict[str, dict[str, str]]:
+        """
+        Returns the hashes of each timeline and of its components, as in
+        serialize_timelines(), without serializing components.
+        """
+        return {
+            tl.id: {"hash": tl.get_hash(), "components_hash": tl.get_components_hash()}
+            for tl in self
+        }
+
     def serialize_timelines(self):
         state = {tl.id: tl.get_state() for tl in self}
         hash = hash_function("|".join([tl_data["hash"] for tl_data in state.values()]))
@@ -265,6 +289,17 @@ class Timelines:
     def get_timeline_ids(self):
         return [tl.id for tl in self]
 
+    def has_id(self, id: str) -> bool:
+        """Returns True if a timeline or a timeline component has `id`."""
+        return any(
+            tl.id == id
+            or (
+                tl.component_manager is not None
+                and id in tl.component_manager.id_to_component
+            )
+            for tl in self._timelines
+        )
+
     def has_timeline_of_kind(self, kind: TlKind):
         return kind in self.timeline_kinds
 
@@ -308,6 +343,7 @@ class Timelines:
     def scale_timeline_components(self, factor: float) -> None:
         for tl in [tl for tl in self if hasattr(tl, "scale")]:
             tl.scale(factor)
+        post(Post.TIMELINES_SCALE_DONE)
 
     def crop_timeline_components(self, new_length: float) -> None:
         for tl in [tl for tl in self if hasattr(tl, "crop")]:
@@ -324,28 +360,24 @@ class Timelines:
             return None
 
     def get_metric_position(self, time: float) -> MetricPosition | None:
-        if not self.get_timelines_by_attr("KIND", TimelineKind.BEAT_TIMELINE):
-            return None
         tl = self.get_beat_timeline_for_measure_calculation()
-        if not tl:
-            return None
-        beats = tl.components
-        if not beats:
+        if not tl or tl.is_empty:
             return None
-        times = [beat.get_data("time") for beat in beats]
 
-        time_idx = bisect(times, time)  # returns the index where the time would go
+        return tl.get_metric_position(time)
 
-        if time_idx == 0:
-            closest_beat = beats[0]  # time is before first beat, get first beat
-        elif time_idx == len(beats):
-            closest_beat = beats[-1]  # time is after last beat, get last beat
-        elif abs(time - times[time_idx - 1]) <= abs(time - times[time_idx]):
-            closest_beat = beats[time_idx - 1]  # previous beat is closer
-        else:
-            closest_beat = beats[time_idx]  # next beat is closer
+    def get_metric_positions(
+        self, times: Sequence[float]
+    ) -> list[MetricPosition | None]:
+        """
+        Returns the metric position of the beat closest to each time, or
+        None for all of them if there are no beats to measure with.
+        """
+        tl = self.get_beat_timeline_for_measure_calculation()
+        if not tl or tl.is_empty:
+            return [None] * len(times)
 
-        return closest_beat.metric_position
+        return tl.get_metric_positions(times)
 
     def clear(self):
         for timeline in self._timelines.copy():
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 from typing import TYPE_CHECKING, Literal
 
@@ -9,7 +10,10 @@ import tilia.errors
 from tilia.timelines.base.component import PointLikeTimelineComponent
 from tilia.timelines.base.validators import validate_string, validate_time
 from tilia.timelines.component_kinds import ComponentKind
-from tilia.timelines.harmony.constants import get_inversion_amount
+from tilia.timelines.harmony.constants import (
+    PARAMS_FROM_TEXT_CACHE_SIZE,
+    get_inversion_amount,
+)
 from tilia.timelines.harmony.validators import (
     validate_accidental,
     validate_applied_to,
@@ -134,13 +138,37 @@ class Harmony(PointLikeTimelineComponent):
         self._inversion = value
 
 
-def get_params_from_text(text: str, key: str):
+def get_params_from_text(text: str, key: music21.key.Key | str | None):
+    """
+    Returns the harmony params for a letter symbol or a roman numeral in the
+    given key. Results are cached, as parsing the text with music21 is slow.
+    """
+    params = _get_params_from_text(text, _get_key_for_text(text, key))
+    if params is None:
+        return False, None
+
+    return True, params.copy()
+
+
+def _get_key_for_text(
+    text: str, key: music21.key.Key | str | None
+) -> music21.key.Key | str | None:
+    # Only roman numerals depend on the key,
+    # so letter symbols are cached once for all keys.
+    if not _extract_prefixed_accidental(text)[0].startswith(("I", "i", "V", "v")):
+        return None
+    if isinstance(key, music21.key.Key):
+        return key.tonicPitchNameWithCase
+    return key
+
+
+@functools.lru_cache(maxsize=PARAMS_FROM_TEXT_CACHE_SIZE)
+def _get_params_from_text(text: str, key: str | None) -> dict | None:
     music21_object, object_type = _get_music21_object_from_text(text, key)
     if not object_type:
-        return False, None
+        return None
 
-    params = _get_params_from_music21_object(music21_object, object_type)
-    return True, params
+    return _get_params_from_music21_object(music21_object, object_type)
 
 
 SPECIAL_ABBREVIATIONS_TO_QUALITY = {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import music21
@@ -7,6 +8,7 @@ import music21
 from tilia.timelines.base.component import PointLikeTimelineComponent
 from tilia.timelines.base.validators import validate_string, validate_time
 from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.harmony.constants import PARAMS_FROM_TEXT_CACHE_SIZE
 from tilia.timelines.harmony.validators import (
     validate_accidental,
     validate_level,
@@ -73,7 +75,17 @@ class Mode(PointLikeTimelineComponent):
         accidental_symbol = Accidental.get_from_int(
             "music21", self.get_data("accidental")
         )
-        return music21.key.Key(tonic_symbol + accidental_symbol)
+        return get_key(tonic_symbol + accidental_symbol)
+
+
+@functools.cache
+def get_key(symbol: str) -> music21.key.Key:
+    """
+    Returns the music21 key for the given symbol. Keys are cached, as
+    building them is slow and there are few distinct ones. Returned keys
+    are shared, so they must not be modified.
+    """
+    return music21.key.Key(symbol)
 
 
 def _format_postfix_accidental(text):
@@ -85,11 +97,24 @@ def _format_postfix_accidental(text):
 
 
 def get_params_from_text(text):
+    """
+    Returns the mode params for the given key symbol.
+    Results are cached, as parsing the text with music21 is slow.
+    """
+    params = _get_params_from_text(text)
+    if params is None:
+        return False, None
+
+    return True, params.copy()
+
+
+@functools.lru_cache(maxsize=PARAMS_FROM_TEXT_CACHE_SIZE)
+def _get_params_from_text(text: str) -> dict | None:
     success, music21_object = _get_music21_object_from_text(text)
     if not success:
-        return False, None
+        return None
 
-    return True, _get_params_from_music21_object(music21_object)
+    return _get_params_from_music21_object(music21_object)
 
 
 def _get_music21_object_from_text(text):
@@ -101,7 +126,9 @@ def _get_music21_object_from_text(text):
         try:
             return True, music21.key.Key(text)
         except ValueError:
-            return False, None
+            pass
+
+    return False, None
 
 
 def _get_params_from_music21_object(obj: music21.key.Key):
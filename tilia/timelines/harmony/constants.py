@@ -3,6 +3,8 @@ HARMONY_DISPLAY_MODES = ["letter", "roman", "custom"]
 HARMONY_ACCIDENTALS = [2, 1, 0, -1, -2]
 MODE_TYPES = ["major", "minor"]
 FONT_TYPES = ["analytic", "normal"]
+# Number of parsed symbols kept by get_params_from_text()
+PARAMS_FROM_TEXT_CACHE_SIZE = 1024
 # Names are taken from music21.harmony.CHORD_TYPES
 HARMONY_QUALITIES = [
     "major",
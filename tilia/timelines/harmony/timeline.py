@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 import math
-from bisect import bisect
+from bisect import bisect, bisect_left
 from typing import Any
 
 import music21
@@ -19,6 +19,7 @@ from tilia.timelines.base.timeline import (
 from tilia.timelines.base.validators import validate_positive_integer
 from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.harmony.components import Harmony, Mode
+from tilia.timelines.harmony.components.mode import get_key
 from tilia.timelines.harmony.validators import validate_level_count
 from tilia.timelines.timeline_kinds import TimelineKind
 
@@ -29,6 +30,57 @@ class HarmonyTLComponentManager(TimelineComponentManager):
         self.is_deserializing = False
         self.crop = functools.partial(crop_pointlike, self)
         self.scale = functools.partial(scale_pointlike, self)
+        # Times and components of each kind, sorted by time.
+        # Built lazily, see get_sorted_by_time().
+        self._kind_to_sorted_by_time: dict[
+            ComponentKind, tuple[list[float], list[Harmony | Mode]]
+        ] = {}
+
+    def get_sorted_by_time(
+        self, kind: ComponentKind
+    ) -> tuple[list[float], list[Harmony | Mode]]:
+        """
+        Returns the times and the components of the given kind, sorted by time.
+        Returned lists must not be modified.
+        """
+        if kind not in self._kind_to_sorted_by_time:
+            # components of each kind are sorted by (level, time),
+            # so components at the same time stay ordered by level
+            components = sorted(
+                self._kind_to_components[kind], key=lambda c: c.get_data("time")
+            )
+            self._kind_to_sorted_by_time[kind] = (
+                [c.get_data("time") for c in components],
+                components,
+            )
+        return self._kind_to_sorted_by_time[kind]
+
+    def _invalidate_sorted_by_time(self, kind: ComponentKind | None = None) -> None:
+        if kind is None:
+            self._kind_to_sorted_by_time.clear()
+        else:
+            self._kind_to_sorted_by_time.pop(kind, None)
+
+    def _add_to_components(self, component: Harmony | Mode) -> None:
+        super()._add_to_components(component)
+        self._invalidate_sorted_by_time(component.KIND)
+
+    def _remove_from_components_set(self, component: Harmony | Mode) -> None:
+        super()._remove_from_components_set(component)
+        self._invalidate_sorted_by_time(component.KIND)
+
+    def refresh_component_order(self) -> None:
+        # also called after adding or removing components in bulk
+        super().refresh_component_order()
+        self._invalidate_sorted_by_time()
+
+    def update_component_order(self, component: Harmony | Mode):
+        super().update_component_order(component)
+        self._invalidate_sorted_by_time(component.KIND)
+
+    def _get_position(self, component: Harmony | Mode) -> float:
+        # harmonies and modes are kept apart, so they may share times
+        return component.get_data("time")
 
     def _validate_component_creation(
         self,
@@ -39,9 +91,12 @@ class HarmonyTLComponentManager(TimelineComponentManager):
     ):
         component_class = self._get_component_class_by_kind(kind)
         return component_class.validate_creation(
-            time, {c.get_data("time") for c in self if c.KIND == kind}
+            time, self.get_existing_positions(kind)
         )
 
+    def _get_row_position(self, _, row: dict[str, Any]) -> float:
+        return row["time"]
+
     def _update_harmony_applied_to_on_mode_creation(self, mode: Mode):
         harmonies_in_harmonic_region = self.get_harmonies_in_harmonic_region(mode)
         if not harmonies_in_harmonic_region:
@@ -72,6 +127,18 @@ class HarmonyTLComponentManager(TimelineComponentManager):
 
         return success, component, reason
 
+    def create_components(
+        self, kind: ComponentKind, timeline, ids: list[int], rows: list[dict[str, Any]]
+    ) -> list[tuple[bool, TC | None, str]]:
+        if kind == ComponentKind.MODE and not self.is_deserializing:
+            # Harmonies in the region of each mode are updated
+            # on creation, so modes have to be created one at a time.
+            return [
+                self.create_component(kind, timeline, id, **row)
+                for id, row in zip(ids, rows, strict=True)
+            ]
+        return super().create_components(kind, timeline, ids, rows)
+
     def _update_harmony_applied_to_on_mode_deletion(self, mode: Mode):
         harmonies_in_harmonic_region = self.get_harmonies_in_harmonic_region(mode)
         if not harmonies_in_harmonic_region:
@@ -94,35 +161,33 @@ class HarmonyTLComponentManager(TimelineComponentManager):
         if component.KIND == ComponentKind.MODE and not self.is_deserializing:
             self._update_harmony_applied_to_on_mode_deletion(component)
 
-    def _get_next_mode_time(self, mode: Mode):
-        next_modes = self.get_components_by_condition(
-            lambda c: c.get_data("time") > mode.get_data("time"), ComponentKind.MODE
-        )
-        if not next_modes:
-            return math.inf
-        else:
-            next_mode = sorted(next_modes, key=lambda c: c.get_data("time"))[0]
-            return next_mode.get_data("time")
+    def delete_components(self, components: list[TC]) -> None:
+        if self.is_deserializing:
+            return super().delete_components(components)
 
-    def _get_previous_mode(self, mode: Mode):
-        prev_modes = self.get_components_by_condition(
-            lambda c: c.get_data("time") < mode.get_data("time"), ComponentKind.MODE
+        # Harmonies in the region of each mode are updated
+        # on deletion, so modes have to be deleted one at a time.
+        super().delete_components(
+            [c for c in components if c.KIND != ComponentKind.MODE]
         )
-        if not prev_modes:
-            return None
-        else:
-            return sorted(prev_modes, key=lambda c: c.get_data("time"))[-1]
+        for mode in [c for c in components if c.KIND == ComponentKind.MODE]:
+            self.delete_component(mode)
 
-    def get_harmonies_in_harmonic_region(self, mode: Mode):
-
-        next_mode_time = self._get_next_mode_time(mode)
+    def _get_next_mode_time(self, mode: Mode):
+        times, _ = self.get_sorted_by_time(ComponentKind.MODE)
+        index = bisect(times, mode.get_data("time"))
+        return times[index] if index < len(times) else math.inf
 
-        def is_in_harmonic_region(harmony: Harmony):
-            return next_mode_time >= harmony.get_data("time") >= mode.get_data("time")
+    def _get_previous_mode(self, mode: Mode):
+        times, modes = self.get_sorted_by_time(ComponentKind.MODE)
+        index = bisect_left(times, mode.get_data("time"))
+        return modes[index - 1] if index else None
 
-        return self.get_components_by_condition(
-            is_in_harmonic_region, ComponentKind.HARMONY
-        )
+    def get_harmonies_in_harmonic_region(self, mode: Mode):
+        times, harmonies = self.get_sorted_by_time(ComponentKind.HARMONY)
+        start = bisect_left(times, mode.get_data("time"))
+        end = bisect(times, self._get_next_mode_time(mode), lo=start)
+        return harmonies[start:end]
 
     def deserialize_components(
         self, serialized_components: dict[int | str, dict[str, Any]]
@@ -197,12 +262,10 @@ class HarmonyTimeline(Timeline):
         pass
 
     def get_key_by_time(self, time: float) -> music21.key.Key:
-        modes = sorted(self.modes())
-        idx = bisect([mode.get_data("time") for mode in modes], time)
+        times, modes = self.component_manager.get_sorted_by_time(ComponentKind.MODE)
+        idx = bisect(times, time)
         if not idx:
-            return music21.key.Key("CM")
-        elif idx == len(modes):
-            idx = 0
+            return get_key("CM")
 
         return modes[idx - 1].key
 
@@ -1,5 +1,8 @@
 import hashlib
 
+# md5 digests have 128 bits
+HASH_MODULUS = 2**128
+
 
 def hash_function(string: str) -> str:
     return hashlib.md5(string.encode("utf-8")).hexdigest()
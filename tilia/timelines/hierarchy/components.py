@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from tilia.requests import Get, get
 from tilia.timelines.base.component import SegmentLikeTimelineComponent
@@ -52,6 +52,9 @@ class Hierarchy(SegmentLikeTimelineComponent):
 
     KIND = ComponentKind.HIERARCHY
     ORDERING_ATTRS = ("level", "start")
+    INDEXED_ATTRS = ("level",)
+    # Attributes that determine the position in the parent/children tree
+    TREE_ATTRS = ("start", "end", "level")
 
     def __init__(
         self,
@@ -85,6 +88,12 @@ class Hierarchy(SegmentLikeTimelineComponent):
 
         super().__init__(timeline, id)
 
+    def set_data(self, attr: str, value: Any):
+        value, success = super().set_data(attr, value)
+        if success and attr in self.TREE_ATTRS:
+            self.timeline.component_manager.invalidate_tree()
+        return value, success
+
     @property
     def parent(self):
         return self.timeline.component_manager.get_parent(self)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import bisect
 import functools
-import itertools
 from typing import Any
 
 import tilia.errors
@@ -24,20 +24,51 @@ class HierarchyTLComponentManager(TimelineComponentManager):
         super().__init__(timeline, [ComponentKind.HIERARCHY])
         self.scale = functools.partial(scale_segmentlike, self)
         self.crop = functools.partial(crop_segmentlike, self)
+        # Parent/children tree, rebuilt lazily after hierarchies change
+        self._id_to_parent: dict[int, Hierarchy | None] = {}
+        self._id_to_children: dict[int, list[Hierarchy]] = {}
+        # Children sorted by start, with their starts, for bisecting.
+        # Hierarchies without parent are stored under None.
+        self._id_to_children_by_start: dict[
+            int | None, tuple[list[float], list[Hierarchy]]
+        ] = {}
+        self._is_tree_outdated = True
+        self._is_tree_nested = True
+
+    def _get_position(self, component: Hierarchy) -> tuple[float, float, int]:
+        return component.start, component.end, component.level
 
     def _validate_component_creation(
         self, _, start: float, end: float, level: int, **kwargs
     ):
         return Hierarchy.validate_creation(
-            start, end, (start, end, level), {(c.start, c.end, c.level) for c in self}
+            start,
+            end,
+            (start, end, level),
+            self.get_existing_positions(ComponentKind.HIERARCHY),
         )
 
+    def _get_row_position(self, _, row: dict[str, Any]) -> tuple[float, float, int]:
+        return row["start"], row["end"], row["level"]
+
     def deserialize_components(self, components: dict[int, dict[str, Any]]):
         self.clear()  # remove starting hierarchy
 
         super().deserialize_components(components)
 
-    def get_parent(self, child):
+    def get_parent(self, child: Hierarchy) -> Hierarchy | None:
+        self._update_tree_if_outdated()
+        if not self._is_tree_nested:
+            return self._get_parent_by_scanning(child)
+        return self._id_to_parent[child.id]
+
+    def get_children(self, parent: Hierarchy) -> list[Hierarchy]:
+        self._update_tree_if_outdated()
+        if not self._is_tree_nested:
+            return self._get_children_by_scanning(parent)
+        return self._id_to_children[parent.id].copy()
+
+    def _get_parent_by_scanning(self, child: Hierarchy) -> Hierarchy | None:
         candidates = {
             h
             for h in self
@@ -47,7 +78,7 @@ class HierarchyTLComponentManager(TimelineComponentManager):
             return None
         return sorted(candidates, key=lambda h: h.level)[0]
 
-    def get_children(self, parent):
+    def _get_children_by_scanning(self, parent: Hierarchy) -> list[Hierarchy]:
         def get_hierarchies_below(above, hierarchy_iter):
             return {
                 h
@@ -66,40 +97,112 @@ class HierarchyTLComponentManager(TimelineComponentManager):
 
         return sorted(list(remaining_candidates))
 
+    def invalidate_tree(self) -> None:
+        """
+        Marks the parent/children tree as outdated. It will be rebuilt
+        on the next query. Must be called whenever a hierarchy is
+        added or removed or has its start, end or level changed.
+        """
+        self._is_tree_outdated = True
+
+    def _update_tree_if_outdated(self) -> None:
+        if self._is_tree_outdated:
+            self._build_tree()
+
+    def _build_tree(self) -> None:
+        """
+        Builds the parent/children tree with a single sweep over the
+        hierarchies sorted by (start, -end, -level). In that order, every
+        hierarchy comes after all of its ancestors, so a stack of open
+        hierarchies is enough to find parents. If hierarchies cross
+        boundaries the tree is ambiguous and queries fall back to scanning.
+        """
+        self._id_to_parent = {}
+        self._id_to_children = {h.id: [] for h in self._components}
+        self._id_to_children_by_start = {}
+        self._is_tree_outdated = False
+        self._is_tree_nested = True
+
+        stack = []
+        by_start = sorted(self._components, key=lambda h: (h.start, -h.end, -h.level))
+        for h in by_start:
+            while stack and stack[-1].end < h.end:
+                if stack[-1].end > h.start:
+                    # crosses boundaries with h
+                    self._is_tree_nested = False
+                    return
+                stack.pop()
+            if stack and stack[-1].level <= h.level:
+                # h is inside a hierarchy that is not above it
+                self._is_tree_nested = False
+                return
+            self._id_to_parent[h.id] = stack[-1] if stack else None
+            stack.append(h)
+
+        # iterating over self._components keeps children sorted
+        for h in self._components:
+            parent = self._id_to_parent[h.id]
+            if parent is not None:
+                self._id_to_children[parent.id].append(h)
+
+        for h in by_start:
+            parent = self._id_to_parent[h.id]
+            starts, children = self._id_to_children_by_start.setdefault(
+                parent.id if parent else None, ([], [])
+            )
+            starts.append(h.start)
+            children.append(h)
+
     def get_boundary_conflicts(self) -> list[tuple[Hierarchy, Hierarchy]]:
         """
         Returns a list with of tuples with conflicting hierarchies. Returns an empty
         list if there are no conflicts.
-        """
 
-        conflicts = []
-
-        for hrc1, hrc2 in itertools.combinations(self._components, 2):
-            if hrc1.start < hrc2.start < hrc1.end or hrc1.start < hrc2.end < hrc1.end:
-                # hrc2 starts or ends inside hrc1
-                if hrc2.level >= hrc1.level:
-                    # if it is on the same level or higher, there's a conflict
-                    conflicts.append((hrc1, hrc2))
-                elif not hrc1.start > hrc2.start and hrc1.end < hrc2.end:
-                    # if it doesn't start AND end inside, there's a conflict
-                    conflicts.append((hrc1, hrc2))
-
-            # repeat swapping hr1 and hrc2
-            if hrc2.start < hrc1.start < hrc2.end or hrc2.start < hrc1.end < hrc2.end:
-                if hrc1.level >= hrc2.level:
-                    conflicts.append((hrc2, hrc1))
-                elif not hrc2.start > hrc1.start and hrc2.end < hrc1.end:
-                    conflicts.append((hrc2, hrc1))
-
-            if (
-                hrc1.start == hrc2.start
-                and hrc1.end == hrc2.end
-                and hrc1.level == hrc2.level
-            ):
-                # if hierarchies have same times and level, there's a conflict
-                conflicts.append((hrc1, hrc2))
+        Hierarchies conflict if (1) they cross each other's boundaries,
+        (2) one is inside the other but is not below it or (3) they have
+        the same times and level. Crossings are reported in both orders
+        if the hierarchy that starts first is not below the other one.
 
-        return conflicts
+        Conflicts are found by sweeping hierarchies in start order while
+        keeping the open ones sorted by end, so only neighbours in time
+        are compared.
+        """
+        conflicts = []
+        open_ends = []
+        open_hierarchies = []
+
+        for hrc in sorted(self._components, key=lambda h: (h.start, -h.end, -h.level)):
+            # close hierarchies that end before hrc starts
+            closed_count = bisect.bisect_right(open_ends, hrc.start)
+            del open_ends[:closed_count]
+            del open_hierarchies[:closed_count]
+
+            # open hierarchies ending inside hrc started before it, so they cross
+            containers_index = bisect.bisect_left(open_ends, hrc.end)
+            for crossing in open_hierarchies[:containers_index]:
+                conflicts.append((crossing, hrc))
+                if crossing.level >= hrc.level:
+                    conflicts.append((hrc, crossing))
+
+            # the remaining ones contain hrc
+            for container in open_hierarchies[containers_index:]:
+                if container.start == hrc.start and container.end == hrc.end:
+                    if container.level == hrc.level:
+                        conflicts.append((container, hrc))
+                elif container.level <= hrc.level:
+                    conflicts.append((container, hrc))
+
+            open_ends.insert(containers_index, hrc.end)
+            open_hierarchies.insert(containers_index, hrc)
+
+        # sort conflicts as if hierarchies were compared pairwise in order
+        id_to_index = {h.id: i for i, h in enumerate(self._components)}
+
+        def get_sort_key(conflict):
+            first, second = (id_to_index[h.id] for h in conflict)
+            return min(first, second), max(first, second), first > second
+
+        return sorted(conflicts, key=get_sort_key)
 
     def create_child(self, hierarchy: Hierarchy):
         """Create unit one level below with same start and end."""
@@ -172,7 +275,9 @@ class HierarchyTLComponentManager(TimelineComponentManager):
             if any(
                 [
                     u.start <= start < u.end or u.start < end <= u.end
-                    for u in [u for u in self.timeline if u.level == grouping_level]
+                    for u in self.get_components_by_attribute(
+                        "level", grouping_level, ComponentKind.HIERARCHY
+                    )
                 ]
             ):
                 return (
@@ -251,6 +356,24 @@ class HierarchyTLComponentManager(TimelineComponentManager):
         Returns lowest level unit that begins
         strictly before and ends strictly after 'time'
         """
+        self._update_tree_if_outdated()
+        if not self._is_tree_nested:
+            return self._get_unit_to_split_by_scanning(time)
+
+        # units that contain time form a path from a root,
+        # so we descend the tree looking for the deepest one
+        unit = None
+        while unit is None or unit.id in self._id_to_children_by_start:
+            starts, candidates = self._id_to_children_by_start.get(
+                unit.id if unit else None, ([], [])
+            )
+            index = bisect.bisect_left(starts, time) - 1
+            if index < 0 or candidates[index].end <= time:
+                break
+            unit = candidates[index]
+        return unit
+
+    def _get_unit_to_split_by_scanning(self, time: float) -> Hierarchy | None:
         units_at_time = self.get_components_by_condition(
             lambda u: u.start < time < u.end, kind=ComponentKind.HIERARCHY
         )
@@ -432,6 +555,19 @@ class HierarchyTLComponentManager(TimelineComponentManager):
     def delete_component(self, component: Hierarchy, **kwargs) -> None:
         super().delete_component(component, **kwargs)
 
+    def _add_to_components(self, component: Hierarchy) -> None:
+        super()._add_to_components(component)
+        self.invalidate_tree()
+
+    def _remove_from_components_set(self, component: Hierarchy) -> None:
+        super()._remove_from_components_set(component)
+        self.invalidate_tree()
+
+    def refresh_component_order(self) -> None:
+        # also called after adding or removing components in bulk
+        super().refresh_component_order()
+        self.invalidate_tree()
+
 
 class HierarchyTimeline(Timeline):
     KIND = TimelineKind.HIERARCHY_TIMELINE
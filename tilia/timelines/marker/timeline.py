@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+from typing import Any
 
 from tilia.settings import settings
 from tilia.timelines.base.component import TimelineComponent
@@ -21,8 +22,16 @@ class MarkerTLComponentManager(TimelineComponentManager):
         self.scale = functools.partial(scale_pointlike, self)
         self.crop = functools.partial(crop_pointlike, self)
 
+    def _get_position(self, component: Marker) -> float:
+        return component.get_data("time")
+
     def _validate_component_creation(self, _, time, *args, **kwargs):
-        return Marker.validate_creation(time, {c.get_data("time") for c in self})
+        return Marker.validate_creation(
+            time, self.get_existing_positions(ComponentKind.MARKER)
+        )
+
+    def _get_row_position(self, _, row: dict[str, Any]) -> float:
+        return row["time"]
 
 
 class MarkerTimeline(Timeline):
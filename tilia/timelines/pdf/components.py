@@ -17,6 +17,7 @@ from tilia.timelines.base.component import PointLikeTimelineComponent
 class PdfMarker(PointLikeTimelineComponent):
     SERIALIZABLE = ["time", "page_number"]
     ORDERING_ATTRS = ("time",)
+    INDEXED_ATTRS = ("page_number",)
 
     KIND = ComponentKind.PDF_MARKER
 
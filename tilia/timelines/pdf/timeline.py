@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+from typing import Any
 
 import pypdf
 
@@ -25,8 +26,16 @@ class PdfTLComponentManager(TimelineComponentManager):
         self.scale = functools.partial(scale_pointlike, self)
         self.crop = functools.partial(crop_pointlike, self)
 
+    def _get_position(self, component: PdfMarker) -> float:
+        return component.get_data("time")
+
     def _validate_component_creation(self, _, time, *args, **kwargs):
-        return PdfMarker.validate_creation(time, {c.get_data("time") for c in self})
+        return PdfMarker.validate_creation(
+            time, self.get_existing_positions(ComponentKind.PDF_MARKER)
+        )
+
+    def _get_row_position(self, _, row: dict[str, Any]) -> float:
+        return row["time"]
 
 
 class PdfTimeline(Timeline):
@@ -22,6 +22,7 @@ class Clef(PointLikeTimelineComponent):
         "icon",
     ]
     ORDERING_ATTRS = ("time",)
+    INDEXED_ATTRS = ("staff_index",)
 
     KIND = ComponentKind.CLEF
     ICON = {
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 class KeySignature(PointLikeTimelineComponent):
     KIND = ComponentKind.KEY_SIGNATURE
     SERIALIZABLE = ["staff_index", "time", "fifths"]
+    INDEXED_ATTRS = ("staff_index",)
 
     def __init__(
         self,
@@ -35,6 +35,7 @@ class Note(SegmentLikeTimelineComponent):
         "display_accidental",
     ]
     ORDERING_ATTRS = ("start", "end", "pitch", "staff_index")
+    INDEXED_ATTRS = ("staff_index",)
 
     KIND = ComponentKind.NOTE
 
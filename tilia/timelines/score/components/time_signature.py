@@ -6,6 +6,7 @@ from tilia.timelines.component_kinds import ComponentKind
 class TimeSignature(PointLikeTimelineComponent):
     SERIALIZABLE = ["staff_index", "time", "numerator", "denominator"]
     ORDERING_ATTRS = ("time", "staff_index")
+    INDEXED_ATTRS = ("staff_index",)
 
     KIND = ComponentKind.TIME_SIGNATURE
 
@@ -48,6 +48,12 @@ class SliderTimeline(Timeline):
 
         return result
 
+    def get_hash(self) -> str:
+        return ""
+
+    def get_components_hash(self) -> str:
+        return ""
+
     def deserialize_components(self, components: dict[int, dict[str]]):
         """Nothing to do."""
 
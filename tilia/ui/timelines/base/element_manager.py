@@ -22,6 +22,13 @@ class ElementManager(Generic[TE]):
     def __init__(self, element_class: type[TE] | list[type[TE]]):
         self._elements: list[TE] = []
         self.id_to_element = {}
+        # Neighbours of each element in self._elements
+        self._id_to_next: dict[int, TE | None] = {}
+        self._id_to_previous: dict[int, TE | None] = {}
+        # Elements of each kind, in the same order as self._elements
+        self._kind_to_elements: dict[ComponentKind, list[TE]] = {}
+        # Ordinal of each element when it was last put in order
+        self._id_to_ordinal: dict[int, Any] = {}
         self.element_classes: TE | list[TE] = (
             element_class if isinstance(element_class, list) else [element_class]
         )
@@ -48,28 +55,123 @@ class ElementManager(Generic[TE]):
         get_data: Callable[[str], Any],
         set_data: Callable[[str, Any], None],
     ):
-        if self.is_single_element:
-            element = self.element_classes[0](
-                id, timeline_ui, scene, get_data, set_data
-            )
-        else:
-            element = get_element_class_by_kind(kind)(
-                id, timeline_ui, scene, get_data, set_data
-            )
+        element = self._get_element_class(kind)(
+            id, timeline_ui, scene, get_data, set_data
+        )
 
         self._add_to_elements_set(element)
 
         return element
 
+    def create_elements(
+        self,
+        kind: ComponentKind,
+        components: list[tuple[int, Callable[[str], Any], Callable[[str, Any], None]]],
+        timeline_ui: TimelineUI,
+        scene: TimelineScene,
+    ) -> list[TE]:
+        element_class = self._get_element_class(kind)
+        elements = [
+            element_class(id, timeline_ui, scene, get_data, set_data)
+            for id, get_data, set_data in components
+        ]
+
+        for element in elements:
+            self.id_to_element[element.id] = element
+        self._elements += elements
+        # sorting once is faster than inserting each element in order
+        self._elements.sort()
+        self._rebuild_indexes()
+
+        return elements
+
+    def _get_element_class(self, kind: ComponentKind) -> type[TE]:
+        if self.is_single_element:
+            return self.element_classes[0]
+        return get_element_class_by_kind(kind)
+
+    def _rebuild_indexes(self) -> None:
+        self._id_to_previous = {}
+        self._id_to_next = {}
+        self._kind_to_elements = {}
+        self._id_to_ordinal = {}
+        previous = None
+        for element in self._elements:
+            self._id_to_ordinal[element.id] = element.get_data("ordinal")
+            self._id_to_previous[element.id] = previous
+            if previous is not None:
+                self._id_to_next[previous.id] = element
+            previous = element
+            self._kind_to_elements.setdefault(element.kind, []).append(element)
+        if previous is not None:
+            self._id_to_next[previous.id] = None
+
+    def _get_stored_ordinal(self, element: TE) -> Any:
+        return self._id_to_ordinal[element.id]
+
+    def _insert_sorted(self, elements: list[TE], element: TE) -> int:
+        """Inserts element in self._elements or a subset of it, keeping its order."""
+        index = bisect.bisect_left(
+            elements,
+            self._id_to_ordinal[element.id],
+            key=self._get_stored_ordinal,
+        )
+        elements.insert(index, element)
+        return index
+
+    def _remove_sorted(self, elements: list[TE], element: TE) -> None:
+        """Removes element from self._elements or a subset of it."""
+        index = bisect.bisect_left(
+            elements,
+            self._id_to_ordinal[element.id],
+            key=self._get_stored_ordinal,
+        )
+        # Elements may share ordinals, so we have to look for the
+        # right one among the ones with the same ordinal.
+        while elements[index] is not element:
+            index += 1
+        del elements[index]
+
+    def _insert_in_order(self, element: TE) -> None:
+        self._id_to_ordinal[element.id] = element.get_data("ordinal")
+        index = self._insert_sorted(self._elements, element)
+
+        previous = self._elements[index - 1] if index > 0 else None
+        next_ = self._elements[index + 1] if index < len(self._elements) - 1 else None
+        self._id_to_previous[element.id] = previous
+        self._id_to_next[element.id] = next_
+        if previous is not None:
+            self._id_to_next[previous.id] = element
+        if next_ is not None:
+            self._id_to_previous[next_.id] = element
+
+        self._insert_sorted(
+            self._kind_to_elements.setdefault(element.kind, []), element
+        )
+
+    def _remove_from_order(self, element: TE) -> None:
+        # Looks elements up by the ordinal they were stored with, as
+        # the element's ordinal may have changed since then.
+        self._remove_sorted(self._elements, element)
+        self._remove_sorted(self._kind_to_elements[element.kind], element)
+        del self._id_to_ordinal[element.id]
+
+        previous = self._id_to_previous.pop(element.id)
+        next_ = self._id_to_next.pop(element.id)
+        if previous is not None:
+            self._id_to_next[previous.id] = next_
+        if next_ is not None:
+            self._id_to_previous[next_.id] = previous
+
     def _add_to_elements_set(self, element: TE) -> None:
-        bisect.insort_left(self._elements, element)
+        self._insert_in_order(element)
         self.id_to_element[element.id] = element
 
     def _remove_from_elements_set(self, element: TE) -> None:
         try:
-            self._elements.remove(element)
+            self._remove_from_order(element)
             del self.id_to_element[element.id]
-        except ValueError as e:
+        except KeyError as e:
             raise ValueError(
                 f"Can't remove element '{element}' from {self}: not in self._elements."
             ) from e
@@ -81,6 +183,8 @@ class ElementManager(Generic[TE]):
         return self._get_element_from_set_by_attribute(self._elements, attr_name, value)
 
     def get_elements_by_attribute(self, attr_name: str, value: Any) -> list[TE]:
+        if attr_name == "kind":
+            return self._kind_to_elements.get(value, []).copy()
         return self._get_elements_from_set_by_attribute(
             self._elements, attr_name, value
         )
@@ -89,18 +193,10 @@ class ElementManager(Generic[TE]):
         return [e for e in self._elements if condition(e)]
 
     def get_next_element(self, element: TE) -> TE | None:
-        element_idx = self._elements.index(element)
-        if element_idx == len(self._elements) - 1:
-            return None
-        else:
-            return self._elements[element_idx + 1]
+        return self._id_to_next[element.id]
 
     def get_previous_element(self, element: TE) -> TE | None:
-        element_idx = self._elements.index(element)
-        if element_idx == 0:
-            return None
-        else:
-            return self._elements[element_idx - 1]
+        return self._id_to_previous[element.id]
 
     def get_next_element_by_time(
         self, time: float, elements: Iterable[TE] | None = None
@@ -185,6 +281,14 @@ class ElementManager(Generic[TE]):
         element.delete()
         self._remove_from_elements_set(element)
 
+    def delete_elements(self, elements: list[TE]):
+        for element in elements:
+            element.delete()
+            del self.id_to_element[element.id]
+        # rebuilding the list once is faster than removing each element
+        self._elements = [e for e in self._elements if e.id in self.id_to_element]
+        self._rebuild_indexes()
+
     @staticmethod
     def get_child_items_from_elements(
         elements: list[TE],
@@ -207,5 +311,5 @@ class ElementManager(Generic[TE]):
             element.update_position()
 
     def update_element_order(self, element: TE):
-        self._elements.remove(element)
-        bisect.insort_left(self._elements, element)
+        self._remove_from_order(element)
+        self._insert_in_order(element)
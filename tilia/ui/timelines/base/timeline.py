@@ -277,9 +277,19 @@ class TimelineUI(ABC):  # noqa: B024
             kind, id, self, self.scene, get_data, set_data
         )
 
+    def on_timeline_components_created(
+        self,
+        kind: ComponentKind,
+        components: list[tuple[int, Callable[[str], Any], Callable[[str, Any], None]]],
+    ):
+        return self.element_manager.create_elements(kind, components, self, self.scene)
+
     def on_timeline_component_deleted(self, id: int):
         self.delete_element(self.id_to_element[id])
 
+    def on_timeline_components_deleted(self, ids: list[int]):
+        self.delete_elements([self.id_to_element[id] for id in ids])
+
     def update_selection_on_right_click(
         self,
         elements: list[T],
@@ -538,6 +548,17 @@ class TimelineUI(ABC):  # noqa: B024
 
         self.element_manager.delete_element(element)
 
+    def delete_elements(self, elements: list[T]):
+        for element in elements:
+            if element in self.selected_elements:
+                try:
+                    self.deselect_element(element)
+                except KeyError:
+                    # can't access component, as it is already deleted
+                    pass
+
+        self.element_manager.delete_elements(elements)
+
     def get_copy_data_from_selected_elements(self) -> list[dict]:
         return get_copy_data_from_elements(
             [
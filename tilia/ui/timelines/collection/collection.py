@@ -408,7 +408,9 @@ class TimelineUIs:
             (Post.TIMELINE_CREATE_DONE, self.on_timeline_created),
             (Post.TIMELINE_DELETE_DONE, self.on_timeline_deleted),
             (Post.TIMELINE_COMPONENT_CREATED, self.on_timeline_component_created),
+            (Post.TIMELINE_COMPONENTS_CREATED, self.on_timeline_components_created),
             (Post.TIMELINE_COMPONENT_DELETED, self.on_timeline_component_deleted),
+            (Post.TIMELINE_COMPONENTS_DELETED, self.on_timeline_components_deleted),
             (
                 Post.TIMELINE_COMPONENT_SET_DATA_DONE,
                 self.on_timeline_component_set_data_done,
@@ -443,6 +445,7 @@ class TimelineUIs:
             (Post.SELECTION_BOX_DESELECT_ITEM, self.on_selection_box_deselect_item),
             (Post.TIMELINE_WIDTH_SET_DONE, self.on_timeline_width_set_done),
             (Post.TIMELINES_CROP_DONE, self.on_timelines_crop_done),
+            (Post.TIMELINES_SCALE_DONE, self.on_timelines_scale_done),
             (
                 Post.BEAT_TIMELINE_MEASURE_NUMBER_CHANGE_DONE,
                 self.on_beat_timeline_measure_number_change_done,
@@ -527,6 +530,17 @@ class TimelineUIs:
             component_kind, component_id, get_data, set_data
         )
 
+    def on_timeline_components_created(
+        self,
+        _: TlKind,
+        tl_id: int,
+        component_kind: ComponentKind,
+        components: list[tuple[int, Callable[[str], Any], Callable[[str, Any], None]]],
+    ):
+        self.get_timeline_ui(tl_id).on_timeline_components_created(
+            component_kind, components
+        )
+
     def on_timeline_component_deleted(self, _: TlKind, tl_id: int, component_id: int):
         if (tl_id, component_id) in self.loop_elements:
             if (tl_id, component_id) not in self.loop_delete_ignore:
@@ -535,6 +549,22 @@ class TimelineUIs:
 
         self.get_timeline_ui(tl_id).on_timeline_component_deleted(component_id)
 
+    def on_timeline_components_deleted(
+        self, _: TlKind, tl_id: int, component_ids: list[int]
+    ):
+        deleted_loop_elements = [
+            (tl_id, id)
+            for id in component_ids
+            if (tl_id, id) in self.loop_elements
+            and (tl_id, id) not in self.loop_delete_ignore
+        ]
+        if deleted_loop_elements:
+            for loop_element in deleted_loop_elements:
+                self.loop_elements.remove(loop_element)
+            self._update_loop_elements(clear=len(self.loop_elements) == 0)
+
+        self.get_timeline_ui(tl_id).on_timeline_components_deleted(component_ids)
+
     def on_timeline_component_set_data_done(
         self, timeline_id: int, component_id: int, attr: str, value: Any
     ):
@@ -1395,6 +1425,10 @@ class TimelineUIs:
         for tlui in self:
             self.update_timeline_times(tlui)
 
+    def on_timelines_scale_done(self):
+        for tlui in self:
+            self.update_timeline_times(tlui)
+
     def deselect_all_elements_in_timeline_uis(self, excluding: TimelineUI):
         for timeline_ui in self:
             if timeline_ui == excluding:
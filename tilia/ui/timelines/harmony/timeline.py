@@ -82,13 +82,13 @@ class HarmonyTimelineUI(TimelineUI):
         self.scene.addItem(self.key_level_label)
 
     def modes(self):
-        return self.element_manager.get_elements_by_condition(
-            lambda elm: isinstance(elm, ModeUI)
+        return self.element_manager.get_elements_by_attribute(
+            "kind", ComponentKind.MODE
         )
 
     def harmonies(self):
-        return self.element_manager.get_elements_by_condition(
-            lambda elm: isinstance(elm, HarmonyUI)
+        return self.element_manager.get_elements_by_attribute(
+            "kind", ComponentKind.HARMONY
         )
 
     @with_elements
@@ -141,10 +141,18 @@ class PdfTimelineUI(TimelineUI):
         super().on_timeline_component_created(kind, id, get_data, set_data)
         self.update_displayed_page(get(Get.MEDIA_CURRENT_TIME))
 
+    def on_timeline_components_created(self, kind: ComponentKind, components):
+        super().on_timeline_components_created(kind, components)
+        self.update_displayed_page(get(Get.MEDIA_CURRENT_TIME))
+
     def on_timeline_component_deleted(self, id: int):
         super().on_timeline_component_deleted(id)
         self.update_displayed_page(get(Get.MEDIA_CURRENT_TIME))
 
+    def on_timeline_components_deleted(self, ids: list[int]):
+        super().on_timeline_components_deleted(ids)
+        self.update_displayed_page(get(Get.MEDIA_CURRENT_TIME))
+
     def _deselect_all_but_last(self):
         if len(self.selected_elements) > 1:
             for element in self.selected_elements[:-1]:
@@ -211,6 +211,11 @@ class ScoreTimelineUI(TimelineUI):
             # so we cache them here
             self.clef_time_cache = self.get_clef_time_cache()
 
+    def on_timeline_components_created(self, kind: ComponentKind, components):
+        # each element updates the caches above, so they are created one at a time
+        for id, get_data, set_data in components:
+            self.on_timeline_component_created(kind, id, get_data, set_data)
+
     def _update_staff_extreme_notes(self, staff_index: int, note: NoteUI) -> None:
         pitch = note.get_data("pitch")
         if staff_index not in self.staff_extreme_notes:
@@ -108,6 +108,8 @@ class SettingsWindow(QDialog):
                     widget.setMinimum(10)
                 self.form_layout.addRow(pretty_label(name), widget)
                 self.settings[group_name][name] = widget
+            if group_name == "undo":
+                self.add_undo_memory_use()
             filled_fields.append(group_name)
             self.add_separator()
 
@@ -125,6 +127,13 @@ class SettingsWindow(QDialog):
         add_group("dev")
         self.adjustSize()
 
+    def add_undo_memory_use(self):
+        memory_use, disk_use = get(Get.UNDO_MEMORY_USE)
+        self.form_layout.addRow(
+            pretty_label("memory_use"),
+            QLabel(f"{format_size(memory_use)} ({format_size(disk_use)} on disk)"),
+        )
+
     def reset_fields(self):
         default_settings = settings.DEFAULT_SETTINGS
         current_settings = {
@@ -195,6 +204,10 @@ def pretty_label(input_string: str):
     )
 
 
+def format_size(size: int) -> str:
+    return f"{size / 2**20:.1f} MB"
+
+
 def select_color_button(parent, value, text=""):
     def select_color(old_color):
         new_color = QColorDialog.getColor(
@@ -452,8 +452,11 @@ class SvgViewer(ViewDockWidget):
         if not beat_tl:
             return {}
 
-        for key, beat in beat_pos.items():
-            t = beat_tl.get_time_by_measure(*beat)
+        all_times = beat_tl.get_times_by_measures(
+            [measure for measure, _ in beat_pos.values()],
+            [fraction for _, fraction in beat_pos.values()],
+        )
+        for (key, beat), t in zip(beat_pos.items(), all_times, strict=True):
             if not t:
                 t = (
                     [0]
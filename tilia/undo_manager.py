@@ -1,16 +1,59 @@
 from __future__ import annotations
 
+import json
+import os
+import tempfile
+import zlib
+from typing import IO, Any
+
+from PySide6.QtCore import QTimer
+
+from tilia import dirs
 from tilia.requests import Post, listen, post
+from tilia.settings import settings
 from tilia.utils import get_tilia_class_string
 
+# Indices of the values in the (old, new) pairs of a state delta
+OLD = 0
+NEW = 1
+
 
 class UndoManager:
+    """
+    Records app states and restores them on undo and redo.
+
+    Only the state at the current position of the stack is kept in full.
+    Every other entry in the stack keeps the changes between its state and the
+    state before it (see get_state_delta()), so memory grows with the size of
+    the edits and not with the size of the file. States are reconstructed from
+    those changes on undo and redo.
+
+    Changes are kept compressed. When they take more memory than the budget
+    in the undo settings, the oldest ones are moved to a temporary file in
+    tilia.dirs.undo_path, and read back from it when needed.
+
+    Computing and storing the changes of a recorded state is deferred until
+    the event loop is idle, or until the stack is needed, so it doesn't slow
+    down editing. Records that would replace each other (see record()) are
+    merged before that, so the changes are only computed once.
+    """
+
     def __init__(self) -> None:
         self._setup_requests()
-        self.stack = []
+        self._stack = []
+        # Record whose changes are not stored yet, see flush()
+        self._pending_record: dict[str, Any] | None = None
         self.current_state_index = -1
         self.last_repeat_id = None
         self.is_recording = True
+        # State at self.current_state_index
+        self._state: dict[str, Any] | None = None
+        # Size of the compressed changes in memory and on disk
+        self.memory_use = 0
+        self.disk_use = 0
+        self._spill_file: IO[bytes] | None = None
+        # Index in self._stack of the oldest entry that might still be in memory
+        self._first_in_memory_index = 0
 
     def __str__(self):
         return get_tilia_class_string(self)
@@ -18,15 +61,25 @@ class UndoManager:
     def _setup_requests(self):
         listen(self, Post.UNDO_MANAGER_SET_IS_RECORDING, self.set_is_recording)
 
+    @property
+    def stack(self) -> list[dict[str, Any]]:
+        self.flush()
+        return self._stack
+
     @property
     def is_cleared(self):
-        return len(self.stack) == 1
+        return len(self._stack) == 1 and self._pending_record is None
 
     def set_is_recording(self, value: bool):
         if not isinstance(value, bool):
             raise ValueError("UndoManager.is_recording must be a boolean")
         self.is_recording = value
 
+    def get_memory_use(self) -> tuple[int, int]:
+        """Returns the bytes taken by the undo history in memory and on disk."""
+        self.flush()
+        return self.memory_use, self.disk_use
+
     def record(
         self,
         state,
@@ -38,42 +91,154 @@ class UndoManager:
         Records given app 'state' to UndoManager's stack. Should be called by the App
         object. The App call should to be triggered by posting
         Post.REQUEST_RECORD_STATE *after* 'action' has been done.
+        Recorded states must not be modified afterwards.
         """
         if not self.is_recording:
             return
 
+        if self._state is None:
+            # there is nothing to compute for the first state
+            self._record(state, action, no_repeat, repeat_identifier)
+            return
+
+        pending = self._pending_record
+        if (
+            pending is not None
+            and no_repeat
+            and repeat_identifier
+            and pending["repeat_identifier"] == repeat_identifier
+        ):
+            # this would replace the pending record once it is stored
+            pending["state"] = state
+            return
+
+        self.flush()
+        self._pending_record = {
+            "state": state,
+            "action": action,
+            "no_repeat": no_repeat,
+            "repeat_identifier": repeat_identifier,
+        }
+        QTimer.singleShot(0, self.flush)
+
+    def flush(self) -> None:
+        """Stores the changes of the pending record, if any."""
+        if self._pending_record is None:
+            return
+
+        pending, self._pending_record = self._pending_record, None
+        self._record(
+            pending["state"],
+            pending["action"],
+            pending["no_repeat"],
+            pending["repeat_identifier"],
+        )
+
+    def _record(self, state, action: str, no_repeat: bool, repeat_identifier: str):
         # discard undone states, if any
         self.discard_undone()
 
+        if self._state is None:
+            self._state = state
+            # there is no state before the first one, so it has no delta
+            self._stack.append({"delta": None, "action": action})
+            return
+
         if no_repeat and self.last_repeat_id == repeat_identifier:
             # No repeat is on and action is same as last. Replace recorded state."
-            self.stack[-1]["state"] = state
+            if len(self._stack) > 1:
+                entry = self._stack[-1]
+                prev_state = apply_state_delta(self._state, self.get_delta(entry), OLD)
+                self._discard_delta(entry)
+                self._store_delta(entry, get_state_delta(prev_state, state))
+            self._state = state
             return
 
-        self.stack.append({"state": state, "action": action})
+        entry = {"action": action}
+        self._store_delta(entry, get_state_delta(self._state, state))
+        self._stack.append(entry)
+        self._state = state
 
         if repeat_identifier:
             self.last_repeat_id = repeat_identifier
 
+        self._spill_to_disk()
+
+    def get_delta(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Returns the changes recorded in `entry`, reading them if necessary."""
+        if "data" in entry:
+            data = entry["data"]
+        elif "location" in entry:
+            offset, size = entry["location"]
+            self._spill_file.seek(offset)
+            data = self._spill_file.read(size)
+        else:
+            return entry["delta"]
+
+        return json.loads(zlib.decompress(data))
+
+    def _store_delta(self, entry: dict[str, Any], delta: dict[str, Any]) -> None:
+        try:
+            entry["data"] = zlib.compress(json.dumps(delta).encode("utf-8"))
+        except (TypeError, ValueError):
+            # delta can't be serialized, so it is kept as is
+            entry["delta"] = delta
+            return
+
+        self.memory_use += len(entry["data"])
+
+    def _discard_delta(self, entry: dict[str, Any]) -> None:
+        if "data" in entry:
+            self.memory_use -= len(entry.pop("data"))
+        elif "location" in entry:
+            # space in the file is not reused, but it is freed when cleared
+            self.disk_use -= entry.pop("location")[1]
+        else:
+            entry.pop("delta")
+
+    def _spill_to_disk(self) -> None:
+        budget = settings.get("undo", "memory_budget_(MB)") * 2**20
+        while (
+            self.memory_use > budget
+            and self._first_in_memory_index < len(self._stack) - 1
+        ):
+            entry = self._stack[self._first_in_memory_index]
+            self._first_in_memory_index += 1
+            if "data" not in entry:
+                continue
+
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile(dir=dirs.undo_path)
+            data = entry.pop("data")
+            offset = self._spill_file.seek(0, os.SEEK_END)
+            self._spill_file.write(data)
+            entry["location"] = (offset, len(data))
+            self.memory_use -= len(data)
+            self.disk_use += len(data)
+
     def undo(self):
-        if abs(self.current_state_index) == len(self.stack) or not self.stack:
+        self.flush()
+        if abs(self.current_state_index) == len(self._stack) or not self._stack:
             return
 
-        last_state = self.stack[self.current_state_index - 1]["state"]
+        delta = self.get_delta(self._stack[self.current_state_index])
+        self._state = apply_state_delta(self._state, delta, OLD)
 
-        post(Post.APP_STATE_RESTORE, last_state)
+        post(Post.APP_STATE_RESTORE, self._state)
 
         self.current_state_index -= 1
 
         post(Post.APP_STATE_UNDO_OR_REDO_DONE)
 
     def redo(self):
+        self.flush()
         if self.current_state_index == -1:
             return
 
-        next_state = self.stack[self.current_state_index + 1]["state"]
+        delta = self.get_delta(self._stack[self.current_state_index + 1])
+        self._state = apply_state_delta(self._state, delta, NEW)
 
-        post(Post.APP_STATE_RESTORE, next_state)
+        post(Post.APP_STATE_RESTORE, self._state)
 
         self.current_state_index += 1
 
@@ -83,12 +248,198 @@ class UndoManager:
         resets self.current_state_index and self.saved_current
         """
         if self.current_state_index != -1:
-            self.stack = self.stack[: self.current_state_index + 1]
+            for entry in self._stack[self.current_state_index + 1 :]:
+                self._discard_delta(entry)
+            self._stack = self._stack[: self.current_state_index + 1]
+            self._first_in_memory_index = min(
+                self._first_in_memory_index, len(self._stack)
+            )
             self.current_state_index = -1
 
     def clear(self):
-        self.stack = []
+        self._stack = []
+        self._pending_record = None
         self.current_state_index = -1
+        self._state = None
+        self.memory_use = 0
+        self.disk_use = 0
+        self._first_in_memory_index = 0
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+def _split_state(state: dict[str, Any], key: str) -> tuple[dict[str, Any], Any]:
+    attrs = state.copy()
+    return attrs, attrs.pop(key)
+
+
+def get_state_delta(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the changes between two app states, as (old, new) pairs:
+    - "attrs": app attributes other than timelines, or None if unchanged;
+    - "timelines": for each changed timeline, a dict with:
+        - "attrs": if the timeline was created or deleted, its attributes
+        other than components, or None if it does not exist in that state.
+        None otherwise;
+        - "changed_attrs": if the timeline exists in both states, its
+        attributes that differ between them, each side holding only the
+        ones it has, or None if none differ;
+        - "components": data of each created, deleted or changed component,
+        or None if the component does not exist in that state.
+    Unchanged timelines and components are left out, and are found by
+    identity or by their hashes, so unchanged parts of the states are not
+    compared attribute by attribute.
+    If any of the states is malformed, they are both kept in full instead,
+    under "states", so the error surfaces when the state is restored.
+    """
+    if not (_is_well_formed(old) and _is_well_formed(new)):
+        return {"states": (old, new)}
+
+    old_attrs, old_timelines = _split_state(old, "timelines")
+    new_attrs, new_timelines = _split_state(new, "timelines")
+
+    timelines_delta = {}
+    for id in old_timelines.keys() | new_timelines.keys():
+        old_timeline = old_timelines.get(id)
+        new_timeline = new_timelines.get(id)
+        if old_timeline is new_timeline:
+            continue
+        timeline_delta = _get_timeline_delta(old_timeline, new_timeline)
+        if timeline_delta is not None:
+            timelines_delta[id] = timeline_delta
+
+    return {
+        "attrs": (old_attrs, new_attrs) if old_attrs != new_attrs else None,
+        "timelines": timelines_delta,
+    }
+
+
+def _is_well_formed(state: dict[str, Any]) -> bool:
+    return isinstance(state.get("timelines"), dict) and all(
+        isinstance(timeline.get("components"), dict)
+        for timeline in state["timelines"].values()
+    )
+
+
+def _get_timeline_delta(
+    old: dict[str, Any] | None, new: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    old_attrs, old_components = _split_state(old, "components") if old else (None, {})
+    new_attrs, new_components = _split_state(new, "components") if new else (None, {})
+
+    components_delta = {}
+    if not _are_components_equal(old, new):
+        for id in old_components.keys() | new_components.keys():
+            old_component = old_components.get(id)
+            new_component = new_components.get(id)
+            if old_component is new_component:
+                continue
+            if (
+                old_component is None
+                or new_component is None
+                or old_component["hash"] != new_component["hash"]
+            ):
+                components_delta[id] = (old_component, new_component)
+
+    if old is None or new is None:
+        return {
+            "attrs": (old_attrs, new_attrs),
+            "changed_attrs": None,
+            "components": components_delta,
+        }
+
+    changed_attrs = _get_changed_attrs(old_attrs, new_attrs)
+    if changed_attrs is None and not components_delta:
+        return None
+
+    return {
+        "attrs": None,
+        "changed_attrs": changed_attrs,
+        "components": components_delta,
+    }
+
+
+def _get_changed_attrs(
+    old: dict[str, Any], new: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    # Timeline attributes may be large (e.g. the svg data of score
+    # timelines), so only the ones that changed are kept.
+    changed = [
+        attr
+        for attr in old.keys() | new.keys()
+        if attr not in old or attr not in new or old[attr] != new[attr]
+    ]
+    if not changed:
+        return None
+
+    return (
+        {attr: old[attr] for attr in changed if attr in old},
+        {attr: new[attr] for attr in changed if attr in new},
+    )
+
+
+def _are_components_equal(old: dict[str, Any] | None, new: dict[str, Any] | None):
+    if old is None or new is None:
+        return False
+    if old["components"] is new["components"]:
+        return True
+    # Component hashes don't include ids, so a component that was
+    # recreated with a different id doesn't change the aggregate hash.
+    return (
+        bool(old.get("components_hash"))
+        and old["components_hash"] == new.get("components_hash")
+        and old["components"].keys() == new["components"].keys()
+    )
+
+
+def apply_state_delta(
+    state: dict[str, Any], delta: dict[str, Any], side: int
+) -> dict[str, Any]:
+    """
+    Returns the state on the given side (OLD or NEW) of `delta`, where `state`
+    is the state on the other side. `state` is not modified, and parts of it
+    that are not changed by `delta` are shared with the returned state.
+    """
+    if "states" in delta:
+        return delta["states"][side]
+
+    if delta["attrs"] is None:
+        result = state.copy()
+    else:
+        result = delta["attrs"][side].copy()
+
+    timelines = result["timelines"] = state["timelines"].copy()
+    for id, timeline_delta in delta["timelines"].items():
+        if timeline_delta["attrs"] is not None:
+            attrs = timeline_delta["attrs"][side]
+            if attrs is None:
+                timelines.pop(id, None)
+                continue
+            components = timelines[id]["components"] if id in timelines else {}
+        else:
+            attrs, components = _split_state(timelines[id], "components")
+            if timeline_delta["changed_attrs"] is not None:
+                # attributes changed on the other side are either set on
+                # this side or missing from it
+                changed_on_other_side = timeline_delta["changed_attrs"][1 - side]
+                attrs = {
+                    attr: value
+                    for attr, value in attrs.items()
+                    if attr not in changed_on_other_side
+                } | timeline_delta["changed_attrs"][side]
+
+        if timeline_delta["components"]:
+            components = components.copy()
+            for component_id, values in timeline_delta["components"].items():
+                if values[side] is None:
+                    components.pop(component_id, None)
+                else:
+                    components[component_id] = values[side]
+
+        timelines[id] = attrs | {"components": components}
+
+    return result
 
 
 class PauseUndoManager: